@@ -4,3 +4,22 @@ bind = 'unix:/run/omegabox.sock'
 accesslog = '/var/log/gunicorn/access.log'
 errorlog = '/var/log/gunicorn/error.log'
 capture_output = True
+# 좌석 변경 스트림(SSE)은 연결마다 스레드 1개를 점유 - worker별 최대 SEAT_EVENT_MAX_STREAMS개, 나머지 스레드는 일반 API 요청용
+worker_class = 'gthread'
+threads = 32
+
+
+def post_worker_init(worker):
+    # 가까운 상영관 검색 인덱스를 첫 요청 전에 미리 생성 (실패하면 첫 요청에서 생성)
+    try:
+        from theaters.geo import get_theater_index
+        get_theater_index()
+    except Exception:
+        worker.log.exception('theater index warm-up failed')
+
+    # 영화 자동완성 인덱스
+    try:
+        from movies.autocomplete import get_autocomplete_index
+        get_autocomplete_index()
+    except Exception:
+        worker.log.exception('autocomplete index warm-up failed')
@@ -20,6 +20,10 @@ app.conf.beat_schedule = {
         "task": "reservations.tasks.save_point_for_played_movie",
         "schedule": crontab(minute="*"),
     },
+    "update_age_booking_histogram_task": {
+        "task": "movies.tasks.update_age_booking_histogram",
+        "schedule": crontab(minute="*"),
+    },
 }
 app.autodiscover_tasks()
 
@@ -80,6 +80,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django.contrib.postgres',
 
     # 3rd-party packages
     'corsheaders',
@@ -241,5 +242,57 @@ SWAGGER_SETTINGS = {
 BOOT_PAY_REST_APP_ID = SECRETS['BOOT_PAY_REST_APP_ID']
 BOOT_PAY_PRIVATE_KEY = SECRETS['BOOT_PAY_PRIVATE_KEY']
 
+# Seat storage
+# 'seat_type': 스케쥴 좌석마다 SeatType row 생성
+# 'seat_map': 스케쥴마다 ScheduleSeatMap 1 row (좌석당 1 byte)
+SEAT_STORAGE_MODE = 'seat_type'
+
+# Seat hold (예매 전 좌석 선점)
+SEAT_HOLD_BACKEND = 'reservations.holds.RedisSeatHold'
+SEAT_HOLD_REDIS_URL = 'redis://redis:6379/1'
+# 미결제 예매 자동 삭제(10분)와 동일
+SEAT_HOLD_TTL = 60 * 10
+
+# Seat events (스케쥴별 좌석 변경 스트림)
+SEAT_EVENT_BACKEND = 'theaters.seat_events.RedisSeatEventBroker'
+SEAT_EVENT_REDIS_URL = 'redis://redis:6379/2'
+# 초 단위 - keep-alive 주기 / 스트림 1회 최대 연결 시간
+SEAT_EVENT_HEARTBEAT = 15
+SEAT_EVENT_STREAM_TIMEOUT = 60 * 5
+SEAT_EVENT_RETRY_MS = 1000
+# 프로세스(gunicorn worker)별 동시 스트림 수 - 초과하면 503, 나머지 스레드는 일반 API 요청용
+SEAT_EVENT_MAX_STREAMS = 8
+
+# Movie search
+# None: PostgreSQL이면 'movies.search.TrigramSearchEngine', 그 외 'movies.search.NgramSearchEngine'
+MOVIE_SEARCH_BACKEND = None
+# 검색 결과 최대 영화 수
+MOVIE_SEARCH_LIMIT = 200
+
+# Age booking (영화 상세 나이대별 예매 수)
+# (이름, 최소 나이, 최대 나이) - 예매 시점 만 나이가 [최소, 최대)인 회원 예매 수, 변경 후 rebuild_age_booking 실행
+AGE_BOOKING_BANDS = [
+    ('teens', 10, 20),
+    ('twenties', 20, 30),
+    ('thirties', 30, 40),
+    ('fourties', 40, 50),
+    ('fifties', 50, 60),
+]
+# 초 단위 - 결제 후 이 시간이 지나야 반영 (늦게 커밋된 결제가 high-water mark 아래로 빠지지 않도록)
+AGE_BOOKING_PAYMENT_LAG = 60
+
+# Cache
+CACHES = {
+    'default': {
+        'BACKEND': 'utils.redis_cache.RedisCache',
+        'LOCATION': 'redis://redis:6379/3',
+    }
+}
+# 초 단위 - 날짜별 상영 정보 / 스케쥴 좌석 수
+SHOWTIME_CACHE_TTL = 60 * 60
+SEAT_COUNT_CACHE_TTL = 10
+# 좌석 배치도 응답 Cache-Control max-age (ETag로 재검증)
+SEAT_LAYOUT_MAX_AGE = 60 * 60 * 24
+
 # Celery
 CELERY_BROKER_URL = 'redis://redis:6379/0'
@@ -18,6 +18,14 @@ ALLOWED_HOSTS += [
     'localhost',
 ]
 
+SEAT_HOLD_BACKEND = 'reservations.holds.InMemorySeatHold'
+SEAT_EVENT_BACKEND = 'theaters.seat_events.InMemorySeatEventBroker'
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 DEBUG_TOOLBAR_CONFIG = {
     "SHOW_TOOLBAR_CALLBACK": lambda request: True,
 }
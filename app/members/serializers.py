@@ -14,7 +14,7 @@ from rest_framework_simplejwt.serializers import TokenRefreshSerializer as Defau
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from movies.models import Movie, Rating, MovieLike
-from movies.serializers import MovieTimelineSerializer
+from movies.serializers import MovieTimelineSerializer, get_acc_favorite
 from reservations.models import Reservation
 from utils.custom_functions import reformat_duration, check_google_oauth_api
 from .exceptions import (
@@ -245,9 +245,7 @@ class LikeMoviesSerializer(serializers.ModelSerializer):
         ]
 
     def get_acc_favorite(self, movielike):
-        likes_count = movielike.movie.movie_likes.filter(liked=True).count()
-        result = likes_count + 689 - (movielike.movie.pk * 24)
-        return result if result >= 0 else likes_count + 11
+        return get_acc_favorite(movielike.movie)
 
     def get_running_time(self, movielike):
         return reformat_duration(movielike.movie.running_time)
@@ -303,9 +301,7 @@ class WatchedMoviesSerializer(serializers.ModelSerializer):
         return reservation.seats.values_list('name', flat=True)
 
     def get_acc_favorite(self, reservation):
-        likes_count = reservation.schedule.movie.movie_likes.filter(liked=True).count()
-        result = likes_count + 689 - (reservation.schedule.movie.pk * 24)
-        return result if result >= 0 else likes_count + 11
+        return get_acc_favorite(reservation.schedule.movie)
 
     def get_running_time(self, obj):
         return reformat_duration(obj.schedule.movie.running_time)
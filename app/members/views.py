@@ -2,6 +2,7 @@ import datetime
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Prefetch
 from django.utils.decorators import method_decorator
 from drf_yasg.utils import swagger_auto_schema
 from rest_auth.registration.views import RegisterView
@@ -19,7 +20,7 @@ from rest_framework_simplejwt.views import (
 )
 
 from members.exceptions import UsernameDuplicateException
-from movies.models import Rating, MovieLike
+from movies.models import Movie, Rating, MovieLike
 from reservations.models import Reservation
 from .serializers import (
     SignUpSerializer, MemberDetailSerializer, LoginSerializer, TokenRefreshSerializer,
@@ -132,7 +133,9 @@ class LikeMoviesView(ListAPIView):
 
     def get_queryset(self):
         return MovieLike.objects.select_related(
-            'movie', 'member'
+            'member'
+        ).prefetch_related(
+            Prefetch('movie', queryset=Movie.objects.with_stats())
         ).filter(
             member=self.request.user,
             liked=True
@@ -149,7 +152,9 @@ class WatchedMoviesView(ListAPIView):
 
     def get_queryset(self):
         return Reservation.objects.select_related(
-            'payment', 'schedule__screen__theater__region', 'schedule__movie'
+            'payment', 'schedule__screen__theater__region'
+        ).prefetch_related(
+            Prefetch('schedule__movie', queryset=Movie.objects.with_stats())
         ).filter(
             schedule__start_time__lte=datetime.datetime.today(),
             member=self.request.user,
@@ -0,0 +1,132 @@
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+
+from reservations.models import Reservation, Payment
+from utils.etags import bump_model_versions
+from .models import Movie, MovieAgeBooking, AgeBookingProgress
+
+# 나이대별 예매 수 - 결제 ID를 high-water mark로 사용해 마지막으로 반영한 결제 이후의 결제 완료 예매만 더함
+# 결제 직후 커밋이 늦은 결제가 mark 아래로 빠지지 않도록 AGE_BOOKING_PAYMENT_LAG초가 지난 결제만 반영
+
+
+def get_age(birth_date, on_date):
+    # 만 나이
+    return on_date.year - birth_date.year - ((on_date.month, on_date.day) < (birth_date.month, birth_date.day))
+
+
+def get_age_band(birth_date, on_date):
+    age = get_age(birth_date, on_date)
+    for name, min_age, max_age in settings.AGE_BOOKING_BANDS:
+        if min_age <= age < max_age:
+            return name
+    return None
+
+
+def count_age_bands(rows):
+    # rows: [(movie_id, 생년월일, 예매 시각), ...] -> {movie_id: Counter({나이대: 예매 수})}
+    counts = defaultdict(Counter)
+    for movie_id, birth_date, reserved_at in rows:
+        band = get_age_band(birth_date, reserved_at)
+        if band is not None:
+            counts[movie_id][band] += 1
+    return counts
+
+
+def paid_reservations():
+    return Reservation.objects.filter(
+        member__isnull=False,
+        payment__isnull=False,
+        payment__is_canceled=False,
+    )
+
+
+def lock_progress():
+    progress, _ = AgeBookingProgress.objects.select_for_update().get_or_create(pk=1)
+    return progress
+
+
+def apply_age_band_counts(counts, sign=1, replace=False):
+    # 트랜잭션 안에서 호출 - replace면 기존 값을 버리고 counts로 교체
+    rows = {row.movie_id: row for row in MovieAgeBooking.objects.select_for_update().filter(movie_id__in=counts)}
+    created, updated = [], []
+    for movie_id, movie_counts in counts.items():
+        row = rows.get(movie_id)
+        if row is None:
+            row = MovieAgeBooking(movie_id=movie_id)
+            created.append(row)
+        else:
+            updated.append(row)
+        merged = Counter() if replace else Counter(row.get_counts())
+        for band, count in movie_counts.items():
+            merged[band] += count * sign
+        row.set_counts(dict(merged))
+
+    MovieAgeBooking.objects.bulk_create(created)
+    MovieAgeBooking.objects.bulk_update(updated, ['counts'])
+    bump_model_versions(MovieAgeBooking)
+
+
+def update_age_booking(batch_size=1000):
+    # 마지막으로 반영한 결제 이후의 결제 완료 예매를 최대 batch_size개 반영 - 반영한 예매 수
+    cutoff = datetime.now() - timedelta(seconds=settings.AGE_BOOKING_PAYMENT_LAG)
+    with transaction.atomic():
+        progress = lock_progress()
+        rows = list(paid_reservations().filter(
+            payment_id__gt=progress.last_payment_id,
+            payment__payed_at__lte=cutoff,
+        ).order_by('payment_id').values_list(
+            'payment_id', 'schedule__movie_id', 'member__birth_date', 'reserved_at'
+        )[:batch_size])
+        if not rows:
+            return 0
+
+        apply_age_band_counts(count_age_bands(row[1:] for row in rows))
+        progress.last_payment_id = rows[-1][0]
+        progress.save()
+    return len(rows)
+
+
+def remove_reservation(reservation):
+    # 예매 삭제 트랜잭션 안에서 호출 - 이미 반영된 결제의 예매만 차감
+    if reservation.payment_id is None or reservation.member_id is None:
+        return
+    progress = AgeBookingProgress.objects.select_for_update().filter(pk=1).first()
+    if progress is None or reservation.payment_id > progress.last_payment_id:
+        return
+    row = Reservation.objects.filter(pk=reservation.pk, payment__is_canceled=False).values_list(
+        'schedule__movie_id', 'member__birth_date', 'reserved_at'
+    ).first()
+    if row is not None:
+        apply_age_band_counts(count_age_bands([row]), sign=-1)
+
+
+def rebuild_age_booking():
+    # 전체 재계산 - 나이대 설정을 바꾼 경우 실행 / 반영한 예매 수
+    cutoff = datetime.now() - timedelta(seconds=settings.AGE_BOOKING_PAYMENT_LAG)
+    with transaction.atomic():
+        progress = lock_progress()
+        last_payment_id = Payment.objects.filter(payed_at__lte=cutoff).aggregate(Max('id'))['id__max'] or 0
+        counts = count_age_bands(paid_reservations().filter(payment_id__lte=last_payment_id).values_list(
+            'schedule__movie_id', 'member__birth_date', 'reserved_at'
+        ).iterator())
+
+        MovieAgeBooking.objects.exclude(movie_id__in=counts).update(counts='{}')
+        apply_age_band_counts(counts, replace=True)
+        progress.last_payment_id = last_payment_id
+        progress.save()
+    return sum(sum(movie_counts.values()) for movie_counts in counts.values())
+
+
+def get_age_booking(movie_id):
+    # {나이대: 예매 수} (설정 순서) - 영화가 없으면 None
+    counts = MovieAgeBooking.objects.filter(movie_id=movie_id).values_list('counts', flat=True).first()
+    if counts is None:
+        if not Movie.objects.filter(pk=movie_id).exists():
+            return None
+        counts = '{}'
+    counts = MovieAgeBooking(counts=counts).get_counts()
+    return {name: counts.get(name, 0) for name, _, _ in settings.AGE_BOOKING_BANDS}
@@ -0,0 +1,232 @@
+import heapq
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+
+from utils.cache_versions import get_versions, bump_version
+from .search import normalize, NON_WORD_PATTERN
+
+# 자동완성 - 영화 제목(name_kor), 감독, 배우 이름을 자모 분해 키/초성 키로 정렬된 배열에 저장하고 bisect로 접두어 검색
+# 'ㅂㅅㄹ'처럼 초성만 입력하면 초성 키, 그 외('어벤ㅈ' 등 입력 중인 글자 포함)는 자모 키와 비교
+# 변경 시 버전을 올리고 변경된 (kind, id)를 버전별로 공유 캐시에 기록 - 각 프로세스는 바뀐 객체만 다시 조회해 반영
+
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSUNG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSUNG = ' ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'
+# 입력 중 '달' -> '닭', '오' -> '와'처럼 늘어나므로 겹자모는 나눠서 저장
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+CHOSUNG_SET = frozenset(CHOSUNG)
+HANGUL_FIRST, HANGUL_LAST = ord('가'), ord('힣')
+
+# 같은 접두어면 영화 > 감독 > 배우 순
+KIND_ORDER = {'movie': 0, 'director': 1, 'actor': 2}
+
+# 이 길이 이하 접두어는 일치하는 항목이 많으므로 결과를 인덱스에 보관 - 임의 입력으로 커지지 않도록 최근 MEMO_SIZE개만 (LRU)
+MEMO_PREFIX_LENGTH = 3
+MEMO_SIZE = 1024
+CHANGE_LOG_SIZE = 100
+CHANGE_LOG_TTL = 60 * 60 * 24
+VERSION_NAME = 'movie-autocomplete'
+
+
+def decompose(text):
+    jamo = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            code -= HANGUL_FIRST
+            jamo.append(CHOSUNG[code // 588])
+            jamo.append(COMPOUND_JAMO.get(JUNGSUNG[code // 28 % 21], JUNGSUNG[code // 28 % 21]))
+            if code % 28:
+                jamo.append(COMPOUND_JAMO.get(JONGSUNG[code % 28], JONGSUNG[code % 28]))
+        else:
+            jamo.append(COMPOUND_JAMO.get(char, char))
+    return ''.join(jamo)
+
+
+def chosung(text):
+    return ''.join(
+        CHOSUNG[(ord(char) - HANGUL_FIRST) // 588] if HANGUL_FIRST <= ord(char) <= HANGUL_LAST else char
+        for char in text
+    )
+
+
+def name_keys(name):
+    # 이름 전체(0)와 두 번째 단어부터 시작하는 부분(1) - '어벤져스: 엔드게임'은 '엔드게임'으로도 검색
+    words = [word for word in NON_WORD_PATTERN.split(name.lower()) if word]
+    for start in range(len(words)):
+        text = ''.join(words[start:])
+        yield 'j' + decompose(text), min(start, 1)
+        yield 'c' + chosung(text), min(start, 1)
+
+
+def query_key(query):
+    text = normalize(query)
+    if not text:
+        return None
+    if all(char in CHOSUNG_SET for char in text):
+        return 'c' + text
+    return 'j' + decompose(text)
+
+
+def object_entries(kind, object_id, name, popularity):
+    # (key, 정렬 순서, kind, id) - 정렬 순서: (이름 중간부터 일치 여부, kind 순서, popularity, 이름)
+    return [
+        (key, (position, KIND_ORDER[kind], popularity, name), kind, object_id)
+        for key, position in name_keys(name)
+    ]
+
+
+class AutocompleteIndex:
+    # 만든 뒤에는 바꾸지 않음 - 변경 반영은 updated()로 새 인덱스를 만듦
+    def __init__(self, objects, entries=None):
+        # objects: {(kind, id): (name, popularity)} - popularity가 작을수록 먼저
+        self.objects = objects
+        if entries is None:
+            entries = [
+                entry
+                for (kind, object_id), (name, popularity) in objects.items()
+                for entry in object_entries(kind, object_id, name, popularity)
+            ]
+            entries.sort()
+        self.entries = entries
+        self.memo = OrderedDict()
+        self.memo_lock = threading.Lock()
+
+    def updated(self, changed):
+        # changed: {(kind, id): (name, popularity) 또는 삭제된 경우 None} - 바뀐 객체의 key만 다시 만듦
+        objects = dict(self.objects)
+        entries = [entry for entry in self.entries if (entry[2], entry[3]) not in changed]
+        for (kind, object_id), value in changed.items():
+            if value is None:
+                objects.pop((kind, object_id), None)
+            else:
+                objects[(kind, object_id)] = value
+                entries.extend(object_entries(kind, object_id, *value))
+        # 대부분 정렬된 상태라 sort는 거의 선형
+        entries.sort()
+        return AutocompleteIndex(objects, entries)
+
+    def search(self, query, k):
+        key = query_key(query)
+        if key is None:
+            return []
+        memo_key = (key, k)
+        with self.memo_lock:
+            if memo_key in self.memo:
+                self.memo.move_to_end(memo_key)
+                return self.memo[memo_key]
+
+        low = bisect_left(self.entries, (key,))
+        high = bisect_left(self.entries, (key + '\uffff',))
+        best = {}
+        for _, order, kind, object_id in self.entries[low:high]:
+            object_key = (kind, object_id)
+            if object_key not in best or order < best[object_key]:
+                best[object_key] = order
+        result = [
+            {'type': kind, 'id': object_id, 'name': order[3]}
+            for (kind, object_id), order in heapq.nsmallest(k, best.items(), key=lambda item: item[1])
+        ]
+        if len(key) <= MEMO_PREFIX_LENGTH + 1:
+            with self.memo_lock:
+                self.memo[memo_key] = result
+                if len(self.memo) > MEMO_SIZE:
+                    self.memo.popitem(last=False)
+        return result
+
+
+def load_objects(kind_ids=None):
+    # kind_ids: {kind: id 목록} - None이면 전체
+    from .models import Movie, Director, Actor
+
+    querysets = {
+        'movie': Movie.objects.order_by().values_list('id', 'name_kor', 'rank'),
+        'director': Director.objects.order_by().annotate(
+            popularity=-Count('movies')
+        ).values_list('id', 'name', 'popularity'),
+        'actor': Actor.objects.order_by().annotate(
+            popularity=-Count('movies')
+        ).values_list('id', 'name', 'popularity'),
+    }
+    objects = {}
+    for kind, queryset in querysets.items():
+        if kind_ids is not None:
+            if not kind_ids.get(kind):
+                continue
+            queryset = queryset.filter(pk__in=kind_ids[kind])
+        for object_id, name, popularity in queryset:
+            objects[(kind, object_id)] = (name, popularity)
+    return objects
+
+
+def change_key(version):
+    return f'{VERSION_NAME}:changes:{version}'
+
+
+class LocalAutocompleteIndex:
+    def __init__(self):
+        self._current = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        version, = get_versions(VERSION_NAME)
+        current = self._current
+        if current is None or current[0] != version:
+            with self._lock:
+                current = self._current
+                if current is None or current[0] != version:
+                    index = self.catch_up(current, version)
+                    current = self._current = (version, index or AutocompleteIndex(load_objects()))
+        return current[1]
+
+    def catch_up(self, current, version):
+        # 이전 버전 이후의 변경 기록이 모두 남아 있으면 바뀐 객체만 다시 조회 - 아니면 None (전체 재생성)
+        if current is None or not 0 < version - current[0] <= CHANGE_LOG_SIZE:
+            return None
+        keys = [change_key(changed_version) for changed_version in range(current[0] + 1, version + 1)]
+        changes = cache.get_many(keys)
+        if len(changes) != len(keys):
+            return None
+
+        kind_ids = {}
+        for change in changes.values():
+            for kind, object_id in change:
+                kind_ids.setdefault(kind, set()).add(object_id)
+        loaded = load_objects(kind_ids)
+        return current[1].updated({
+            (kind, object_id): loaded.get((kind, object_id))
+            for kind, object_ids in kind_ids.items() for object_id in object_ids
+        })
+
+
+_autocomplete_index = LocalAutocompleteIndex()
+
+
+def get_autocomplete_index():
+    return _autocomplete_index.get()
+
+
+def record_change(kind, object_ids):
+    # object_ids가 None이면 변경 기록 없이 버전만 올려 전체 재생성
+    # 커밋 후 기록 - 커밋 전에 버전을 올리면 다른 프로세스가 아직 보이지 않는 객체를 삭제된 것으로 반영함
+    changes = None if object_ids is None else [(kind, object_id) for object_id in object_ids]
+
+    def record():
+        version, = bump_version(VERSION_NAME)
+        if version is not None and changes is not None:
+            cache.set(change_key(version), changes, CHANGE_LOG_TTL)
+
+    transaction.on_commit(record)
+
+
+def autocomplete(query, k):
+    return get_autocomplete_index().search(query, k)
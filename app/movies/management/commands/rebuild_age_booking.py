@@ -0,0 +1,11 @@
+from django.core.management import BaseCommand
+
+from movies.age_booking import rebuild_age_booking
+
+
+class Command(BaseCommand):
+    help = '나이대별 예매 수(MovieAgeBooking)를 결제 완료 예매 기준으로 전체 재계산 - AGE_BOOKING_BANDS 변경 후 실행'
+
+    def handle(self, *args, **options):
+        counted = rebuild_age_booking()
+        self.stdout.write(f'예매 {counted}건 재계산 완료')
@@ -0,0 +1,26 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from movies.models import Movie
+from movies.stats import rebuild_movie_stats
+
+
+class Command(BaseCommand):
+    help = 'MovieStats 카운터(평점 합계/수, key_point별 한줄평 수, 좋아요 수)를 Rating, MovieLike 기준으로 일괄 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='한 트랜잭션에서 재계산할 영화 수')
+        parser.add_argument('movie_ids', nargs='*', type=int, help='재계산할 영화 ID (생략 시 전체)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if options['movie_ids']:
+            movie_ids = options['movie_ids']
+        else:
+            movie_ids = list(Movie.objects.order_by('id').values_list('id', flat=True))
+
+        rebuilt = 0
+        for start in range(0, len(movie_ids), batch_size):
+            with transaction.atomic():
+                rebuilt += len(rebuild_movie_stats(movie_ids[start:start + batch_size]))
+            self.stdout.write(f'{rebuilt}/{len(movie_ids)} 영화 재계산 완료')
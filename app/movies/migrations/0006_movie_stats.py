@@ -0,0 +1,55 @@
+# Generated by Django 2.2.14 on 2026-10-17 11:51
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+KEY_POINTS = ['actor', 'prod', 'story', 'visual', 'ost']
+
+
+def fill_movie_stats(apps, schema_editor):
+    Movie = apps.get_model('movies', 'Movie')
+    MovieStats = apps.get_model('movies', 'MovieStats')
+    movies = Movie.objects.order_by().annotate(
+        rating_sum=Coalesce(Sum('ratings__score'), 0),
+        rating_count=Count('ratings'),
+        **{
+            f'{key_point}_count': Count('ratings', filter=Q(ratings__key_point=key_point))
+            for key_point in KEY_POINTS
+        }
+    )
+    MovieStats.objects.bulk_create([
+        MovieStats(
+            movie_id=movie.id,
+            rating_sum=movie.rating_sum,
+            rating_count=movie.rating_count,
+            **{f'{key_point}_count': getattr(movie, f'{key_point}_count') for key_point in KEY_POINTS}
+        )
+        for movie in movies
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_auto_20200711_0207'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovieStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('rating_count', models.PositiveIntegerField(default=0)),
+                ('actor_count', models.PositiveIntegerField(default=0)),
+                ('prod_count', models.PositiveIntegerField(default=0)),
+                ('story_count', models.PositiveIntegerField(default=0)),
+                ('visual_count', models.PositiveIntegerField(default=0)),
+                ('ost_count', models.PositiveIntegerField(default=0)),
+                ('movie', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='movies.Movie')),
+            ],
+        ),
+        migrations.RunPython(fill_movie_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 2.2.14 on 2026-10-17 12:40
+
+from django.db import migrations
+
+# movies.search.TrigramSearchEngine 검색 대상 컬럼 - PostgreSQL에서만 생성 (pg_trgm)
+TRIGRAM_INDEXES = [
+    ('movies_movie_name_kor_trgm', 'movies_movie', 'name_kor'),
+    ('movies_movie_name_eng_trgm', 'movies_movie', 'name_eng'),
+    ('movies_director_name_trgm', 'movies_director', 'name'),
+    ('movies_actor_name_trgm', 'movies_actor', 'name'),
+    ('movies_genre_name_trgm', 'movies_genre', 'name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    quote_name = schema_editor.quote_name
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {quote_name(name)} '
+            f'ON {quote_name(table)} USING gin ({quote_name(column)} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0006_movie_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
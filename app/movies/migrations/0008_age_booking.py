@@ -0,0 +1,30 @@
+# Generated by Django 2.2.14 on 2026-10-17 11:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgeBookingProgress',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_payment_id', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MovieAgeBooking',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('counts', models.TextField(default='{}')),
+                ('movie', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='age_booking', to='movies.Movie')),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.14 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0008_age_booking'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(fields=['movie', 'created_at', 'id'], name='movies_rati_movie_i_3155d7_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 2.2.14 on 2026-10-17 12:03
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def remove_duplicate_likes(apps, schema_editor):
+    # (movie, member)별로 마지막(id가 가장 큰) 좋아요만 남김
+    MovieLike = apps.get_model('movies', 'MovieLike')
+    duplicates = MovieLike.objects.values('movie', 'member').annotate(
+        count=Count('id'), last_id=Max('id'),
+    ).filter(count__gt=1)
+    for duplicate in duplicates:
+        MovieLike.objects.filter(
+            movie_id=duplicate['movie'], member_id=duplicate['member'],
+        ).exclude(id=duplicate['last_id']).delete()
+
+
+def fill_like_counts(apps, schema_editor):
+    MovieLike = apps.get_model('movies', 'MovieLike')
+    MovieStats = apps.get_model('movies', 'MovieStats')
+    like_counts = MovieLike.objects.filter(liked=True).order_by().values('movie').annotate(count=Count('id'))
+    for like_count in like_counts:
+        MovieStats.objects.filter(movie_id=like_count['movie']).update(like_count=like_count['count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0009_rating_created_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_likes, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='moviestats',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddConstraint(
+            model_name='movielike',
+            constraint=models.UniqueConstraint(fields=('movie', 'member'), name='unique_movie_like'),
+        ),
+        migrations.RunPython(fill_like_counts, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,20 @@
-from django.db import models
+import json
+
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete, pre_save, pre_delete, m2m_changed
+from django.dispatch import receiver
 
 from config.settings._base import AUTH_USER_MODEL
 from theaters.models import Schedule
+from utils.etags import track_changes
+from .autocomplete import record_change
+from .search import invalidate_search_index
+
+
+class MovieQuerySet(models.QuerySet):
+    def with_stats(self):
+        # 평점 통계, 좋아요 수 모두 MovieStats 카운터 row - 목록 크기와 무관하게 쿼리 1번
+        return self.select_related('stats')
 
 
 class Movie(models.Model):
@@ -60,6 +73,8 @@ class Movie(models.Model):
     poster = models.ImageField(upload_to='posters/', blank=True)
     trailer = models.FileField(upload_to='trailers/', blank=True)
 
+    objects = MovieQuerySet.as_manager()
+
     class Meta:
         ordering = ['rank']
 
@@ -98,6 +113,91 @@ class Rating(models.Model):
     # 한줄평 수정 불가능
     created_at = models.DateField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 영화별 한줄평 최신순 keyset pagination (created_at, id)
+            models.Index(fields=['movie', 'created_at', 'id']),
+        ]
+
+
+class MovieStats(models.Model):
+    # 평점 통계, 좋아요 수 카운터 - 한줄평 생성/삭제, 좋아요 토글 시 같은 트랜잭션에서 F()로 갱신 (movies.stats)
+    # 어긋난 경우 rebuild_movie_stats 커맨드로 재계산
+    movie = models.OneToOneField(
+        'Movie',
+        on_delete=models.CASCADE,
+        related_name='stats',
+    )
+    rating_sum = models.IntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    # Rating.KEY_POINT_CHOICES별 한줄평 수
+    actor_count = models.PositiveIntegerField(default=0)
+    prod_count = models.PositiveIntegerField(default=0)
+    story_count = models.PositiveIntegerField(default=0)
+    visual_count = models.PositiveIntegerField(default=0)
+    ost_count = models.PositiveIntegerField(default=0)
+    # liked=True인 MovieLike 수
+    like_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.movie} {self.rating_sum}/{self.rating_count}'
+
+
+class MovieAgeBooking(models.Model):
+    # 나이대별(settings.AGE_BOOKING_BANDS) 회원 예매 수 - {나이대 이름: 예매 수} JSON
+    # celery task가 결제 완료된 예매를 결제 ID 순으로 반영 (movies.age_booking), 재계산은 rebuild_age_booking 커맨드
+    movie = models.OneToOneField(
+        'Movie',
+        on_delete=models.CASCADE,
+        related_name='age_booking',
+    )
+    counts = models.TextField(default='{}')
+
+    def __str__(self):
+        return f'{self.movie} {self.counts}'
+
+    def get_counts(self):
+        return json.loads(self.counts)
+
+    def set_counts(self, counts):
+        self.counts = json.dumps(counts, sort_keys=True)
+
+
+class AgeBookingProgress(models.Model):
+    # 나이대별 예매 수에 반영한 마지막 결제 ID (high-water mark, 1 row)
+    last_payment_id = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.last_payment_id} ({self.updated_at})'
+
+
+@receiver(post_save, sender=Movie)
+def create_movie_stats(sender, instance, created, **kwargs):
+    if created:
+        MovieStats.objects.create(movie=instance)
+
+
+@receiver(post_save, sender=Rating)
+def add_rating_stats(sender, instance, created, **kwargs):
+    # 생성 경로(API, admin, shell)와 관계없이 삭제 시 차감과 짝을 맞춤
+    if created:
+        from .stats import add_rating
+        add_rating(instance)
+
+
+@receiver(post_delete, sender=Rating)
+def remove_rating_stats(sender, instance, **kwargs):
+    from .stats import remove_rating
+    remove_rating(instance)
+
+
+@receiver(pre_delete, sender='reservations.Reservation')
+def remove_age_booking(sender, instance, **kwargs):
+    # 결제 취소 등으로 이미 반영된 예매가 삭제되면 같은 트랜잭션에서 차감
+    from .age_booking import remove_reservation
+    remove_reservation(instance)
+
 
 class MovieLike(models.Model):
     movie = models.ForeignKey(
@@ -115,10 +215,44 @@ class MovieLike(models.Model):
     # liked save 될때마다 갱신
     liked_at = models.DateField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            # 좋아요 토글은 이 제약 조건 기준 upsert (movies.stats.toggle_movie_like)
+            models.UniqueConstraint(fields=['movie', 'member'], name='unique_movie_like'),
+        ]
+
     def __str__(self):
         return f'{self.movie}, {self.member.name}'
 
 
+# 좋아요 수 카운터 - 토글(movies.stats.toggle_movie_like)은 raw upsert라 signal 없이 직접 갱신
+# admin/shell에서의 생성, 수정, 삭제와 회원/영화 삭제 cascade는 signal로 반영
+@receiver(pre_save, sender=MovieLike)
+def remember_movie_like(sender, instance, **kwargs):
+    instance._previous_like = None
+    if instance.pk is not None:
+        instance._previous_like = MovieLike.objects.filter(pk=instance.pk).values_list('movie_id', 'liked').first()
+
+
+@receiver(post_save, sender=MovieLike)
+def update_movie_like_count(sender, instance, **kwargs):
+    from .stats import update_like_count
+    previous = getattr(instance, '_previous_like', None)
+    if previous == (instance.movie_id, instance.liked):
+        return
+    if previous is not None and previous[1]:
+        update_like_count(previous[0], -1)
+    if instance.liked:
+        update_like_count(instance.movie_id, 1)
+
+
+@receiver(post_delete, sender=MovieLike)
+def remove_movie_like_count(sender, instance, **kwargs):
+    if instance.liked:
+        from .stats import update_like_count
+        update_like_count(instance.movie_id, -1)
+
+
 class NameObject(models.Model):
     name = models.CharField(max_length=30)
 
@@ -139,3 +273,61 @@ class Director(NameObject):
 
 class Actor(NameObject):
     pass
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Movie)
+@receiver(post_save, sender=Director)
+@receiver(post_delete, sender=Director)
+@receiver(post_save, sender=Actor)
+@receiver(post_delete, sender=Actor)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def invalidate_movie_search(sender, **kwargs):
+    # 커밋 후 무효화 - 커밋 전에 버전을 올리면 다른 프로세스가 커밋 전 데이터로 인덱스를 다시 만들어 보관함
+    transaction.on_commit(invalidate_search_index)
+
+
+def movie_people_changed(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        transaction.on_commit(invalidate_search_index)
+
+
+m2m_changed.connect(movie_people_changed, sender=Movie.directors.through)
+m2m_changed.connect(movie_people_changed, sender=Movie.actors.through)
+m2m_changed.connect(movie_people_changed, sender=Movie.genres.through)
+
+
+AUTOCOMPLETE_KINDS = {Movie: 'movie', Director: 'director', Actor: 'actor'}
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Movie)
+@receiver(post_save, sender=Director)
+@receiver(post_delete, sender=Director)
+@receiver(post_save, sender=Actor)
+@receiver(post_delete, sender=Actor)
+def update_autocomplete(sender, instance, **kwargs):
+    record_change(AUTOCOMPLETE_KINDS[sender], [instance.pk])
+
+
+def movie_people_count_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    # 감독/배우의 영화 수(자동완성 순서)가 바뀜 - clear는 대상 id를 알 수 없으므로 전체 재생성
+    if action in ('post_add', 'post_remove'):
+        if reverse:
+            record_change(AUTOCOMPLETE_KINDS[type(instance)], [instance.pk])
+        else:
+            record_change(AUTOCOMPLETE_KINDS[model], pk_set)
+    elif action == 'post_clear':
+        record_change(None, None)
+
+
+m2m_changed.connect(movie_people_count_changed, sender=Movie.directors.through)
+m2m_changed.connect(movie_people_count_changed, sender=Movie.actors.through)
+
+
+# 영화 목록/상세/한줄평/나이대별 예매 수 ETag - MovieStats, MovieAgeBooking의 update/bulk 갱신은 직접 카운터를 올림
+track_changes(
+    Movie, MovieStats, Rating, MovieLike, MovieAgeBooking, Director, Actor, Genre,
+    Movie.directors.through, Movie.actors.through, Movie.genres.through,
+)
@@ -0,0 +1,20 @@
+from drf_yasg import openapi
+
+autocomplete_query_param = openapi.Parameter(
+    'q',
+    openapi.IN_QUERY,
+    description='검색어 - 초성만 입력 가능 (예시: ㅂㅅㄹ), 입력 중인 글자 포함 가능 (예시: 어벤ㅈ)',
+    type=openapi.TYPE_STRING
+)
+suggestion_count_query_param = openapi.Parameter(
+    'k',
+    openapi.IN_QUERY,
+    description='조회할 자동완성 수 (1 ~ 20, 기본: 10)',
+    type=openapi.TYPE_INTEGER
+)
+cursor_query_param = openapi.Parameter(
+    'cursor',
+    openapi.IN_QUERY,
+    description='다음 페이지 cursor (응답의 next URL에 포함)',
+    type=openapi.TYPE_STRING
+)
@@ -0,0 +1,206 @@
+import re
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connection, models
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from utils.cache_versions import LocalVersionedValue
+
+# 영화 검색 - 제목(한글/영문), 배우, 감독, 장르를 대상으로 순위를 매겨 영화 ID 목록 반환
+# MOVIE_SEARCH_BACKEND가 None이면 PostgreSQL은 pg_trgm, 그 외 DB는 프로세스 n-gram 역색인 사용
+
+# 검색 대상별 가중치 - 같은 유사도면 제목 > 감독 > 배우 > 장르 순
+FIELD_WEIGHTS = {
+    'name_kor': 1.0,
+    'name_eng': 1.0,
+    'directors': 0.8,
+    'actors': 0.7,
+    'genres': 0.5,
+}
+
+NON_WORD_PATTERN = re.compile(r'[\W_]+')
+
+
+def normalize(text):
+    # 소문자, 공백/기호 제거 - '어벤져스: 엔드게임' -> '어벤져스엔드게임'
+    return NON_WORD_PATTERN.sub('', text.lower())
+
+
+def ngrams(text, n=2):
+    # 한글은 1글자가 1음절이라 bigram 단위로 색인 (1글자면 unigram)
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class NgramSearchEngine:
+    # 프로세스별 bigram 역색인 - 영화/배우/감독/장르 변경 시 버전을 올려 모든 프로세스가 다시 만듦
+    # 유사도: Dice 계수 (2 * 공통 bigram 수 / (검색어 bigram 수 + 대상 bigram 수)), 부분 문자열이면 +1
+    min_similarity = 0.3
+
+    def __init__(self):
+        self.index = LocalVersionedValue('movie-search-index', self.build)
+
+    def build(self):
+        from .models import Movie
+
+        entries = {}
+
+        def add(field, name, movie_id):
+            text = normalize(name or '')
+            if text:
+                entries.setdefault((field, text), set()).add(movie_id)
+
+        for movie_id, name_kor, name_eng in Movie.objects.values_list('id', 'name_kor', 'name_eng'):
+            add('name_kor', name_kor, movie_id)
+            add('name_eng', name_eng, movie_id)
+        for field in ('directors', 'actors', 'genres'):
+            through = Movie._meta.get_field(field).remote_field.through
+            related_name = Movie._meta.get_field(field).m2m_reverse_field_name()
+            for movie_id, name in through.objects.values_list('movie_id', f'{related_name}__name'):
+                add(field, name, movie_id)
+
+        # entry: (field, 정규화된 이름, bigram 수, 영화 ID들) / postings: bigram -> entry 번호들
+        entry_list = []
+        postings = {}
+        for (field, text), movie_ids in entries.items():
+            grams = ngrams(text)
+            entry_list.append((field, text, len(grams), tuple(movie_ids)))
+            for gram in grams:
+                postings.setdefault(gram, []).append(len(entry_list) - 1)
+        return entry_list, postings
+
+    def search(self, query, limit):
+        text = normalize(query)
+        grams = ngrams(text)
+        if not grams:
+            return []
+        entries, postings = self.index.get()
+
+        hits = Counter()
+        for gram in grams:
+            hits.update(postings.get(gram, ()))
+
+        scores = {}
+        for entry_index, count in hits.items():
+            field, entry_text, entry_grams, movie_ids = entries[entry_index]
+            similarity = 2 * count / (len(grams) + entry_grams)
+            if text in entry_text:
+                similarity += 1
+            elif similarity < self.min_similarity:
+                continue
+            score = similarity * FIELD_WEIGHTS[field]
+            for movie_id in movie_ids:
+                if score > scores.get(movie_id, 0):
+                    scores[movie_id] = score
+        return [movie_id for movie_id, _ in sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]]
+
+    def invalidate(self):
+        self.index.invalidate()
+
+
+@models.CharField.register_lookup
+class ILikeContains(models.Lookup):
+    # PostgreSQL 전용 - 컬럼을 그대로 두고 ILIKE로 비교해 gin_trgm_ops 인덱스를 사용
+    # (Django의 icontains는 UPPER(col::text) LIKE UPPER(...)로 바뀌어 컬럼 인덱스를 사용하지 못함)
+    lookup_name = 'ilike_contains'
+
+    def get_db_prep_lookup(self, value, connection):
+        return '%s', [f'%{connection.ops.prep_for_like_query(value)}%']
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} ILIKE {rhs}', lhs_params + rhs_params
+
+
+class TrigramSearchEngine:
+    # PostgreSQL pg_trgm - 제목/이름 컬럼의 gin_trgm_ops GIN 인덱스로 % (유사도) / ILIKE (대소문자 무시 부분 문자열) 조건 검색
+    # 인덱스는 movies 0007 migration에서 생성, 'django.contrib.postgres' 앱 필요 (trigram_similar lookup)
+
+    def search(self, query, limit):
+        from django.contrib.postgres.search import TrigramSimilarity
+        from django.db.models import Q
+        from django.db.models.functions import Greatest
+        from .models import Movie, Director, Actor, Genre
+
+        query = query.strip()
+        if not query:
+            return []
+
+        scores = {}
+
+        def collect(rows, weight):
+            for movie_id, similarity, contains in rows:
+                score = (similarity + (1 if contains else 0)) * weight
+                if movie_id is not None and score > scores.get(movie_id, 0):
+                    scores[movie_id] = score
+
+        title_q = (
+            Q(name_kor__trigram_similar=query) | Q(name_eng__trigram_similar=query) |
+            Q(name_kor__ilike_contains=query) | Q(name_eng__ilike_contains=query)
+        )
+        collect(
+            (
+                (movie_id, similarity, query.lower() in name_kor.lower() or query.lower() in name_eng.lower())
+                for movie_id, similarity, name_kor, name_eng in Movie.objects.filter(title_q).annotate(
+                    similarity=Greatest(TrigramSimilarity('name_kor', query), TrigramSimilarity('name_eng', query)),
+                ).order_by('-similarity').values_list('id', 'similarity', 'name_kor', 'name_eng')[:limit]
+            ),
+            FIELD_WEIGHTS['name_kor'],
+        )
+        for model, field in ((Director, 'directors'), (Actor, 'actors'), (Genre, 'genres')):
+            collect(
+                (
+                    (movie_id, similarity, query.lower() in name.lower())
+                    for movie_id, similarity, name in model.objects.filter(
+                        Q(name__trigram_similar=query) | Q(name__ilike_contains=query)
+                    ).annotate(
+                        similarity=TrigramSimilarity('name', query),
+                    ).order_by('-similarity').values_list('movies__id', 'similarity', 'name')[:limit]
+                ),
+                FIELD_WEIGHTS[field],
+            )
+        return [movie_id for movie_id, _ in sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]]
+
+    def invalidate(self):
+        pass
+
+
+_search_engine = None
+_search_engine_lock = threading.Lock()
+
+
+def get_search_engine():
+    global _search_engine
+    if _search_engine is None:
+        with _search_engine_lock:
+            if _search_engine is None:
+                backend = settings.MOVIE_SEARCH_BACKEND
+                if backend is None:
+                    backend = (
+                        'movies.search.TrigramSearchEngine' if connection.vendor == 'postgresql'
+                        else 'movies.search.NgramSearchEngine'
+                    )
+                _search_engine = import_string(backend)()
+    return _search_engine
+
+
+@receiver(setting_changed)
+def reset_search_engine(setting, **kwargs):
+    global _search_engine
+    if setting.startswith('MOVIE_SEARCH_'):
+        _search_engine = None
+
+
+def invalidate_search_index():
+    get_search_engine().invalidate()
+
+
+def search_movies(query, limit=None):
+    # 순위 순 영화 ID 목록
+    return get_search_engine().search(query, limit or settings.MOVIE_SEARCH_LIMIT)
@@ -1,8 +1,31 @@
-from django.db.models import Sum, Count
 from rest_framework import serializers
 
 from utils.custom_functions import reformat_duration
 from .models import Movie, Rating, MovieLike
+from .stats import get_movie_stats
+
+
+def get_like_count(movie):
+    # MovieStats 카운터 - Movie.objects.with_stats()로 조회한 영화는 추가 쿼리 없음
+    return get_movie_stats(movie).like_count
+
+
+def get_average_point(movie, ndigits):
+    stats = get_movie_stats(movie)
+    return round(stats.rating_sum / stats.rating_count, ndigits) if stats.rating_count != 0 else 6.3
+
+
+def get_acc_favorite(movie):
+    likes_count = get_like_count(movie)
+    result = likes_count + 689 - (movie.pk * 24)
+    return result if result >= 0 else likes_count + 11
+
+
+# for Documentation
+class AutocompleteSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=['movie', 'director', 'actor'])
+    id = serializers.IntegerField()
+    name = serializers.CharField()
 
 
 # 전체 영화 일반 정보
@@ -27,20 +50,10 @@ class MovieSerializer(serializers.ModelSerializer):
         ]
 
     def get_average_point(self, movie):
-        point_sum = Movie.objects.filter(pk=movie.pk).values('ratings__score').aggregate(
-            point_sum=Sum('ratings__score')
-        )['point_sum']
-
-        point_count = Movie.objects.filter(pk=movie.pk).values('ratings__score').aggregate(
-            point_count=Count('ratings__score')
-        )['point_count']
-
-        return round(point_sum / point_count, 2) if point_count != 0 else 6.3
+        return get_average_point(movie, 2)
 
     def get_acc_favorite(self, movie):
-        likes_count = movie.movie_likes.filter(liked=True).count()
-        result = likes_count + 689 - (movie.pk * 24)
-        return result if result >= 0 else likes_count + 11
+        return get_acc_favorite(movie)
 
 
 class RatingsSerializer(serializers.ModelSerializer):
@@ -67,7 +80,9 @@ class MovieDetailSerializer(serializers.ModelSerializer):
     actors = serializers.SerializerMethodField()
     genres = serializers.SerializerMethodField()
     key_point_count = serializers.SerializerMethodField('get_key_point_count')
-    ratings = RatingsSerializer(many=True, source='ratings.all')
+    # 최신 한줄평 1페이지 - 다음 페이지는 ratings_next (detail/<pk>/ratings/?cursor=)
+    ratings = RatingsSerializer(many=True, source='latest_ratings', read_only=True)
+    ratings_next = serializers.CharField(read_only=True, allow_null=True)
 
     class Meta:
         model = Movie
@@ -92,58 +107,48 @@ class MovieDetailSerializer(serializers.ModelSerializer):
             'genres',
             'key_point_count',
             'ratings',
+            'ratings_next',
         ]
 
     def get_average_point(self, movie):
-        point_sum = Movie.objects.filter(pk=movie.pk).values('ratings__score').aggregate(
-            point_sum=Sum('ratings__score')
-        )['point_sum']
-
-        point_count = Movie.objects.filter(pk=movie.pk).values('ratings__score').aggregate(
-            point_count=Count('ratings__score')
-        )['point_count']
-        return round(point_sum / point_count, 1) if point_count != 0 else 6.3
+        return get_average_point(movie, 1)
 
     def get_acc_favorite(self, movie):
-        likes_count = movie.movie_likes.filter(liked=True).count()
-        result = likes_count + 689 - (movie.pk * 24)
-        return result if result >= 0 else likes_count + 11
+        return get_acc_favorite(movie)
 
     def get_running_time(self, obj):
         return reformat_duration(obj.running_time)
 
+    # prefetch_related('directors', 'actors', 'genres')로 조회한 영화는 추가 쿼리 없음
     def get_directors(self, movie):
-        return movie.directors.values_list('name', flat=True)
+        return [director.name for director in movie.directors.all()]
 
     def get_actors(self, movie):
-        return movie.actors.values_list('name', flat=True)
+        return [actor.name for actor in movie.actors.all()]
 
     def get_genres(self, movie):
-        return movie.genres.values_list('name', flat=True)
+        return [genre.name for genre in movie.genres.all()]
 
     def get_key_point_count(self, movie):
-        actor = movie.ratings.filter(key_point='actor').count()
-        prod = movie.ratings.filter(key_point='prod').count()
-        story = movie.ratings.filter(key_point='story').count()
-        visual = movie.ratings.filter(key_point='visual').count()
-        ost = movie.ratings.filter(key_point='ost').count()
+        stats = get_movie_stats(movie)
 
         # 더 나은 데이터 그래프를 위해 임의로 수 올림
         return {
-            'actors': (actor + 3) * 6,
-            'prods': (prod + 3) * 4,
-            'story': (story + 3) * 7,
-            'visual': (visual + 3) * 5,
-            'ost': (ost + 3) * 8
+            'actors': (stats.actor_count + 3) * 6,
+            'prods': (stats.prod_count + 3) * 4,
+            'story': (stats.story_count + 3) * 7,
+            'visual': (stats.visual_count + 3) * 5,
+            'ost': (stats.ost_count + 3) * 8
         }
 
 
+# for Documentation - 실제 키는 settings.AGE_BOOKING_BANDS의 이름
 class AgeBookingSerializer(serializers.Serializer):
-    teens = serializers.IntegerField(source='teens__sum')
-    twenties = serializers.IntegerField(source='twenties__sum')
-    thirties = serializers.IntegerField(source='thirties__sum')
-    fourties = serializers.IntegerField(source='fourties__sum')
-    fifties = serializers.IntegerField(source='fifties__sum')
+    teens = serializers.IntegerField()
+    twenties = serializers.IntegerField()
+    thirties = serializers.IntegerField()
+    fourties = serializers.IntegerField()
+    fifties = serializers.IntegerField()
 
 
 # 무비스토리 타임라인에 사용될 영화 정보
@@ -169,9 +174,7 @@ class MovieTimelineSerializer(serializers.ModelSerializer):
         ]
 
     def get_acc_favorite(self, movie):
-        likes_count = movie.movie_likes.filter(liked=True).count()
-        result = likes_count + 689 - (movie.pk * 24)
-        return result if result >= 0 else likes_count + 11
+        return get_acc_favorite(movie)
 
     def get_running_time(self, obj):
         return reformat_duration(obj.running_time)
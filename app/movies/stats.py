@@ -0,0 +1,116 @@
+from datetime import date
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, Sum, OuterRef, Subquery, IntegerField
+from django.db.models.functions import Coalesce
+
+from utils.etags import bump_model_versions
+from .models import Movie, MovieStats, Rating, MovieLike
+
+# 한줄평 key_point -> MovieStats 카운터 필드
+KEY_POINT_FIELDS = {key_point: f'{key_point}_count' for key_point, _ in Rating.KEY_POINT_CHOICES}
+
+
+def update_rating_stats(movie_id, score, key_point, sign):
+    changes = {
+        'rating_sum': F('rating_sum') + score * sign,
+        'rating_count': F('rating_count') + sign,
+    }
+    if key_point in KEY_POINT_FIELDS:
+        changes[KEY_POINT_FIELDS[key_point]] = F(KEY_POINT_FIELDS[key_point]) + sign
+    # 카운터 row가 없는 기존 영화는 한줄평 기준으로 새로 계산
+    # 차감일 때는 만들지 않음 (영화 삭제 cascade 중에 row가 다시 생기지 않도록) - 조회 시 get_movie_stats에서 생성
+    if MovieStats.objects.filter(movie_id=movie_id).update(**changes):
+        bump_model_versions(MovieStats)
+    elif sign > 0:
+        rebuild_movie_stats([movie_id])
+
+
+def add_rating(rating):
+    # 한줄평 생성 - Rating post_save signal에서 호출
+    update_rating_stats(rating.movie_id, rating.score, rating.key_point, 1)
+
+
+def remove_rating(rating):
+    update_rating_stats(rating.movie_id, rating.score, rating.key_point, -1)
+
+
+def update_like_count(movie_id, delta):
+    # update_rating_stats와 같이 차감일 때는 row를 만들지 않음
+    if MovieStats.objects.filter(movie_id=movie_id).update(like_count=F('like_count') + delta):
+        bump_model_versions(MovieStats)
+    elif delta > 0:
+        rebuild_movie_stats([movie_id])
+
+
+def toggle_movie_like(movie_id, member_id):
+    # (movie, member) unique 제약 조건 기준 upsert 1번으로 토글 - 처음이면 liked=True로 생성
+    # 동시에 눌러도 row는 1개이고, 같은 row의 upsert는 순서대로 실행되어 좋아요 수 증감이 어긋나지 않음
+    quote_name = connection.ops.quote_name
+    table = quote_name(MovieLike._meta.db_table)
+    liked, liked_at = quote_name('liked'), quote_name('liked_at')
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {table} ({quote_name("movie_id")}, {quote_name("member_id")}, {liked}, {liked_at}) '
+                f'VALUES (%s, %s, %s, %s) '
+                f'ON CONFLICT ({quote_name("movie_id")}, {quote_name("member_id")}) '
+                f'DO UPDATE SET {liked} = NOT {table}.{liked}, {liked_at} = EXCLUDED.{liked_at}',
+                [movie_id, member_id, True, date.today()],
+            )
+        # upsert한 row는 트랜잭션이 끝날 때까지 잠겨 있으므로 다시 조회해도 방금 토글한 값
+        movie_like = MovieLike.objects.select_related('movie', 'member').get(movie_id=movie_id, member_id=member_id)
+        update_like_count(movie_id, 1 if movie_like.liked else -1)
+    return movie_like
+
+
+def annotate_rating_stats(queryset):
+    # 카운터 재계산용 - 영화별 평점 합계/수, key_point별 수를 쿼리 1번으로 집계 (ratings join 1개라 row 중복 없음)
+    # 좋아요 수는 row가 중복되지 않도록 subquery
+    likes = MovieLike.objects.filter(movie=OuterRef('pk'), liked=True).order_by().values('movie')
+    return queryset.annotate(
+        like_count_value=Coalesce(Subquery(
+            likes.annotate(count=Count('pk')).values('count'), IntegerField()
+        ), 0),
+        rating_sum_value=Coalesce(Sum('ratings__score'), 0),
+        rating_count_value=Count('ratings'),
+        **{
+            f'{field}_value': Count('ratings', filter=Q(ratings__key_point=key_point))
+            for key_point, field in KEY_POINT_FIELDS.items()
+        }
+    )
+
+
+STAT_FIELDS = ['rating_sum', 'rating_count'] + list(KEY_POINT_FIELDS.values()) + ['like_count']
+
+
+def rebuild_movie_stats(movie_ids):
+    movies = annotate_rating_stats(Movie.objects.filter(pk__in=movie_ids).order_by())
+    stats = {stat.movie_id: stat for stat in MovieStats.objects.filter(movie_id__in=movie_ids)}
+    created, updated = [], []
+    for movie in movies:
+        stat = stats.get(movie.id)
+        if stat is None:
+            stat = MovieStats(movie_id=movie.id)
+            created.append(stat)
+        else:
+            updated.append(stat)
+        for field in STAT_FIELDS:
+            setattr(stat, field, getattr(movie, f'{field}_value'))
+
+    if created:
+        # 동시 조회에서 다른 요청이 먼저 만든 row는 건너뛰고(OneToOne unique 충돌 방지) 저장된 row를 다시 조회
+        MovieStats.objects.bulk_create(created, ignore_conflicts=True)
+        created = list(MovieStats.objects.filter(movie_id__in=[stat.movie_id for stat in created]))
+    MovieStats.objects.bulk_update(updated, STAT_FIELDS)
+    bump_model_versions(MovieStats)
+    return created + updated
+
+
+def get_movie_stats(movie):
+    # 카운터 row가 없는 기존 영화는 조회 시점에 생성
+    try:
+        return movie.stats
+    except MovieStats.DoesNotExist:
+        stat, = rebuild_movie_stats([movie.pk])
+        return stat
@@ -0,0 +1,14 @@
+from __future__ import absolute_import, unicode_literals
+
+from celery import shared_task
+
+from .age_booking import update_age_booking
+
+AGE_BOOKING_BATCH_SIZE = 1000
+
+
+@shared_task
+def update_age_booking_histogram():
+    # 밀린 결제가 많으면 batch 단위로 반복
+    while update_age_booking(AGE_BOOKING_BATCH_SIZE) == AGE_BOOKING_BATCH_SIZE:
+        pass
@@ -0,0 +1,103 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from movies.age_booking import get_age, update_age_booking
+from movies.models import MovieAgeBooking, AgeBookingProgress
+from movies.tasks import update_age_booking_histogram
+from reservations.models import Reservation
+from test_utils.fixtures import create_seats
+
+
+@override_settings(AGE_BOOKING_PAYMENT_LAG=0)
+class AgeBookingTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.movie = baker.make('movies.Movie')
+        cls.url = f'/movies/detail/{cls.movie.pk}/age-booking/'
+        cls.schedule = baker.make('theaters.Schedule', movie=cls.movie, screen__seats_type='2')
+        # 2020-07-20 기준 만 14, 20, 29, 60세
+        cls.members = [
+            baker.make('members.Member', mobile=f'010-0000-000{index}', birth_date=birth_date)
+            for index, birth_date in enumerate([
+                datetime.date(2005, 7, 21),
+                datetime.date(2000, 7, 20),
+                datetime.date(1990, 7, 21),
+                datetime.date(1960, 1, 1),
+            ])
+        ]
+
+    def reserve(self, member, paid=True):
+        reservation = baker.make(
+            'reservations.Reservation',
+            schedule=self.schedule,
+            member=member,
+            payment=baker.make('reservations.Payment') if paid else None,
+        )
+        Reservation.objects.filter(pk=reservation.pk).update(reserved_at=datetime.datetime(2020, 7, 20, 10))
+        return reservation
+
+    def counts(self):
+        return MovieAgeBooking.objects.get(movie=self.movie).get_counts()
+
+    def test_age(self):
+        self.assertEqual(get_age(datetime.date(2000, 7, 20), datetime.date(2020, 7, 19)), 19)
+        self.assertEqual(get_age(datetime.date(2000, 7, 20), datetime.date(2020, 7, 20)), 20)
+
+    def test_incremental_update(self):
+        reservations = [self.reserve(member) for member in self.members]
+        self.reserve(self.members[0], paid=False)
+
+        update_age_booking_histogram()
+        self.assertEqual(self.counts(), {'teens': 1, 'twenties': 2})
+        self.assertEqual(AgeBookingProgress.objects.get().last_payment_id, reservations[-1].payment_id)
+
+        # 이미 반영한 결제는 다시 더하지 않음
+        self.assertEqual(update_age_booking(), 0)
+        self.reserve(self.members[1])
+        self.assertEqual(update_age_booking(), 1)
+        self.assertEqual(self.counts(), {'teens': 1, 'twenties': 3})
+
+        # 반영된 예매 삭제(결제 취소) 시 차감
+        reservations[0].delete()
+        self.assertEqual(self.counts(), {'teens': 0, 'twenties': 3})
+
+    def test_lag(self):
+        self.reserve(self.members[0])
+        with self.settings(AGE_BOOKING_PAYMENT_LAG=60):
+            self.assertEqual(update_age_booking(), 0)
+        self.assertEqual(update_age_booking(), 1)
+
+    def test_rebuild(self):
+        for member in self.members:
+            self.reserve(member)
+        update_age_booking()
+
+        bands = [('young', 0, 25), ('old', 25, 100)]
+        with self.settings(AGE_BOOKING_BANDS=bands):
+            stdout = StringIO()
+            call_command('rebuild_age_booking', stdout=stdout)
+            self.assertIn('4', stdout.getvalue())
+            self.assertEqual(self.counts(), {'young': 2, 'old': 2})
+
+            response = self.client.get(self.url)
+            self.assertEqual(response.data, {'young': 2, 'old': 2})
+
+    def test_view(self):
+        self.reserve(self.members[1])
+        update_age_booking()
+
+        # 단일 row 조회
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data, {
+            'teens': 3 * 9, 'twenties': (1 + 1) * 7, 'thirties': 5 * 4, 'fourties': 2 * 9, 'fifties': 3 * 5,
+        })
+
+        response = self.client.get(f'/movies/detail/{self.movie.pk + 1}/age-booking/')
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,107 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from movies.autocomplete import AutocompleteIndex, decompose, chosung, get_autocomplete_index
+from test_utils.transactions import capture_on_commit_callbacks
+from utils.excepts import InvalidAutocompleteQueryException
+
+
+class JamoTest(SimpleTestCase):
+    def test_decompose(self):
+        self.assertEqual(decompose('닭과'), 'ㄷㅏㄹㄱㄱㅗㅏ')
+        self.assertEqual(decompose('ㅘa'), 'ㅗㅏa')
+        self.assertEqual(chosung('반도 2'), 'ㅂㄷ 2')
+
+    def test_index(self):
+        index = AutocompleteIndex({
+            ('movie', 1): ('반도', 2),
+            ('movie', 2): ('반지의 제왕', 1),
+            ('actor', 1): ('강동원', -3),
+            ('director', 1): ('연상호', -2),
+        })
+        names = lambda query, k=10: [item['name'] for item in index.search(query, k)]
+
+        self.assertEqual(names('ㅂ'), ['반지의 제왕', '반도'])
+        self.assertEqual(names('ㅂ', 1), ['반지의 제왕'])
+        self.assertEqual(names('반ㄷ'), ['반도'])
+        self.assertEqual(names('바'), ['반지의 제왕', '반도'])
+        self.assertEqual(names('ㅈㅇ'), ['반지의 제왕'])
+        self.assertEqual(names('ㅇㅅㅎ'), ['연상호'])
+        self.assertEqual(names('강동'), ['강동원'])
+        self.assertEqual(names('ㅋ'), [])
+        self.assertEqual(names(' '), [])
+
+        index = index.updated({('movie', 1): None, ('actor', 2): ('배두나', -1)})
+        self.assertEqual(names('ㅂ'), ['반지의 제왕', '배두나'])
+
+    def test_memo_size(self):
+        index = AutocompleteIndex({('movie', 1): ('반도', 1)})
+        with mock.patch('movies.autocomplete.MEMO_SIZE', 2):
+            for query in ['ㅂ', 'ㄱ', 'ㄴ', 'ㄷ']:
+                index.search(query, 10)
+            index.search('ㄴ', 10)
+            index.search('ㄹ', 10)
+        self.assertEqual(list(index.memo), [('cㄴ', 10), ('cㄹ', 10)])
+
+
+class AutocompleteViewTest(APITestCase):
+    url = '/movies/autocomplete/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = baker.make('movies.Movie', rank=1, name_kor='부산행')
+        cls.director = baker.make('movies.Director', name='연상호')
+        cls.actor = baker.make('movies.Actor', name='공유')
+        cls.movie.directors.add(cls.director)
+        cls.movie.actors.add(cls.actor)
+
+    def setUp(self):
+        cache.clear()
+
+    def suggestions(self, query):
+        response = self.client.get(self.url, {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [(item['type'], item['id']) for item in response.data]
+
+    def test_autocomplete(self):
+        self.assertEqual(self.suggestions('ㅂㅅ'), [('movie', self.movie.pk)])
+        self.assertEqual(self.suggestions('연사'), [('director', self.director.pk)])
+        self.assertEqual(self.suggestions('ㄱ'), [('actor', self.actor.pk)])
+
+    def test_incremental_refresh(self):
+        get_autocomplete_index()
+        with capture_on_commit_callbacks() as callbacks:
+            movie = baker.make('movies.Movie', rank=2, name_kor='반도')
+            self.actor.name = '강동원'
+            self.actor.save()
+        # 커밋 전에는 반영하지 않음
+        self.assertEqual(self.suggestions('ㅂㄷ'), [])
+        for callback in callbacks:
+            callback()
+
+        # 변경된 영화 1번 + 배우 1번
+        with self.assertNumQueries(2):
+            self.assertEqual(self.suggestions('ㅂㄷ'), [('movie', movie.pk)])
+        self.assertEqual(self.suggestions('ㄱ'), [('actor', self.actor.pk)])
+        self.assertEqual(self.suggestions('공'), [])
+
+        with capture_on_commit_callbacks(execute=True):
+            self.director.delete()
+        self.assertEqual(self.suggestions('연'), [])
+
+    def test_rebuild_without_change_log(self):
+        get_autocomplete_index()
+        with capture_on_commit_callbacks(execute=True):
+            movie = baker.make('movies.Movie', rank=2, name_kor='반도')
+        cache.clear()
+        self.assertEqual(self.suggestions('ㅂㄷ'), [('movie', movie.pk)])
+
+    def test_invalid_count(self):
+        for k in ['a', 0, 21]:
+            response = self.client.get(self.url, {'q': 'ㅂ', 'k': k})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data['detail'].code, InvalidAutocompleteQueryException.default_code)
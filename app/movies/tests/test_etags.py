@@ -0,0 +1,63 @@
+from django.core.cache import cache
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from test_utils.transactions import capture_on_commit_callbacks
+
+
+class MovieETagTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = baker.make('movies.Movie', rank=1)
+        cls.member = baker.make('members.Member', mobile='010-0000-0000')
+
+    def setUp(self):
+        cache.clear()
+
+    def assertNotModified(self, url, etag):
+        # serializer 실행 전에 응답 - DB 조회 없음
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_list_and_detail(self):
+        for url in ['/movies/', f'/movies/detail/{self.movie.pk}/', f'/movies/detail/{self.movie.pk}/ratings/']:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Cache-Control'], 'no-cache')
+            self.assertNotModified(url, response['ETag'])
+
+            # 다른 query는 다른 ETag
+            self.assertNotEqual(self.client.get(url, {'page': 1})['ETag'], response['ETag'])
+
+    def test_rating_changes_etag(self):
+        urls = ['/movies/', f'/movies/detail/{self.movie.pk}/', f'/movies/detail/{self.movie.pk}/ratings/']
+        etags = [self.client.get(url)['ETag'] for url in urls]
+
+        with capture_on_commit_callbacks() as callbacks:
+            baker.make('movies.Rating', movie=self.movie, member=self.member, score=9, key_point='ost')
+        # 커밋 전에는 ETag 유지
+        for url, etag in zip(urls, etags):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        for callback in callbacks:
+            callback()
+        for url, etag in zip(urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response['ETag'], etag)
+
+    def test_people_changes_etag(self):
+        etag = self.client.get('/movies/', {'searchName': '봉준호'})['ETag']
+        with capture_on_commit_callbacks(execute=True):
+            self.movie.directors.add(baker.make('movies.Director', name='봉준호'))
+
+        response = self.client.get('/movies/', {'searchName': '봉준호'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 1)
+
+    def test_missing_movie(self):
+        response = self.client.get(f'/movies/detail/{self.movie.pk + 1}/')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header('ETag'))
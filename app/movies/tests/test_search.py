@@ -0,0 +1,81 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from movies.models import Movie
+from movies.search import NgramSearchEngine, normalize, search_movies
+from test_utils.transactions import capture_on_commit_callbacks
+
+
+@override_settings(MOVIE_SEARCH_BACKEND='movies.search.NgramSearchEngine')
+class NgramSearchTest(APITestCase):
+    url = '/movies/'
+
+    @classmethod
+    def setUpTestData(cls):
+        director = baker.make('movies.Director', name='봉준호')
+        actor = baker.make('movies.Actor', name='송강호')
+        genre = baker.make('movies.Genre', name='드라마')
+        cls.parasite = baker.make('movies.Movie', rank=1, name_kor='기생충', name_eng='Parasite')
+        cls.parasite.directors.add(director)
+        cls.parasite.actors.add(actor)
+        cls.parasite.genres.add(genre)
+        cls.endgame = baker.make('movies.Movie', rank=2, name_kor='어벤져스: 엔드게임', name_eng='Avengers: Endgame')
+        cls.infinity = baker.make('movies.Movie', rank=3, name_kor='어벤져스: 인피니티 워', name_eng='Avengers: Infinity War')
+        cls.drama = baker.make('movies.Movie', rank=4, name_kor='택시운전사', name_eng='A Taxi Driver')
+        cls.drama.actors.add(actor)
+        cls.drama.genres.add(genre)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_normalize(self):
+        self.assertEqual(normalize('어벤져스: 엔드 게임'), '어벤져스엔드게임')
+        self.assertEqual(normalize('Avengers: Endgame'), 'avengersendgame')
+
+    def test_title_ranked_first(self):
+        self.assertEqual(search_movies('어벤져스 엔드게임')[:2], [self.endgame.pk, self.infinity.pk])
+        self.assertEqual(search_movies('avengers'), [self.endgame.pk, self.infinity.pk])
+
+    def test_typo(self):
+        self.assertEqual(search_movies('어벤저스 엔드게임')[0], self.endgame.pk)
+        self.assertEqual(search_movies('parasyte'), [self.parasite.pk])
+
+    def test_people_and_genres(self):
+        self.assertEqual(search_movies('봉준호'), [self.parasite.pk])
+        self.assertEqual(search_movies('송강호'), [self.parasite.pk, self.drama.pk])
+        self.assertEqual(search_movies('드라마'), [self.parasite.pk, self.drama.pk])
+        self.assertEqual(search_movies('없는영화제목'), [])
+
+    def test_index_refresh(self):
+        search_movies('기생충')
+        with capture_on_commit_callbacks() as callbacks:
+            movie = baker.make('movies.Movie', rank=5, name_kor='마더', name_eng='Mother')
+        # 커밋 전에는 이전 인덱스 유지
+        self.assertEqual(search_movies('마더'), [])
+        for callback in callbacks:
+            callback()
+        self.assertEqual(search_movies('마더'), [movie.pk])
+
+        with capture_on_commit_callbacks(execute=True):
+            movie.directors.add(self.parasite.directors.get())
+        self.assertEqual(search_movies('봉준호'), [self.parasite.pk, movie.pk])
+
+    def test_view(self):
+        response = self.client.get(self.url, {'searchName': '엔드게임'})
+        self.assertEqual([movie['id'] for movie in response.data['results']], [self.endgame.pk])
+
+        response = self.client.get(self.url, {'searchName': ' '})
+        self.assertEqual(response.data['count'], 4)
+
+    def test_limit(self):
+        self.assertEqual(len(NgramSearchEngine().search('어벤져스', 1)), 1)
+
+
+class ILikeContainsTest(SimpleTestCase):
+    def test_sql(self):
+        # 컬럼을 UPPER()/::text로 감싸지 않아야 gin_trgm_ops 인덱스 사용 가능 / %, _는 escape
+        sql, params = Movie.objects.filter(name_eng__ilike_contains='50%_off').values('id').query.sql_with_params()
+        self.assertIn('"movies_movie"."name_eng" ILIKE %s', sql)
+        self.assertEqual(params, ('%50\\%\\_off%',))
@@ -0,0 +1,238 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from movies.models import Movie, MovieStats, Rating, MovieLike
+from movies.stats import get_movie_stats, rebuild_movie_stats
+
+
+class MovieListViewTest(APITestCase):
+    url = '/movies/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.movies = [baker.make('movies.Movie', rank=rank) for rank in range(1, 6)]
+        cls.members = [baker.make('members.Member', mobile=f'010-0000-000{i}') for i in range(3)]
+        for member, score, key_point in zip(cls.members, (7, 8, 10), ('actor', 'actor', 'ost')):
+            baker.make('movies.Rating', movie=cls.movies[0], member=member, score=score, key_point=key_point)
+            baker.make('movies.MovieLike', movie=cls.movies[0], member=member, liked=True)
+        baker.make('movies.MovieLike', movie=cls.movies[1], member=cls.members[0], liked=False)
+        rebuild_movie_stats([movie.pk for movie in cls.movies])
+
+    def test_constant_query_count(self):
+        # count 1 + 목록 1 - 영화 수와 무관
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        first, second = response.data['results'][:2]
+        self.assertEqual(first['average_point'], 8.33)
+        self.assertEqual(first['acc_favorite'], 3 + 689 - self.movies[0].pk * 24)
+        self.assertEqual(second['average_point'], 6.3)
+        self.assertEqual(second['acc_favorite'], 689 - self.movies[1].pk * 24)
+
+    def test_detail(self):
+        response = self.client.get(f'{self.url}detail/{self.movies[0].pk}/')
+        self.assertEqual(response.data['average_point'], 8.3)
+        self.assertEqual(response.data['key_point_count']['actors'], (2 + 3) * 6)
+        self.assertEqual(response.data['key_point_count']['ost'], (1 + 3) * 8)
+
+    def test_missing_stats(self):
+        MovieStats.objects.filter(movie=self.movies[0]).delete()
+        response = self.client.get(f'{self.url}detail/{self.movies[0].pk}/')
+        self.assertEqual(response.data['average_point'], 8.3)
+        self.assertTrue(MovieStats.objects.filter(movie=self.movies[0]).exists())
+
+
+class MovieStatsTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = baker.make('movies.Movie')
+        cls.member = baker.make('members.Member', mobile='010-0000-0000')
+
+    def get_stats(self):
+        return MovieStats.objects.get(movie=self.movie)
+
+    def test_rating_create(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.post(
+            f'/movies/detail/{self.movie.pk}/rating/create/', {'score': 9, 'key_point': 'story', 'comment': ''}
+        )
+        self.assertEqual(response.status_code, 201)
+
+        stats = self.get_stats()
+        self.assertEqual((stats.rating_sum, stats.rating_count, stats.story_count), (9, 1, 1))
+
+        Rating.objects.get(pk=response.data['rating_id']).delete()
+        stats = self.get_stats()
+        self.assertEqual((stats.rating_sum, stats.rating_count, stats.story_count), (0, 0, 0))
+
+    def test_rating_created_outside_view(self):
+        rating = baker.make('movies.Rating', movie=self.movie, member=self.member, score=7, key_point='ost')
+        stats = self.get_stats()
+        self.assertEqual((stats.rating_sum, stats.rating_count, stats.ost_count), (7, 1, 1))
+
+        rating.delete()
+        stats = self.get_stats()
+        self.assertEqual((stats.rating_sum, stats.rating_count, stats.ost_count), (0, 0, 0))
+
+        # 영화 삭제 시 cascade로 한줄평이 삭제되어도 카운터가 음수가 되지 않음
+        movie = baker.make('movies.Movie')
+        baker.make('movies.Rating', movie=movie, member=self.member, score=7, key_point='ost')
+        movie.delete()
+        self.assertFalse(Rating.objects.exists())
+
+    def test_concurrent_lazy_create(self):
+        movie = baker.make('movies.Movie')
+        MovieStats.objects.filter(movie=movie).delete()
+        bulk_create = MovieStats.objects.bulk_create
+
+        def create_first(stats, **kwargs):
+            # 조회와 insert 사이에 다른 요청이 먼저 row를 만든 경우
+            MovieStats.objects.create(movie=movie)
+            return bulk_create(stats, **kwargs)
+
+        with mock.patch.object(MovieStats.objects, 'bulk_create', create_first):
+            stats = get_movie_stats(Movie.objects.get(pk=movie.pk))
+        self.assertEqual(stats.pk, MovieStats.objects.get(movie=movie).pk)
+
+    def test_rebuild_command(self):
+        baker.make('movies.Rating', movie=self.movie, member=self.member, score=6, key_point='visual')
+        MovieStats.objects.filter(movie=self.movie).update(rating_sum=100, rating_count=100)
+
+        call_command('rebuild_movie_stats', stdout=StringIO())
+
+        stats = self.get_stats()
+        self.assertEqual((stats.rating_sum, stats.rating_count, stats.visual_count), (6, 1, 1))
+        self.assertEqual(Movie.objects.with_stats().get(pk=self.movie.pk).stats.rating_sum, 6)
+
+
+class RatingListViewTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = baker.make('movies.Movie')
+        cls.movie.directors.add(*baker.make('movies.Director', _quantity=2))
+        cls.movie.actors.add(*baker.make('movies.Actor', _quantity=3))
+        cls.movie.genres.add(baker.make('movies.Genre'))
+        members = [baker.make('members.Member', mobile=f'010-0000-{index:04}') for index in range(25)]
+        cls.ratings = [
+            baker.make('movies.Rating', movie=cls.movie, member=member, score=8, key_point='story')
+            for member in members
+        ]
+        # 같은 날짜는 id 역순
+        Rating.objects.filter(pk__in=[rating.pk for rating in cls.ratings[:5]]).update(created_at='2020-07-01')
+        cls.expected_ids = [rating.pk for rating in cls.ratings[5:][::-1] + cls.ratings[:5][::-1]]
+
+    def test_detail(self):
+        # 영화 1 + 감독/배우/장르 prefetch 3 + 한줄평 1
+        with self.assertNumQueries(5):
+            response = self.client.get(f'/movies/detail/{self.movie.pk}/')
+
+        self.assertEqual(len(response.data['directors']), 2)
+        self.assertEqual(len(response.data['actors']), 3)
+        self.assertEqual([rating['rating_id'] for rating in response.data['ratings']], self.expected_ids[:10])
+        self.assertIn(f'/movies/detail/{self.movie.pk}/ratings/?cursor=', response.data['ratings_next'])
+
+        response = self.client.get(response.data['ratings_next'])
+        self.assertEqual([rating['rating_id'] for rating in response.data['results']], self.expected_ids[10:20])
+
+    def test_pages(self):
+        url = f'/movies/detail/{self.movie.pk}/ratings/'
+        rating_ids = []
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            rating_ids += [rating['rating_id'] for rating in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(rating_ids, self.expected_ids)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f'/movies/detail/{self.movie.pk}/ratings/', {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, 404)
+
+
+class MovieLikeToggleTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = baker.make('movies.Movie')
+        cls.members = [baker.make('members.Member', mobile=f'010-0000-000{index}') for index in range(2)]
+        cls.url = f'/movies/detail/{cls.movie.pk}/like/'
+
+    def like_count(self):
+        return MovieStats.objects.get(movie=self.movie).like_count
+
+    def test_toggle(self):
+        self.client.force_authenticate(self.members[0])
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['liked'])
+        self.assertEqual(self.like_count(), 1)
+
+        self.client.force_authenticate(self.members[1])
+        self.client.get(self.url)
+        self.assertEqual(self.like_count(), 2)
+
+        response = self.client.get(self.url)
+        self.assertFalse(response.data['liked'])
+        self.assertEqual(self.like_count(), 1)
+        self.assertEqual(MovieLike.objects.filter(movie=self.movie).count(), 2)
+
+        self.client.get(self.url)
+        self.assertEqual(self.like_count(), 2)
+
+        response = self.client.get('/movies/')
+        self.assertEqual(response.data['results'][0]['acc_favorite'], 2 + 689 - self.movie.pk * 24)
+
+    def test_unique(self):
+        baker.make('movies.MovieLike', movie=self.movie, member=self.members[0], liked=True)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            baker.make('movies.MovieLike', movie=self.movie, member=self.members[0], liked=False)
+
+    def test_missing_movie(self):
+        self.client.force_authenticate(self.members[0])
+        response = self.client.get(f'/movies/detail/{self.movie.pk + 1}/like/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_like_deleted_or_edited(self):
+        self.client.force_authenticate(self.members[0])
+        self.client.get(self.url)
+        movie_like = baker.make('movies.MovieLike', movie=self.movie, member=self.members[1], liked=True)
+        self.assertEqual(self.like_count(), 2)
+
+        # admin 수정
+        movie_like.liked = False
+        movie_like.save()
+        self.assertEqual(self.like_count(), 1)
+        movie_like.liked = True
+        movie_like.save()
+        self.assertEqual(self.like_count(), 2)
+
+        # 회원 삭제 cascade
+        member = baker.make('members.Member', mobile='010-0000-0009')
+        self.client.force_authenticate(member)
+        self.client.get(self.url)
+        self.assertEqual(self.like_count(), 3)
+        member.delete()
+        self.assertEqual(self.like_count(), 2)
+
+        movie_like.delete()
+        self.assertEqual(self.like_count(), 1)
+
+        # 영화 삭제 cascade
+        movie = baker.make('movies.Movie')
+        baker.make('movies.MovieLike', movie=movie, member=self.members[0], liked=True)
+        baker.make('movies.Rating', movie=movie, member=self.members[0], score=5)
+        movie_id = movie.pk
+        movie.delete()
+        self.assertFalse(MovieStats.objects.filter(movie_id=movie_id).exists())
+
+    def test_rebuild_like_count(self):
+        baker.make('movies.MovieLike', movie=self.movie, member=self.members[0], liked=True)
+        baker.make('movies.MovieLike', movie=self.movie, member=self.members[1], liked=False)
+        MovieStats.objects.filter(movie=self.movie).update(like_count=10)
+
+        rebuild_movie_stats([self.movie.pk])
+        self.assertEqual(self.like_count(), 1)
@@ -1,11 +1,16 @@
 from django.urls import path
 
-from .views import MovieListView, MovieDetailView, AgeBookingView, RatingCreateView, MovieLikeCheckView
+from .views import (
+    AutocompleteView, MovieListView, MovieDetailView, AgeBookingView, RatingCreateView,
+    RatingListView, MovieLikeCheckView,
+)
 
 urlpatterns = [
     path('', MovieListView.as_view()),
+    path('autocomplete/', AutocompleteView.as_view()),
     path('detail/<int:pk>/', MovieDetailView.as_view()),
     path('detail/<int:pk>/age-booking/', AgeBookingView.as_view()),
+    path('detail/<int:pk>/ratings/', RatingListView.as_view()),
     path('detail/<int:pk>/rating/create/', RatingCreateView.as_view()),
     path('detail/<int:pk>/like/', MovieLikeCheckView.as_view()),
 ]
@@ -1,4 +1,6 @@
-from django.db.models import Q, Count, Sum
+from django.db import transaction
+from django.http import Http404
+from django.db.models import Case, When, IntegerField
 from django.utils.decorators import method_decorator
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.generics import RetrieveAPIView, ListAPIView, CreateAPIView
@@ -6,95 +8,137 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Movie, Rating, MovieLike
+from utils.etags import ConditionalGetMixin
+from utils.excepts import InvalidAutocompleteQueryException
+from utils.pagination import KeysetPagination
+from .age_booking import get_age_booking
+from .autocomplete import autocomplete
+from .models import Movie, Rating, MovieLike, MovieStats, MovieAgeBooking, Director, Actor, Genre
+from .params import autocomplete_query_param, suggestion_count_query_param, cursor_query_param
+from .search import search_movies
+from .stats import toggle_movie_like
 from .serializers import (
-    MovieSerializer, MovieDetailSerializer, AgeBookingSerializer, RatingsSerializer, MovieLikeSerializer
+    AutocompleteSerializer, MovieSerializer, MovieDetailSerializer, AgeBookingSerializer, RatingsSerializer,
+    MovieLikeSerializer,
+)
+
+
+# 영화 목록/상세 응답이 의존하는 모델 (검색 결과 포함)
+MOVIE_ETAG_MODELS = (
+    Movie, MovieStats, MovieLike, Director, Actor, Genre,
+    Movie.directors.through, Movie.actors.through, Movie.genres.through,
 )
 
 
 @method_decorator(name='get', decorator=swagger_auto_schema(
     operation_summary='Movie List',
-    operation_description='전체 영화 정보',
+    operation_description='전체 영화 정보 - searchName이 있으면 제목/배우/감독/장르 검색 결과를 관련도 순으로',
 ))
-class MovieListView(ListAPIView):
+class MovieListView(ConditionalGetMixin, ListAPIView):
     serializer_class = MovieSerializer
+    etag_models = MOVIE_ETAG_MODELS
 
     def get_queryset(self):
-        search_name = self.request.query_params.get('searchName', None)
+        search_name = self.request.query_params.get('searchName', '').strip()
+        if not search_name:
+            return Movie.objects.with_stats()
+
+        # 검색 엔진이 매긴 순위 순서대로 정렬
+        movie_ids = search_movies(search_name)
+        return Movie.objects.filter(pk__in=movie_ids).order_by(
+            Case(*[When(pk=movie_id, then=position) for position, movie_id in enumerate(movie_ids)],
+                 output_field=IntegerField())
+        ).with_stats()
+
+
+AUTOCOMPLETE_DEFAULT_COUNT = 10
+AUTOCOMPLETE_MAX_COUNT = 20
+
+
+@method_decorator(name='get', decorator=swagger_auto_schema(
+    operation_summary='Movie Autocomplete',
+    operation_description='영화 제목/감독/배우 이름 자동완성 (접두어 일치) - 초성 검색 지원',
+    responses={200: AutocompleteSerializer(many=True)},
+    manual_parameters=[autocomplete_query_param, suggestion_count_query_param],
+))
+class AutocompleteView(APIView):
+    def get(self, request):
         try:
-            if search_name is None:
-                queryset = Movie.objects.all()
-            else:
-                queryset = Movie.objects.filter(
-                    Q(name_kor__contains=search_name) |
-                    Q(name_eng__icontains=search_name)
-                )
-        except ValueError as e:
-            queryset = Movie.objects.all()
-        return queryset
+            k = int(request.query_params.get('k', AUTOCOMPLETE_DEFAULT_COUNT))
+        except ValueError:
+            raise InvalidAutocompleteQueryException
+        if not 1 <= k <= AUTOCOMPLETE_MAX_COUNT:
+            raise InvalidAutocompleteQueryException
+        return Response(autocomplete(request.query_params.get('q', ''), k))
+
+
+class RatingPagination(KeysetPagination):
+    # 최신순 - (movie, created_at, id) 인덱스를 역순으로 탐색
+    keys = ('created_at', 'id')
+    descending = True
+    page_size = 10
 
 
 @method_decorator(name='get', decorator=swagger_auto_schema(
     operation_summary='Movie Detail',
-    operation_description='영화 상세 정보',
+    operation_description='영화 상세 정보 - 한줄평은 최신 1페이지만, 다음 페이지는 ratings_next URL 사용',
 ))
-class MovieDetailView(RetrieveAPIView):
-    queryset = Movie.objects.all()
+class MovieDetailView(ConditionalGetMixin, RetrieveAPIView):
+    queryset = Movie.objects.with_stats().prefetch_related('directors', 'actors', 'genres')
     serializer_class = MovieDetailSerializer
+    etag_models = MOVIE_ETAG_MODELS + (Rating,)
+
+    def get_object(self):
+        movie = super().get_object()
+        paginator = RatingPagination()
+        movie.latest_ratings = paginator.paginate_queryset(
+            movie.ratings.select_related('member'), self.request, self
+        )
+        # detail/<pk>/ 기준 상대 경로 -> detail/<pk>/ratings/
+        movie.ratings_next = paginator.get_next_link(self.request.build_absolute_uri('ratings/'))
+        return movie
 
 
 @method_decorator(name='get', decorator=swagger_auto_schema(
-    operation_summary='Age Booking',
-    operation_description='해당 영화의 나이대별 예매 총합',
+    operation_summary='Movie Rating List',
+    operation_description='해당 영화의 한줄평 목록 (최신순) - keyset pagination, 다음 페이지는 응답의 next URL 사용',
+    manual_parameters=[cursor_query_param],
 ))
-class AgeBookingView(RetrieveAPIView):
-    serializer_class = AgeBookingSerializer
+class RatingListView(ConditionalGetMixin, ListAPIView):
+    serializer_class = RatingsSerializer
+    pagination_class = RatingPagination
+    etag_models = (Rating,)
 
-    def get_object(self):
-        # timedelta를 이용한 계산 변경 검토
-        aggregated_dict = Movie.objects.filter(
-            pk=self.kwargs['pk']
-        ).values(
-            'schedules__reservations__member'
-        ).annotate(
-            teens=Count(
-                'schedules__reservations__member',
-                filter=Q(schedules__reservations__member__birth_date__year__lt=2010) &
-                       Q(schedules__reservations__member__birth_date__year__gt=2000),
-            ),
-            twenties=Count(
-                'schedules__reservations__member',
-                filter=Q(schedules__reservations__member__birth_date__year__lt=2000) &
-                       Q(schedules__reservations__member__birth_date__year__gt=1990),
-            ),
-            thirties=Count(
-                'schedules__reservations__member',
-                filter=Q(schedules__reservations__member__birth_date__year__lt=1990) &
-                       Q(schedules__reservations__member__birth_date__year__gt=1980),
-            ),
-            fourties=Count(
-                'schedules__reservations__member',
-                filter=Q(schedules__reservations__member__birth_date__year__lt=1980) &
-                       Q(schedules__reservations__member__birth_date__year__gt=1970),
-            ),
-            fifties=Count(
-                'schedules__reservations__member',
-                filter=Q(schedules__reservations__member__birth_date__year__lt=1970) &
-                       Q(schedules__reservations__member__birth_date__year__gt=1960),
-            )
-        ).aggregate(
-            Sum('teens'), Sum('twenties'), Sum('thirties'),
-            Sum('fourties'), Sum('fifties')
-        )
+    def get_queryset(self):
+        return Rating.objects.filter(movie=self.kwargs['pk']).select_related('member')
 
-        # 임의로 데이터 수 올림
-        aggregated_dict['teens__sum'] = (aggregated_dict['teens__sum'] + 3) * 9
-        aggregated_dict['twenties__sum'] = (aggregated_dict['twenties__sum'] + 1) * 7
-        aggregated_dict['thirties__sum'] = (aggregated_dict['thirties__sum'] + 5) * 4
-        aggregated_dict['fourties__sum'] = (aggregated_dict['fourties__sum'] + 2) * 9
-        aggregated_dict['fifties__sum'] = (aggregated_dict['fifties__sum'] + 3) * 5
 
-        return aggregated_dict
+# 임의로 데이터 수 올림 - 나이대: (더할 수, 곱할 수)
+AGE_BOOKING_PADDING = {
+    'teens': (3, 9),
+    'twenties': (1, 7),
+    'thirties': (5, 4),
+    'fourties': (2, 9),
+    'fifties': (3, 5),
+}
+
+
+@method_decorator(name='get', decorator=swagger_auto_schema(
+    operation_summary='Age Booking',
+    operation_description='해당 영화의 나이대별(예매 시점 만 나이) 예매 총합',
+))
+class AgeBookingView(ConditionalGetMixin, RetrieveAPIView):
+    serializer_class = AgeBookingSerializer
+    etag_models = (Movie, MovieAgeBooking)
+
+    def retrieve(self, request, *args, **kwargs):
+        counts = get_age_booking(self.kwargs['pk'])
+        if counts is None:
+            raise Http404
+        for band, (add, multiply) in AGE_BOOKING_PADDING.items():
+            if band in counts:
+                counts[band] = (counts[band] + add) * multiply
+        return Response(counts)
 
 
 @method_decorator(name='post', decorator=swagger_auto_schema(
@@ -113,7 +157,9 @@ class RatingCreateView(CreateAPIView):
 
     def perform_create(self, serializer):
         movie = Movie.objects.get(pk=self.kwargs['pk'])
-        serializer.save(member=self.request.user, movie=movie)
+        # 한줄평 통계는 post_save signal에서 같은 트랜잭션으로 갱신
+        with transaction.atomic():
+            serializer.save(member=self.request.user, movie=movie)
 
 
 @method_decorator(name='get', decorator=swagger_auto_schema(
@@ -123,16 +169,9 @@ class RatingCreateView(CreateAPIView):
 class MovieLikeCheckView(APIView):
     permission_classes = [IsAuthenticated, ]
 
-    def get_object(self, pk):
-        try:
-            movie = Movie.objects.get(pk=pk)
-            return MovieLike.objects.get(movie=movie, member=self.request.user)
-        except MovieLike.DoesNotExist:
-            return MovieLike.objects.create(movie=movie, member=self.request.user, liked=False)
-
     def get(self, request, pk):
-        movie_like = self.get_object(pk)
-        movie_like.liked = not movie_like.liked
-        movie_like.save()
+        if not Movie.objects.filter(pk=pk).exists():
+            raise Http404
+        movie_like = toggle_movie_like(pk, request.user.pk)
         serializer = MovieLikeSerializer(movie_like)
         return Response(serializer.data)
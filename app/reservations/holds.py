@@ -0,0 +1,119 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+# 좌석 선점(hold) - (schedule_id, seat_id) 단위로 owner를 기록하고 TTL이 지나면 자동 해제
+# 여러 좌석은 전부 선점하거나 하나도 선점하지 않음 (all-or-nothing)
+
+
+def hold_key(schedule_id, seat_id):
+    return f'seat-hold:{schedule_id}:{seat_id}'
+
+
+class BaseSeatHold:
+    def __init__(self, ttl=None):
+        self.ttl = ttl if ttl is not None else getattr(settings, 'SEAT_HOLD_TTL', 600)
+
+    def acquire(self, schedule_id, seat_ids, owner):
+        raise NotImplementedError
+
+    def release(self, schedule_id, seat_ids, owner):
+        raise NotImplementedError
+
+
+class RedisSeatHold(BaseSeatHold):
+    # 모든 key가 비어있거나 같은 owner일 때만 일괄 SET (Lua script 1회 실행 = 원자적)
+    ACQUIRE_SCRIPT = '''
+        for i, key in ipairs(KEYS) do
+            local holder = redis.call('GET', key)
+            if holder and holder ~= ARGV[1] then
+                return 0
+            end
+        end
+        for i, key in ipairs(KEYS) do
+            redis.call('SET', key, ARGV[1], 'PX', ARGV[2])
+        end
+        return 1
+    '''
+    RELEASE_SCRIPT = '''
+        for i, key in ipairs(KEYS) do
+            if redis.call('GET', key) == ARGV[1] then
+                redis.call('DEL', key)
+            end
+        end
+        return 1
+    '''
+
+    def __init__(self, ttl=None, url=None):
+        import redis
+
+        super().__init__(ttl)
+        self.client = redis.Redis.from_url(url or settings.SEAT_HOLD_REDIS_URL)
+        self.acquire_script = self.client.register_script(self.ACQUIRE_SCRIPT)
+        self.release_script = self.client.register_script(self.RELEASE_SCRIPT)
+
+    def acquire(self, schedule_id, seat_ids, owner):
+        keys = [hold_key(schedule_id, seat_id) for seat_id in seat_ids]
+        return bool(self.acquire_script(keys=keys, args=[str(owner), int(self.ttl * 1000)]))
+
+    def release(self, schedule_id, seat_ids, owner):
+        keys = [hold_key(schedule_id, seat_id) for seat_id in seat_ids]
+        if keys:
+            self.release_script(keys=keys, args=[str(owner)])
+
+
+class InMemorySeatHold(BaseSeatHold):
+    # 테스트/로컬 개발용 - 프로세스 내부에서만 유효
+    def __init__(self, ttl=None):
+        super().__init__(ttl)
+        self.lock = threading.Lock()
+        self.holds = {}
+
+    def acquire(self, schedule_id, seat_ids, owner):
+        keys = [hold_key(schedule_id, seat_id) for seat_id in seat_ids]
+        owner = str(owner)
+        now = time.monotonic()
+        with self.lock:
+            for key in keys:
+                holder, expires_at = self.holds.get(key, (None, 0))
+                if holder is not None and holder != owner and expires_at > now:
+                    return False
+            for key in keys:
+                self.holds[key] = (owner, now + self.ttl)
+        return True
+
+    def clear(self):
+        with self.lock:
+            self.holds.clear()
+
+    def release(self, schedule_id, seat_ids, owner):
+        owner = str(owner)
+        with self.lock:
+            for seat_id in seat_ids:
+                key = hold_key(schedule_id, seat_id)
+                if self.holds.get(key, (None, 0))[0] == owner:
+                    del self.holds[key]
+
+
+_seat_hold = None
+_seat_hold_lock = threading.Lock()
+
+
+def get_seat_hold():
+    global _seat_hold
+    if _seat_hold is None:
+        with _seat_hold_lock:
+            if _seat_hold is None:
+                _seat_hold = import_string(settings.SEAT_HOLD_BACKEND)()
+    return _seat_hold
+
+
+@receiver(setting_changed)
+def reset_seat_hold(setting, **kwargs):
+    global _seat_hold
+    if setting.startswith('SEAT_HOLD_'):
+        _seat_hold = None
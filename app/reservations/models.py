@@ -1,12 +1,17 @@
 import random
 from datetime import datetime
 
-from django.db import models
-from django.db.models.signals import post_save
+from django.db import models, transaction
+from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from django.utils.crypto import get_random_string
 
 from config.settings._base import AUTH_USER_MODEL
+from theaters.models import ScheduleSeatMap
+from theaters.occupancy import release_seats
+from theaters.seat_events import publish_seat_event, RELEASED
+from theaters.seat_maps import is_seat_map_mode
+from .holds import get_seat_hold
 
 
 class Reservation(models.Model):
@@ -74,3 +79,32 @@ def set_payment_code(sender, instance, created, **kwargs):
         random_number = random.randint(1000, 9999)
         instance.code = f'{date}-{random_string}-{str(random_number)}'
         instance.save()
+
+
+@receiver(pre_delete, sender=Reservation)
+def release_seat_map(sender, instance, **kwargs):
+    # 예매 삭제(직접 삭제, 결제 취소, 미결제 자동 삭제) 시 좌석 배치의 예약 bit 해제
+    if not is_seat_map_mode():
+        return
+    schedule_seat_map = ScheduleSeatMap.objects.select_for_update().filter(schedule_id=instance.schedule_id).first()
+    if schedule_seat_map is None:
+        return
+    seat_map = schedule_seat_map.get_seat_map()
+    seat_map.release(instance.seat_grades.values_list('seat__name', flat=True))
+    schedule_seat_map.set_seat_map(seat_map)
+    schedule_seat_map.save(update_fields=['states'])
+
+
+@receiver(pre_delete, sender=Reservation)
+def release_reserved_seats(sender, instance, **kwargs):
+    # 삭제 트랜잭션 안에서 실행 - 결제 전 예매였다면 held_seats도 함께 차감
+    seats = list(instance.seat_grades.values_list('seat_id', 'seat__name'))
+    seat_ids = [seat_id for seat_id, _ in seats]
+    release_seats(instance.schedule_id, len(seat_ids), held=instance.payment_id is None)
+    publish_seat_event(instance.schedule_id, RELEASED, [seat_name for _, seat_name in seats])
+
+    # 좌석 선점은 삭제가 커밋된 뒤에 해제
+    if instance.member_id is not None:
+        transaction.on_commit(
+            lambda: get_seat_hold().release(instance.schedule_id, seat_ids, instance.member_id)
+        )
@@ -1,17 +1,23 @@
+from collections import Counter
+
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from rest_framework.generics import get_object_or_404
 
-from theaters.models import SeatGrade, Schedule, Seat, SeatType
-from utils.custom_functions import (
-    verify_receipt_from_bootpay_server, cancel_payment_from_bootpay_server,
-    calculate_seat_price
-)
+from theaters.models import SeatGrade, Schedule, SeatType, ScheduleSeatMap
+from theaters.occupancy import hold_seats, confirm_seats
+from theaters.seat_catalog import get_seat_catalog
+from theaters.seat_events import publish_seat_event, RESERVED
+from theaters.seat_maps import is_seat_map_mode, SIT_APART
+from utils.custom_functions import verify_receipt_from_bootpay_server, cancel_payment_from_bootpay_server
 from utils.excepts import (
     TakenSeatException, InvalidGradeChoicesException, InvalidSeatException, PaymentIdReceiptIdNotMatchingException,
     ReservationOwnershipException, InvalidScheduleIdException, InvalidSeatIdException, PriceNotMatchingException,
-    IncorrectPriceExceptionException
+    IncorrectPriceExceptionException, GradeSeatCountMismatchException
 )
+from utils.pricing import PRICING
+from .holds import get_seat_hold
 from .models import Reservation, Payment
 
 
@@ -29,10 +35,8 @@ class SeatGradeDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_price(self, obj):
-        return calculate_seat_price(
-            screen_type=obj.reservation.schedule.screen.screen_type,
-            grade=obj.grade,
-        )
+        schedule = obj.reservation.schedule
+        return PRICING.price(schedule.screen.screen_type, obj.grade, schedule.start_time)
 
 
 class ReservationDetailSerializer(serializers.ModelSerializer):
@@ -67,44 +71,108 @@ class ReservationCreateSerializer(serializers.Serializer):
                 raise InvalidGradeChoicesException
         return grades
 
+    def get_hold_owner(self):
+        return self.context['request'].user.pk
+
     def validate(self, data):
+        # 좌석마다 등급이 하나씩 - 선점 전에 확인
+        if len(data['grades']) != len(data['seat_ids']):
+            raise GradeSeatCountMismatchException
+
+        # 좌석 선점 - 다른 회원이 선점 중인 좌석이면 DB 조회 없이 실패
+        seat_hold = get_seat_hold()
+        if not seat_hold.acquire(data['schedule_id'], data['seat_ids'], self.get_hold_owner()):
+            raise TakenSeatException
+        try:
+            return self.validate_seats(data)
+        except Exception:
+            seat_hold.release(data['schedule_id'], data['seat_ids'], self.get_hold_owner())
+            raise
+
+    def validate_seats(self, data):
+        if is_seat_map_mode():
+            try:
+                seat_map = ScheduleSeatMap.objects.get(schedule_id=data['schedule_id']).get_seat_map()
+            except ObjectDoesNotExist:
+                raise InvalidScheduleIdException
+            data['seat_names'] = self.validate_seat_map(seat_map, data['seat_ids'])
+            return data
+
+        # 해당 스케쥴의 좌석인지 + 띄어앉기석인지 확인 (이미 예약된 좌석은 create에서 DB unique 제약으로 확인)
+        seat_types = dict(SeatType.objects.filter(
+            schedule_id=data['schedule_id'], seat_id__in=data['seat_ids']
+        ).values_list('seat_id', 'type'))
+        if not seat_types and not Schedule.objects.filter(pk=data['schedule_id']).exists():
+            raise InvalidScheduleIdException
+        if any(seat_id not in seat_types for seat_id in data['seat_ids']):
+            raise InvalidSeatIdException
+        if any(seat_type == 'sit_apart' for seat_type in seat_types.values()):
+            raise InvalidSeatException
+        seat_names = get_seat_catalog().names(data['seat_ids'])
+        data['seat_names'] = [seat_names[seat_id] for seat_id in data['seat_ids']]
+        return data
+
+    def validate_seat_map(self, seat_map, seat_ids):
+        seat_names_dict = get_seat_catalog().names(seat_ids)
+        seat_names = []
+        for seat_id in seat_ids:
+            seat_name = seat_names_dict.get(seat_id)
+            if seat_name not in seat_map.index:
+                raise InvalidSeatIdException
+            seat_names.append(seat_name)
+
         # 이미 예약된 좌석인지 확인
-        reservations = Reservation.objects.filter(schedule_id=data['schedule_id'])
-        if reservations.exists():
-            if reservations.filter(seat_grades__seat__id__in=data['seat_ids']).exists():
-                raise TakenSeatException
+        if any(seat_map.is_reserved(seat_name) for seat_name in seat_names):
+            raise TakenSeatException
 
         # 띄어앉기석인지 확인
-        if SeatType.objects.filter(
-                schedule_id=data['schedule_id'], seat_id__in=data['seat_ids'], type='sit_apart'
-        ).exists():
+        if any(seat_map.kind(seat_name) == SIT_APART for seat_name in seat_names):
             raise InvalidSeatException
-        return data
+        return seat_names
 
     def create(self, validated_data):
         try:
-            schedule = Schedule.objects.get(pk=validated_data.get('schedule_id'))
-        except ObjectDoesNotExist:
-            raise InvalidScheduleIdException
-
-        reservation = Reservation.objects.create(schedule=schedule)
-
-        zipped_list = list(zip(validated_data['grades'], validated_data['seat_ids']))
+            return self.create_reservation(validated_data)
+        except Exception:
+            get_seat_hold().release(validated_data['schedule_id'], validated_data['seat_ids'], self.get_hold_owner())
+            raise
 
-        for _tuple in zipped_list:
-            grade = _tuple[0]
-            seat_id = _tuple[1]
-            try:
-                seat = Seat.objects.get(pk=seat_id)
-            except ObjectDoesNotExist:
-                raise InvalidSeatIdException
-            SeatGrade.objects.create(
-                grade=grade,
-                reservation=reservation,
-                seat=seat,
-            )
+    def create_reservation(self, validated_data):
+        schedule_id = validated_data['schedule_id']
+        try:
+            with transaction.atomic():
+                if is_seat_map_mode():
+                    self.reserve_seat_map(schedule_id, validated_data)
+
+                reservation = Reservation.objects.create(
+                    schedule_id=schedule_id,
+                    member=validated_data.get('member'),
+                )
+                # (schedule, seat) unique 제약 - 이미 예약된 좌석이면 IntegrityError
+                seat_grades = SeatGrade.objects.bulk_create([
+                    SeatGrade(
+                        grade=grade,
+                        seat_id=seat_id,
+                        schedule_id=schedule_id,
+                        reservation=reservation,
+                    )
+                    for grade, seat_id in zip(validated_data['grades'], validated_data['seat_ids'])
+                ])
+                hold_seats(schedule_id, len(seat_grades))
+                publish_seat_event(schedule_id, RESERVED, validated_data['seat_names'])
+        except IntegrityError:
+            raise TakenSeatException
         return reservation
 
+    def reserve_seat_map(self, schedule_id, validated_data):
+        # 좌석 배치 row lock 후 재확인
+        schedule_seat_map = ScheduleSeatMap.objects.select_for_update().get(schedule_id=schedule_id)
+        seat_map = schedule_seat_map.get_seat_map()
+        self.validate_seat_map(seat_map, validated_data['seat_ids'])
+        seat_map.reserve(validated_data['seat_names'])
+        schedule_seat_map.set_seat_map(seat_map)
+        schedule_seat_map.save(update_fields=['states'])
+
     def to_representation(self, instance):
         return ReservationDetailSerializer(instance).data
 
@@ -156,12 +224,12 @@ class PaymentCreateSerializer(serializers.Serializer):
         discount_price = data['discount_price']
 
         # 실제 결제해야하는 금액과 결제된 금액 확인
-        target_price = 0
-        reservation = Reservation.objects.get(pk=data['reservation_id'])
-        screen_type = reservation.schedule.screen.screen_type
-        grade_list = reservation.seat_grades.values('grade')
-        for grade_dict in grade_list:
-            target_price += calculate_seat_price(screen_type, grade_dict['grade'])
+        reservation = Reservation.objects.select_related('schedule__screen').get(pk=data['reservation_id'])
+        target_price = PRICING.total(
+            reservation.schedule.screen.screen_type,
+            Counter(reservation.seat_grades.values_list('grade', flat=True)),
+            reservation.schedule.start_time,
+        )
 
         if target_price != price + discount_price:
             raise IncorrectPriceExceptionException
@@ -178,10 +246,12 @@ class PaymentCreateSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         reservation_id = validated_data.pop('reservation_id')
-        payment = Payment.objects.create(**validated_data)
-        reservation = Reservation.objects.get(pk=reservation_id)
-        reservation.payment = payment
-        reservation.save()
+        with transaction.atomic():
+            payment = Payment.objects.create(**validated_data)
+            reservation = Reservation.objects.get(pk=reservation_id)
+            reservation.payment = payment
+            reservation.save()
+            confirm_seats(reservation.schedule_id, reservation.seat_grades.count())
         return payment
 
     def to_representation(self, instance):
@@ -0,0 +1,130 @@
+import random
+import threading
+import time
+from unittest import skipUnless
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from reservations.holds import InMemorySeatHold, RedisSeatHold, get_seat_hold
+from test_utils.fixtures import create_seats
+from utils.excepts import TakenSeatException
+
+
+def redis_available():
+    try:
+        import redis
+        return redis.Redis.from_url(settings.SEAT_HOLD_REDIS_URL, socket_connect_timeout=0.5).ping()
+    except Exception:
+        return False
+
+
+class SeatHoldStressMixin:
+    buyers = 64
+    seats = 24
+    rounds = 5
+
+    def get_seat_hold(self):
+        raise NotImplementedError
+
+    def run_round(self, seat_hold, schedule_id):
+        winners = {}
+        barrier = threading.Barrier(self.buyers)
+
+        def buy(owner):
+            rng = random.Random(schedule_id * 1000 + owner)
+            seat_ids = rng.sample(range(self.seats), rng.randint(1, 4))
+            barrier.wait()
+            if seat_hold.acquire(schedule_id, seat_ids, owner):
+                winners[owner] = seat_ids
+
+        threads = [threading.Thread(target=buy, args=(owner,)) for owner in range(self.buyers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return winners
+
+    def test_no_double_booking(self):
+        seat_hold = self.get_seat_hold()
+        for schedule_id in range(1, self.rounds + 1):
+            winners = self.run_round(seat_hold, schedule_id)
+            held_seats = [seat_id for seat_ids in winners.values() for seat_id in seat_ids]
+
+            self.assertTrue(winners)
+            self.assertEqual(len(held_seats), len(set(held_seats)))
+
+            for owner, seat_ids in winners.items():
+                seat_hold.release(schedule_id, seat_ids, owner)
+
+    def test_all_or_nothing(self):
+        seat_hold = self.get_seat_hold()
+        self.assertTrue(seat_hold.acquire(100, [1, 2], 'a'))
+        self.assertFalse(seat_hold.acquire(100, [3, 2], 'b'))
+        # 실패한 요청의 좌석(3)은 선점되지 않음
+        self.assertTrue(seat_hold.acquire(100, [3], 'c'))
+
+        seat_hold.release(100, [1, 2], 'b')
+        self.assertFalse(seat_hold.acquire(100, [1], 'c'))
+        seat_hold.release(100, [1, 2], 'a')
+        self.assertTrue(seat_hold.acquire(100, [1, 2], 'c'))
+        seat_hold.release(100, [1, 2, 3], 'c')
+
+
+class InMemorySeatHoldTest(SeatHoldStressMixin, SimpleTestCase):
+    def get_seat_hold(self):
+        return InMemorySeatHold()
+
+    def test_expire(self):
+        seat_hold = InMemorySeatHold(ttl=0.05)
+        self.assertTrue(seat_hold.acquire(1, [1], 'a'))
+        self.assertFalse(seat_hold.acquire(1, [1], 'b'))
+        time.sleep(0.1)
+        self.assertTrue(seat_hold.acquire(1, [1], 'b'))
+
+
+@skipUnless(redis_available(), 'Redis 서버 필요')
+class RedisSeatHoldTest(SeatHoldStressMixin, SimpleTestCase):
+    def get_seat_hold(self):
+        seat_hold = RedisSeatHold(ttl=5)
+        keys = seat_hold.client.keys('seat-hold:*')
+        if keys:
+            seat_hold.client.delete(*keys)
+        return seat_hold
+
+
+@override_settings(SEAT_HOLD_BACKEND='reservations.holds.InMemorySeatHold')
+class ReservationSeatHoldTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seat_ids = create_seats()
+        cls.schedule = baker.make('theaters.Schedule', screen__seats_type='2')
+        cls.members = [
+            baker.make('members.Member', mobile='010-1111-2222'),
+            baker.make('members.Member', mobile='010-3333-4444'),
+        ]
+
+    def setUp(self):
+        get_seat_hold().clear()
+
+    def reserve(self, member, seat_names):
+        self.client.force_authenticate(member)
+        return self.client.post('/reservations/', {
+            'schedule_id': self.schedule.id,
+            'grades': ['adult'] * len(seat_names),
+            'seat_ids': [self.seat_ids[name] for name in seat_names],
+        })
+
+    def test_held_seat(self):
+        first, second = self.members
+        self.assertEqual(self.reserve(first, ['A2', 'A3']).status_code, 201)
+
+        # 선점 중인 좌석은 DB 조회 없이 실패
+        with self.assertNumQueries(0):
+            response = self.reserve(second, ['A3', 'A5'])
+        self.assertEqual(response.data['detail'].code, TakenSeatException.default_code)
+
+        # 실패한 요청은 선점하지 않음
+        self.assertEqual(self.reserve(second, ['A5']).status_code, 201)
@@ -0,0 +1,91 @@
+from django.db import IntegrityError, transaction
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from reservations.holds import get_seat_hold
+from reservations.models import Reservation
+from test_utils.fixtures import create_seats
+from test_utils.transactions import capture_on_commit_callbacks
+from theaters.models import Seat, SeatGrade, ScheduleOccupancy
+from utils.excepts import TakenSeatException, InvalidSeatIdException, InvalidSeatException, \
+    InvalidScheduleIdException, GradeSeatCountMismatchException
+
+
+@override_settings(SEAT_HOLD_BACKEND='reservations.holds.InMemorySeatHold')
+class ReservationCreateTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seat_ids = create_seats()
+        cls.member = baker.make('members.Member', mobile='010-1111-2222')
+        cls.schedule = baker.make('theaters.Schedule', screen__seats_type='2')
+
+    def setUp(self):
+        get_seat_hold().clear()
+        self.client.force_authenticate(self.member)
+
+    def reserve(self, seat_ids, schedule_id=None):
+        return self.client.post('/reservations/', {
+            'schedule_id': schedule_id or self.schedule.id,
+            'grades': ['adult'] * len(seat_ids),
+            'seat_ids': seat_ids,
+        })
+
+    def test_create(self):
+        response = self.reserve([self.seat_ids['A2'], self.seat_ids['A3']])
+        self.assertEqual(response.status_code, 201)
+
+        reservation = Reservation.objects.get(pk=response.data['reservation_id'])
+        self.assertEqual(reservation.member, self.member)
+        self.assertEqual(
+            set(reservation.seat_grades.values_list('schedule_id', flat=True)), {self.schedule.id}
+        )
+
+    def test_unique_schedule_seat(self):
+        self.reserve([self.seat_ids['A2']])
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            SeatGrade.objects.create(
+                grade='adult',
+                seat_id=self.seat_ids['A2'],
+                schedule=self.schedule,
+                reservation=baker.make('reservations.Reservation', schedule=self.schedule),
+            )
+
+    def test_taken_seat(self):
+        # 같은 회원의 선점은 통과하므로 DB unique 제약으로 막힘 - 예약 전체가 롤백되어야 함
+        self.reserve([self.seat_ids['A2']])
+        response = self.reserve([self.seat_ids['A3'], self.seat_ids['A2']])
+        self.assertEqual(response.data['detail'].code, TakenSeatException.default_code)
+        self.assertEqual(Reservation.objects.count(), 1)
+        self.assertEqual(SeatGrade.objects.count(), 1)
+        self.assertEqual(ScheduleOccupancy.objects.get(schedule=self.schedule).reserved_seats, 1)
+
+        # 실패한 요청의 선점은 해제됨
+        self.assertEqual(self.reserve([self.seat_ids['A3']]).status_code, 201)
+
+    def test_invalid_seats(self):
+        # 좌석 목록에는 있지만 스케쥴 좌석이 아닌 ID
+        with capture_on_commit_callbacks(execute=True):
+            other_seat_id = Seat.objects.create(name='Z99').id
+        response = self.reserve([self.seat_ids['A2'], other_seat_id])
+        self.assertEqual(response.data['detail'].code, InvalidSeatIdException.default_code)
+
+        response = self.reserve([self.seat_ids['A1']])
+        self.assertEqual(response.data['detail'].code, InvalidSeatException.default_code)
+
+        response = self.reserve([self.seat_ids['A2']], schedule_id=self.schedule.id + 100)
+        self.assertEqual(response.data['detail'].code, InvalidScheduleIdException.default_code)
+        self.assertFalse(Reservation.objects.exists())
+
+    def test_grade_seat_count_mismatch(self):
+        response = self.client.post('/reservations/', {
+            'schedule_id': self.schedule.id,
+            'grades': ['adult'],
+            'seat_ids': [self.seat_ids['A2'], self.seat_ids['A3']],
+        })
+        self.assertEqual(response.data['detail'].code, GradeSeatCountMismatchException.default_code)
+        self.assertFalse(Reservation.objects.exists())
+
+        # 선점하지 않았으므로 다른 회원도 바로 예약 가능
+        self.client.force_authenticate(baker.make('members.Member', mobile='010-3333-4444'))
+        self.assertEqual(self.reserve([self.seat_ids['A2'], self.seat_ids['A3']]).status_code, 201)
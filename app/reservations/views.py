@@ -24,9 +24,7 @@ class ReservationCreateView(CreateAPIView):
     permission_classes = [IsAuthenticated, ]
 
     def perform_create(self, serializer):
-        instance = serializer.save()
-        instance.member = self.request.user
-        instance.save()
+        serializer.save(member=self.request.user)
 
 
 @method_decorator(name='delete', decorator=swagger_auto_schema(
@@ -0,0 +1,11 @@
+from theaters.models import Seat
+from theaters.seat_catalog import invalidate_seat_catalog
+from utils.business_data import SEATING_CHART_GENERAL
+
+
+def create_seats(seats_type='2'):
+    # 좌석 배치 타입의 좌석 row 생성 (setUpTestData용) - {좌석 이름: id}
+    Seat.objects.bulk_create([Seat(name=name) for name in SEATING_CHART_GENERAL[seats_type]])
+    # 테스트 트랜잭션은 커밋되지 않아 on_commit 무효화가 실행되지 않으므로 직접 무효화
+    invalidate_seat_catalog()
+    return dict(Seat.objects.values_list('name', 'id'))
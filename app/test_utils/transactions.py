@@ -0,0 +1,18 @@
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@contextmanager
+def capture_on_commit_callbacks(using=DEFAULT_DB_ALIAS, execute=False):
+    # TestCase는 커밋하지 않으므로 블록 안에서 등록된 transaction.on_commit 콜백을 모아서 반환 (execute면 블록 끝에서 실행)
+    # Django 3.2 TestCase.captureOnCommitCallbacks와 동일
+    callbacks = []
+    start_count = len(connections[using].run_on_commit)
+    try:
+        yield callbacks
+    finally:
+        callbacks[:] = [callback for _, callback in connections[using].run_on_commit[start_count:]]
+        if execute:
+            for callback in callbacks:
+                callback()
@@ -0,0 +1,112 @@
+import heapq
+import math
+from collections import namedtuple
+
+from utils.cache_versions import LocalVersionedValue
+
+# 가까운 상영관 검색 - 위도/경도를 단위 구 위의 3차원 좌표(x, y, z)로 바꿔 k-d tree에 저장
+# 3차원 직선 거리(chord)는 구면 거리와 순서가 같으므로 유클리드 거리로 검색하고 응답 시에만 km로 변환
+
+EARTH_RADIUS_KM = 6371.0088
+
+NearbyTheater = namedtuple('NearbyTheater', ['theater_id', 'name', 'region_id', 'region', 'latitude', 'longitude'])
+
+
+def to_xyz(latitude, longitude):
+    latitude, longitude = math.radians(latitude), math.radians(longitude)
+    cos_latitude = math.cos(latitude)
+    return cos_latitude * math.cos(longitude), cos_latitude * math.sin(longitude), math.sin(latitude)
+
+
+def chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+class KDNode:
+    __slots__ = ('xyz', 'item', 'axis', 'left', 'right')
+
+    def __init__(self, xyz, item, axis, left, right):
+        self.xyz = xyz
+        self.item = item
+        self.axis = axis
+        self.left = left
+        self.right = right
+
+
+class KDTree:
+    def __init__(self, points):
+        # points: [(xyz, item), ...]
+        self.size = len(points)
+        self.root = self.build(list(points), 0)
+
+    def build(self, points, depth):
+        if not points:
+            return None
+        axis = depth % 3
+        points.sort(key=lambda point: point[0][axis])
+        median = len(points) // 2
+        xyz, item = points[median]
+        return KDNode(
+            xyz, item, axis,
+            self.build(points[:median], depth + 1),
+            self.build(points[median + 1:], depth + 1),
+        )
+
+    def nearest(self, xyz, k, accept=None):
+        # 가까운 순 [(chord 거리, item), ...] - accept(item)이 False인 item은 제외
+        # heap: 지금까지 찾은 k개 중 가장 먼 것이 맨 앞 (거리 부호 반전)
+        heap = []
+        counter = 0
+        # (분할 평면까지 거리의 제곱 - subtree의 최소 거리, node)
+        stack = [(0.0, self.root)]
+        while stack:
+            bound, node = stack.pop()
+            if node is None or (len(heap) == k and bound >= -heap[0][0]):
+                continue
+
+            distance_squared = sum((a - b) ** 2 for a, b in zip(xyz, node.xyz))
+            if accept is None or accept(node.item):
+                counter += 1
+                if len(heap) < k:
+                    heapq.heappush(heap, (-distance_squared, counter, node.item))
+                elif distance_squared < -heap[0][0]:
+                    heapq.heapreplace(heap, (-distance_squared, counter, node.item))
+
+            # 가까운 쪽 subtree를 먼저 탐색 (stack이라 나중에 넣음)
+            diff = xyz[node.axis] - node.xyz[node.axis]
+            near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+            stack.append((max(bound, diff * diff), far))
+            stack.append((bound, near))
+
+        return [(math.sqrt(-distance_squared), item) for distance_squared, _, item in sorted(heap, reverse=True)]
+
+
+def build_theater_index():
+    from .models import Theater
+
+    theaters = Theater.objects.filter(
+        latitude__isnull=False,
+        longitude__isnull=False,
+    ).values_list('id', 'name', 'region_id', 'region__name', 'latitude', 'longitude')
+    return KDTree([(to_xyz(theater[4], theater[5]), NearbyTheater(*theater)) for theater in theaters])
+
+
+# 프로세스별로 1번 만들어 보관 - Theater/Region 변경 시 공유 캐시의 버전을 올려 모든 프로세스가 다시 만듦
+_theater_index = LocalVersionedValue('theater-index', build_theater_index)
+
+
+def get_theater_index():
+    return _theater_index.get()
+
+
+def refresh_theater_index():
+    _theater_index.invalidate()
+
+
+def nearest_theaters(latitude, longitude, k, theater_ids=None):
+    # [(km, NearbyTheater), ...] - theater_ids가 있으면 해당 상영관 중에서만 검색
+    accept = None if theater_ids is None else (lambda theater: theater.theater_id in theater_ids)
+    return [
+        (chord_to_km(chord), theater)
+        for chord, theater in get_theater_index().nearest(to_xyz(latitude, longitude), k, accept)
+    ]
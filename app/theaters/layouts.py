@@ -0,0 +1,141 @@
+import hashlib
+import json
+import re
+import threading
+from collections import namedtuple
+
+from django.core.cache import cache
+
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART_SET
+
+# seats_type별 좌석 배치도 - import 시 1번만 계산하는 불변(namedtuple/tuple) 구조
+# x: 열 번호 - 1 (통로 포함 격자 좌표), y: 행 순서 (스크린에서 가까운 행이 0)
+
+LayoutSeat = namedtuple('LayoutSeat', ['name', 'row', 'column', 'x', 'y', 'apart'])
+LayoutRow = namedtuple('LayoutRow', ['name', 'y', 'first_column', 'last_column', 'gaps'])
+SeatLayout = namedtuple('SeatLayout', ['seats_type', 'rows', 'columns', 'aisles', 'seats'])
+
+SEAT_NAME_PATTERN = re.compile(r'^([A-Z]+)(\d+)$')
+
+
+def split_seat_name(name):
+    row, column = SEAT_NAME_PATTERN.match(name).groups()
+    return row, int(column)
+
+
+def compile_layout(seats_type, seat_names, apart_seats_set):
+    positions = [(name,) + split_seat_name(name) for name in seat_names]
+    row_names = sorted({row for _, row, _ in positions}, key=lambda row: (len(row), row))
+    row_y = {row: y for y, row in enumerate(row_names)}
+
+    columns_by_row = {row: set() for row in row_names}
+    for _, row, column in positions:
+        columns_by_row[row].add(column)
+
+    rows = []
+    for row in row_names:
+        columns = columns_by_row[row]
+        first_column, last_column = min(columns), max(columns)
+        gaps = tuple(column for column in range(first_column, last_column + 1) if column not in columns)
+        rows.append(LayoutRow(row, row_y[row], first_column, last_column, gaps))
+
+    # 통로: 해당 열을 지나는 행의 절반 이상에서 비어 있는 열
+    aisles = []
+    for column in range(1, max(row.last_column for row in rows) + 1):
+        spanning_rows = [row for row in rows if row.first_column < column < row.last_column]
+        if spanning_rows and sum(column in row.gaps for row in spanning_rows) * 2 >= len(spanning_rows):
+            aisles.append(column)
+
+    seats = tuple(
+        LayoutSeat(name, row, column, column - 1, row_y[row], name in apart_seats_set)
+        for name, row, column in positions
+    )
+    return SeatLayout(
+        seats_type=seats_type,
+        rows=tuple(rows),
+        columns=max(row.last_column for row in rows),
+        aisles=tuple(aisles),
+        seats=seats,
+    )
+
+
+SEAT_LAYOUTS = {
+    seats_type: compile_layout(seats_type, seat_names, SEATING_CHART_APART_SET.get(seats_type, frozenset()))
+    for seats_type, seat_names in SEATING_CHART_GENERAL.items()
+}
+
+
+def layout_to_dict(layout, seat_ids):
+    return {
+        'seats_type': layout.seats_type,
+        'columns': layout.columns,
+        'aisles': list(layout.aisles),
+        'rows': [
+            {
+                'name': row.name,
+                'y': row.y,
+                'first_column': row.first_column,
+                'last_column': row.last_column,
+                'gaps': list(row.gaps),
+            }
+            for row in layout.rows
+        ],
+        'seats': [
+            {
+                'seat_id': seat_ids.get(seat.name),
+                'name': seat.name,
+                'row': seat.row,
+                'column': seat.column,
+                'x': seat.x,
+                'y': seat.y,
+                'sit_apart': seat.apart,
+            }
+            for seat in layout.seats
+        ],
+    }
+
+
+def render_layout(layout, seat_ids):
+    # (응답 body, strong ETag) - 내용이 같으면 항상 같은 ETag
+    body = json.dumps(layout_to_dict(layout, seat_ids), ensure_ascii=False, separators=(',', ':')).encode()
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+# 좌석 ID가 포함된 응답은 첫 요청 시 1번만 만들어 프로세스에 보관 (좌석 목록이 바뀌면 다시 생성)
+_rendered_layouts = {}
+_rendered_layouts_lock = threading.Lock()
+
+
+def get_rendered_layout(seats_type):
+    from .seat_catalog import get_seat_catalog
+
+    catalog = get_seat_catalog()
+    rendered = _rendered_layouts.get(seats_type)
+    if rendered is None or rendered[0] is not catalog:
+        layout = SEAT_LAYOUTS[seats_type]
+        rendered = (catalog, render_layout(layout, catalog.ids(seat.name for seat in layout.seats)))
+        with _rendered_layouts_lock:
+            _rendered_layouts[seats_type] = rendered
+    return rendered[1]
+
+
+def reset_rendered_layouts():
+    with _rendered_layouts_lock:
+        _rendered_layouts.clear()
+
+
+def screen_seats_type_key(screen_id):
+    return f'screen-seats-type:{screen_id}'
+
+
+def get_screen_seats_type(screen_id):
+    # 스크린별 seats_type - 공유 캐시에 보관해 DB 조회 없이 ETag 비교 (Screen 변경 시 삭제)
+    from .models import Screen
+
+    key = screen_seats_type_key(screen_id)
+    seats_type = cache.get(key)
+    if seats_type is None:
+        seats_type = Screen.objects.filter(pk=screen_id).values_list('seats_type', flat=True).first()
+        if seats_type is not None:
+            cache.set(key, seats_type, None)
+    return seats_type
@@ -0,0 +1,109 @@
+import datetime
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+
+from movies.models import Movie
+from theaters.models import Region, Theater, Screen, Schedule, Seat, SeatType, create_seats, create_seat_types
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+
+
+def legacy_create_seats(schedule):
+    # 변경 전 create_seats: 좌석마다 Seat 조회 1회 + SeatType insert 1회
+    type_number = schedule.screen.seats_type
+    general_seats_list = SEATING_CHART_GENERAL.get(type_number)
+    apart_seats_list = SEATING_CHART_APART.get(type_number)
+
+    if general_seats_list is not None:
+        for seat in general_seats_list:
+            seat_instance = Seat.objects.get(name=seat)
+
+            seat_type = 'sit_apart' if seat in apart_seats_list else 'general'
+
+            SeatType.objects.create(
+                seat=seat_instance,
+                schedule=schedule,
+                type=seat_type,
+            )
+
+
+class Command(BaseCommand):
+    help = 'seats_type별 좌석 생성(create_seats) 쿼리 수와 소요 시간 비교 (변경 전/후) - DB 변경사항은 모두 롤백'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='seats_type별 반복 횟수')
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+
+        post_save.disconnect(create_seats, sender=Schedule)
+        try:
+            with transaction.atomic():
+                results = self.run_benchmark(repeat)
+                transaction.set_rollback(True)
+        finally:
+            post_save.connect(create_seats, sender=Schedule)
+
+        self.stdout.write(
+            f'{"seats_type":>10} {"seats":>6} {"queries(before)":>16} {"queries(after)":>15} '
+            f'{"ms(before)":>11} {"ms(after)":>10}'
+        )
+        for row in results:
+            self.stdout.write(
+                f'{row["seats_type"]:>10} {row["seats"]:>6} {row["before_queries"]:>16} {row["after_queries"]:>15} '
+                f'{row["before_ms"]:>11.2f} {row["after_ms"]:>10.2f}'
+            )
+
+    def run_benchmark(self, repeat):
+        all_seat_names = set()
+        for general_seats_list in SEATING_CHART_GENERAL.values():
+            all_seat_names.update(general_seats_list)
+        existing_seat_names = set(Seat.objects.filter(name__in=all_seat_names).values_list('name', flat=True))
+        Seat.objects.bulk_create([Seat(name=name) for name in all_seat_names - existing_seat_names])
+
+        region = Region.objects.create(name='benchmark')
+        theater = Theater.objects.create(name='benchmark', region=region)
+        movie = Movie.objects.create(
+            name_kor='benchmark',
+            name_eng='benchmark',
+            code=0,
+            running_time=datetime.timedelta(minutes=120),
+            rank=(Movie.objects.order_by('-rank').values_list('rank', flat=True).first() or 0) + 1,
+            acc_audience=0,
+            reservation_rate=0,
+            open_date=datetime.date.today(),
+            grade='all',
+        )
+
+        results = []
+        for seats_type in SEATING_CHART_GENERAL:
+            screen = Screen.objects.create(name='benchmark', theater=theater, seats_type=seats_type)
+            schedule = Schedule.objects.create(movie=movie, screen=screen, start_time=datetime.datetime.now())
+
+            before_queries, before_ms = self.measure(legacy_create_seats, schedule, repeat)
+            after_queries, after_ms = self.measure(lambda s: create_seat_types([s]), schedule, repeat)
+
+            results.append({
+                'seats_type': seats_type,
+                'seats': len(SEATING_CHART_GENERAL[seats_type]),
+                'before_queries': before_queries,
+                'after_queries': after_queries,
+                'before_ms': before_ms,
+                'after_ms': after_ms,
+            })
+        return results
+
+    def measure(self, func, schedule, repeat):
+        elapsed = 0
+        queries = 0
+        for _ in range(repeat):
+            SeatType.objects.filter(schedule=schedule).delete()
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                func(schedule)
+                elapsed += time.perf_counter() - start
+            queries = len(context.captured_queries)
+        return queries, elapsed / repeat * 1000
@@ -0,0 +1,35 @@
+import random
+import time
+
+from django.core.management import BaseCommand
+
+from theaters.recommend import SEAT_GRIDS, MAX_PARTY_SIZE, recommend_seats
+
+
+class Command(BaseCommand):
+    help = '연속 좌석 추천(recommend_seats) 1회 소요 시간 측정 - 예약률별 / 인원 수별 (DB 사용 안 함)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seats-type', default='1')
+        parser.add_argument('--repeat', type=int, default=2000, help='조합별 반복 횟수')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        seats_type = options['seats_type']
+        grid = SEAT_GRIDS[seats_type]
+        names = list(grid.positions)
+        rng = random.Random(options['seed'])
+
+        self.stdout.write(f'seats_type {seats_type}: {len(names)} seats, {options["repeat"]} runs each')
+        self.stdout.write(f'{"reserved":>9} ' + ' '.join(f'{f"n={count}":>9}' for count in range(1, MAX_PARTY_SIZE + 1)))
+        for rate in (0, 0.25, 0.5, 0.75, 0.9):
+            reserved_sets = [
+                set(rng.sample(names, int(len(names) * rate))) for _ in range(options['repeat'])
+            ]
+            row = []
+            for count in range(1, MAX_PARTY_SIZE + 1):
+                start = time.perf_counter()
+                for reserved in reserved_sets:
+                    recommend_seats(seats_type, reserved, count)
+                row.append((time.perf_counter() - start) / options['repeat'] * 1e6)
+            self.stdout.write(f'{rate:>9.0%} ' + ' '.join(f'{f"{us:.1f}us":>9}' for us in row))
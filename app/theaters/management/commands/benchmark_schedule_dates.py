@@ -0,0 +1,134 @@
+import datetime
+import time
+
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+
+from movies.models import Movie
+from theaters.models import Region, Theater, Screen, Schedule
+from utils.custom_functions import get_date_range
+
+
+def date_lookups(prefix, date, legacy):
+    # legacy: 변경 전 start_time__date=date (컬럼 cast로 인덱스 사용 불가)
+    if legacy:
+        return {f'{prefix}start_time__date': date}
+    start, end = get_date_range(date)
+    return {f'{prefix}start_time__gte': start, f'{prefix}start_time__lt': end}
+
+
+def build_querysets(date, theater_id, movies_list, legacy):
+    # theaters.views의 날짜별 view 3개와 같은 쿼리
+    return {
+        'TheatersGivenDateList': Theater.objects.filter(
+            screens__schedules__movie__in=movies_list,
+            **date_lookups('screens__schedules__', date, legacy),
+        ).distinct('id').select_related('region'),
+        'TheatersRegionCountGivenDate': Theater.objects.filter(
+            **date_lookups('screens__schedules__', date, legacy),
+        ).values('region', 'region__name').annotate(Count('name', distinct=True)),
+        'ScheduleListGivenDate': Schedule.objects.filter(
+            screen__theater_id=theater_id,
+            **date_lookups('', date, legacy),
+        ).select_related('movie', 'screen__theater__region'),
+    }
+
+
+class Command(BaseCommand):
+    help = '스케쥴을 대량 생성한 뒤 날짜별 view 3개의 실행 계획/소요 시간 비교 (start_time__date vs 범위 조건) - DB 변경사항은 모두 롤백'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schedules', type=int, default=2000000, help='생성할 스케쥴 수')
+        parser.add_argument('--theaters', type=int, default=100)
+        parser.add_argument('--screens', type=int, default=10, help='상영관별 스크린 수')
+        parser.add_argument('--movies', type=int, default=30)
+        parser.add_argument('--repeat', type=int, default=5, help='쿼리별 반복 횟수')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('PostgreSQL에서만 실행 가능 (generate_series, EXPLAIN)')
+
+        with transaction.atomic():
+            date, theater_id, movie_ids = self.seed(options)
+            for legacy in (True, False):
+                self.stdout.write(self.style.MIGRATE_HEADING(
+                    'start_time__date' if legacy else 'start_time >= start AND start_time < end'
+                ))
+                querysets = build_querysets(date, theater_id, movie_ids[:3], legacy)
+                for name, queryset in querysets.items():
+                    self.stdout.write(f'[{name}] {self.measure(queryset, options["repeat"]):.2f}ms')
+                    self.stdout.write(queryset.explain())
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        region = Region.objects.create(name='benchmark')
+        theaters = Theater.objects.bulk_create([
+            Theater(name=f'benchmark {i}', region=region) for i in range(options['theaters'])
+        ])
+        screens = Screen.objects.bulk_create([
+            Screen(name=f'{i}관', theater=theater)
+            for theater in theaters for i in range(options['screens'])
+        ])
+        rank = (Movie.objects.order_by('-rank').values_list('rank', flat=True).first() or 0) + 1
+        movies = Movie.objects.bulk_create([
+            Movie(
+                name_kor=f'benchmark {i}',
+                name_eng=f'benchmark {i}',
+                code=0,
+                running_time=datetime.timedelta(minutes=120),
+                rank=rank + i,
+                acc_audience=0,
+                reservation_rate=0,
+                open_date=datetime.date.today(),
+                grade='all',
+            )
+            for i in range(options['movies'])
+        ])
+        screen_ids = [screen.id for screen in screens]
+        movie_ids = [movie.id for movie in movies]
+
+        # 스크린마다 하루 6회(3시간 간격) 상영 - 필요한 만큼 날짜를 이어서 생성
+        slots_per_day = 6
+        first_day = datetime.datetime.combine(datetime.date.today(), datetime.time(9))
+        start = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                INSERT INTO {Schedule._meta.db_table} (movie_id, screen_id, start_time)
+                SELECT
+                    (%(movie_ids)s::int[])[1 + g %% %(movies)s],
+                    (%(screen_ids)s::int[])[1 + g %% %(screens)s],
+                    %(first_day)s
+                        + (g / (%(screens)s * %(slots)s)) * interval '1 day'
+                        + ((g / %(screens)s) %% %(slots)s) * interval '3 hours'
+                FROM generate_series(0, %(count)s - 1) AS g
+                ''',
+                {
+                    'movie_ids': movie_ids,
+                    'movies': len(movie_ids),
+                    'screen_ids': screen_ids,
+                    'screens': len(screen_ids),
+                    'slots': slots_per_day,
+                    'first_day': first_day,
+                    'count': options['schedules'],
+                },
+            )
+            cursor.execute(f'ANALYZE {Schedule._meta.db_table}')
+        self.stdout.write(
+            f'seeded {options["schedules"]} schedules '
+            f'({options["schedules"] // (len(screen_ids) * slots_per_day) + 1} days) '
+            f'in {time.perf_counter() - start:.1f}s'
+        )
+
+        # 중간 날짜 조회
+        days = options['schedules'] // (len(screen_ids) * slots_per_day)
+        return (first_day + datetime.timedelta(days=days // 2)).date(), theaters[0].id, movie_ids
+
+    def measure(self, queryset, repeat):
+        elapsed = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(queryset)
+            elapsed += time.perf_counter() - start
+        return elapsed / repeat * 1000
@@ -0,0 +1,57 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from theaters.models import Schedule, SeatType, SeatGrade, ScheduleSeatMap
+from theaters.seat_maps import SeatMap, KIND_BY_SEAT_TYPE, build_states
+
+
+class Command(BaseCommand):
+    help = '기존 SeatType row들을 스케쥴별 ScheduleSeatMap(좌석당 1 byte)으로 변환 - SEAT_STORAGE_MODE = "seat_map" 전환 시 사용'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='한 트랜잭션에서 변환할 스케쥴 수')
+        parser.add_argument('--delete-seat-types', action='store_true', help='변환 후 SeatType row 삭제')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        schedule_ids = list(
+            Schedule.objects.filter(seat_map__isnull=True).order_by('id').values_list('id', flat=True)
+        )
+
+        converted = 0
+        for start in range(0, len(schedule_ids), batch_size):
+            chunk = schedule_ids[start:start + batch_size]
+            with transaction.atomic():
+                converted += self.convert(chunk, options['delete_seat_types'])
+            self.stdout.write(f'{converted}/{len(schedule_ids)} 스케쥴 변환 완료')
+
+    def convert(self, schedule_ids, delete_seat_types):
+        seat_maps = {
+            schedule.id: SeatMap(schedule.screen.seats_type, build_states(schedule.screen.seats_type))
+            for schedule in Schedule.objects.filter(pk__in=schedule_ids).select_related('screen')
+        }
+
+        seat_types = SeatType.objects.filter(schedule_id__in=schedule_ids).values_list(
+            'schedule_id', 'seat__name', 'type'
+        )
+        for schedule_id, seat_name, seat_type in seat_types:
+            seat_map = seat_maps[schedule_id]
+            if seat_name in seat_map.index:
+                seat_map.set_kind(seat_name, KIND_BY_SEAT_TYPE[seat_type])
+
+        reserved_seats = SeatGrade.objects.filter(schedule_id__in=schedule_ids).values_list(
+            'schedule_id', 'seat__name'
+        )
+        for schedule_id, seat_name in reserved_seats:
+            seat_map = seat_maps[schedule_id]
+            if seat_name in seat_map.index:
+                seat_map.reserve([seat_name])
+
+        ScheduleSeatMap.objects.bulk_create([
+            ScheduleSeatMap(schedule_id=schedule_id, seats_type=seat_map.seats_type, states=seat_map.to_bytes())
+            for schedule_id, seat_map in seat_maps.items()
+        ])
+
+        if delete_seat_types:
+            SeatType.objects.filter(schedule_id__in=schedule_ids).delete()
+        return len(seat_maps)
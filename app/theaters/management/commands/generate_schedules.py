@@ -0,0 +1,168 @@
+import datetime
+import time
+from itertools import islice
+
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from movies.models import Movie
+from theaters.models import Screen, Schedule, create_seat_types, create_seat_maps, create_occupancies
+from theaters.seat_maps import is_seat_map_mode
+from theaters.showtimes import invalidate_showtimes
+
+
+def parse_minutes(value):
+    # 'HH:MM' -> 자정 기준 분 (24:00 이후 심야 상영 허용)
+    try:
+        hours, minutes = map(int, value.split(':'))
+    except ValueError:
+        raise CommandError(f'시간은 HH:MM 형식이어야 합니다: {value}')
+    return hours * 60 + minutes
+
+
+def round_up(dt, minutes):
+    # 상영 시작 시각을 minutes 단위로 올림
+    if minutes <= 1:
+        return dt
+    remainder = (dt.hour * 60 + dt.minute) % minutes
+    dt = dt.replace(second=0, microsecond=0)
+    return dt if remainder == 0 else dt + datetime.timedelta(minutes=minutes - remainder)
+
+
+def layout_day(date, rotation, offset, open_minutes, close_minutes, cleanup, rounding):
+    # 한 스크린의 하루 상영 시간표 - 영화 순환, 상영 시간 + 정리 시간만큼 띄워서 겹치지 않게 배치
+    # close 이전에 시작하는 회차까지 생성
+    midnight = datetime.datetime.combine(date, datetime.time.min)
+    close = midnight + datetime.timedelta(minutes=close_minutes)
+    start_time = round_up(midnight + datetime.timedelta(minutes=open_minutes), rounding)
+    index = offset
+    while start_time < close:
+        movie = rotation[index % len(rotation)]
+        yield movie, start_time
+        start_time = round_up(start_time + movie.running_time + cleanup, rounding)
+        index += 1
+
+
+class Command(BaseCommand):
+    help = '기간/영화 순환/회차 규칙에 따라 스케쥴과 좌석 row를 일괄 생성 (이미 스케쥴이 있는 스크린의 날짜는 건너뜀)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('start_date', help='YYYY-MM-DD')
+        parser.add_argument('end_date', help='YYYY-MM-DD (포함)')
+        parser.add_argument('--movies', nargs='+', type=int, help='순환할 영화 ID (기본: 예매 순위 상위 --top 편)')
+        parser.add_argument('--top', type=int, default=5)
+        parser.add_argument('--theaters', nargs='+', type=int, help='상영관 ID (기본: 전체)')
+        parser.add_argument('--open', default='09:00', help='첫 회차 시작 시각')
+        parser.add_argument('--close', default='24:00', help='마지막 회차 시작 한도 (HH:MM, 24:00 이후 가능)')
+        parser.add_argument('--cleanup', type=int, default=20, help='회차 사이 정리 시간 (분)')
+        parser.add_argument('--round', type=int, default=5, help='시작 시각 올림 단위 (분)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='한 트랜잭션에서 생성할 스케쥴 수')
+
+    def handle(self, *args, **options):
+        try:
+            start_date = datetime.datetime.strptime(options['start_date'], '%Y-%m-%d').date()
+            end_date = datetime.datetime.strptime(options['end_date'], '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError('날짜는 YYYY-MM-DD 형식이어야 합니다.')
+        if end_date < start_date:
+            raise CommandError('end_date가 start_date보다 빠릅니다.')
+        dates = [start_date + datetime.timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+        rotation = self.get_rotation(options)
+        screens = Screen.objects.order_by('theater_id', 'id')
+        if options['theaters']:
+            screens = screens.filter(theater_id__in=options['theaters'])
+        screens = list(screens)
+
+        # 이미 스케쥴이 있는 (스크린, 날짜)는 건너뜀
+        scheduled_days = set(
+            (screen_id, start_time.date())
+            for screen_id, start_time in Schedule.objects.filter(
+                screen__in=screens,
+                start_time__gte=datetime.datetime.combine(start_date, datetime.time.min),
+                start_time__lt=datetime.datetime.combine(end_date + datetime.timedelta(days=1), datetime.time.min),
+            ).values_list('screen_id', 'start_time')
+        )
+
+        schedules = self.build_schedules(screens, dates, rotation, scheduled_days, options)
+
+        started = time.perf_counter()
+        created = seats = 0
+        while True:
+            chunk = list(islice(schedules, options['chunk_size']))
+            if not chunk:
+                break
+            with transaction.atomic():
+                chunk_seats = self.create_chunk(chunk)
+            created += len(chunk)
+            seats += chunk_seats
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{created} schedules / {seats} seat rows '
+                f'({created / elapsed:.0f} schedules/s, {seats / elapsed:.0f} seat rows/s)'
+            )
+
+        # bulk_create는 signal을 보내지 않으므로 날짜별 상영 정보 캐시를 직접 무효화
+        # --close가 24:00 이후면 마지막 날의 심야 회차가 다음 날짜로 넘어가므로 그 날짜까지 포함
+        spill_days = max(parse_minutes(options['close']) - 1, 0) // (24 * 60)
+        invalidated_dates = dates + [end_date + datetime.timedelta(days=i) for i in range(1, spill_days + 1)]
+        invalidate_showtimes(dates=invalidated_dates)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'{created}개 스케쥴 생성 완료 ({len(screens)}개 스크린, {len(dates)}일, '
+            f'{len(scheduled_days)}개 스크린-날짜는 기존 스케쥴로 건너뜀, '
+            f'상영 정보 캐시 무효화 {invalidated_dates[0]} ~ {invalidated_dates[-1]}) - {elapsed:.2f}s'
+        ))
+
+    def get_rotation(self, options):
+        if options['movies']:
+            movies = Movie.objects.in_bulk(options['movies'])
+            missing = [movie_id for movie_id in options['movies'] if movie_id not in movies]
+            if missing:
+                raise CommandError(f'존재하지 않는 영화 ID: {missing}')
+            rotation = [movies[movie_id] for movie_id in options['movies']]
+        else:
+            rotation = list(Movie.objects.order_by('rank')[:options['top']])
+        if not rotation:
+            raise CommandError('순환할 영화가 없습니다.')
+        if any(not movie.running_time for movie in rotation):
+            raise CommandError('상영 시간(running_time)이 없는 영화가 있습니다.')
+        return rotation
+
+    def build_schedules(self, screens, dates, rotation, scheduled_days, options):
+        open_minutes = parse_minutes(options['open'])
+        close_minutes = parse_minutes(options['close'])
+        cleanup = datetime.timedelta(minutes=options['cleanup'])
+
+        for day_index, date in enumerate(dates):
+            for screen_index, screen in enumerate(screens):
+                if (screen.id, date) in scheduled_days:
+                    continue
+                # 스크린/날짜마다 순환 시작 위치를 바꿔 같은 시간대에 같은 영화가 몰리지 않게 함
+                offset = screen_index + day_index
+                for movie, start_time in layout_day(
+                    date, rotation, offset, open_minutes, close_minutes, cleanup, options['round']
+                ):
+                    yield Schedule(movie=movie, screen=screen, start_time=start_time)
+
+    def create_chunk(self, schedules):
+        created = Schedule.objects.bulk_create(schedules)
+        if not connection.features.can_return_ids_from_bulk_insert:
+            # PostgreSQL 외 DB는 bulk_create가 pk를 채우지 않으므로 다시 조회
+            pks = dict(
+                ((screen_id, start_time), pk)
+                for pk, screen_id, start_time in Schedule.objects.filter(
+                    screen__in={schedule.screen_id for schedule in created},
+                    start_time__in={schedule.start_time for schedule in created},
+                ).values_list('id', 'screen_id', 'start_time')
+            )
+            for schedule in created:
+                schedule.pk = pks[(schedule.screen_id, schedule.start_time)]
+
+        if is_seat_map_mode():
+            seat_rows = create_seat_maps(created)
+        else:
+            seat_rows = create_seat_types(created)
+        create_occupancies(created)
+        return len(seat_rows)
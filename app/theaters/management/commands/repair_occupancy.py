@@ -0,0 +1,26 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from theaters.models import Schedule
+from theaters.occupancy import rebuild_occupancies
+
+
+class Command(BaseCommand):
+    help = 'ScheduleOccupancy 카운터(전체/예매/결제 대기 좌석 수)를 SeatType/SeatGrade 기준으로 일괄 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 트랜잭션에서 재계산할 스케쥴 수')
+        parser.add_argument('schedule_ids', nargs='*', type=int, help='재계산할 스케쥴 ID (생략 시 전체)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if options['schedule_ids']:
+            schedule_ids = options['schedule_ids']
+        else:
+            schedule_ids = list(Schedule.objects.order_by('id').values_list('id', flat=True))
+
+        repaired = 0
+        for start in range(0, len(schedule_ids), batch_size):
+            with transaction.atomic():
+                repaired += len(rebuild_occupancies(schedule_ids[start:start + batch_size]))
+            self.stdout.write(f'{repaired}/{len(schedule_ids)} 스케쥴 재계산 완료')
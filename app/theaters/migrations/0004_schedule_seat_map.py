@@ -0,0 +1,23 @@
+# Generated by Django 2.2.14 on 2026-10-17 11:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('theaters', '0003_auto_20200715_2154'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduleSeatMap',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seats_type', models.CharField(choices=[('0', 'type_0'), ('1', 'type_1'), ('2', 'type_2')], max_length=20)),
+                ('states', models.BinaryField()),
+                ('schedule', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='seat_map', to='theaters.Schedule')),
+            ],
+        ),
+    ]
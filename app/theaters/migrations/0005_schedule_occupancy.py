@@ -0,0 +1,24 @@
+# Generated by Django 2.2.14 on 2026-10-17 11:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('theaters', '0004_schedule_seat_map'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduleOccupancy',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_seats', models.PositiveIntegerField(default=0)),
+                ('reserved_seats', models.PositiveIntegerField(default=0)),
+                ('held_seats', models.PositiveIntegerField(default=0)),
+                ('schedule', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='occupancy', to='theaters.Schedule')),
+            ],
+        ),
+    ]
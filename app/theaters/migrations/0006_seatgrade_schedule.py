@@ -0,0 +1,30 @@
+# Generated by Django 2.2.14 on 2026-10-17 12:05
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def fill_seat_grade_schedule(apps, schema_editor):
+    SeatGrade = apps.get_model('theaters', 'SeatGrade')
+    Reservation = apps.get_model('reservations', 'Reservation')
+    SeatGrade.objects.filter(schedule__isnull=True).update(
+        schedule=Subquery(Reservation.objects.filter(pk=OuterRef('reservation_id')).values('schedule_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0008_payment_is_point_saved'),
+        ('theaters', '0005_schedule_occupancy'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seatgrade',
+            name='schedule',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='seat_grades', to='theaters.Schedule'),
+        ),
+        migrations.RunPython(fill_seat_grade_schedule, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 2.2.14 on 2026-10-17 12:05
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def check_duplicate_seat_grades(apps, schema_editor):
+    # 이미 중복 예약된 (schedule, seat)가 있으면 unique 제약을 추가할 수 없음
+    # 결제된 예매를 임의로 지울 수 없으므로 목록을 보여주고 중단 - 예매를 정리한 뒤 다시 migrate
+    SeatGrade = apps.get_model('theaters', 'SeatGrade')
+    duplicates = SeatGrade.objects.order_by().values('schedule', 'seat').annotate(
+        count=Count('id'),
+    ).filter(count__gt=1)
+    lines = [
+        f"schedule {duplicate['schedule']} / seat {duplicate['seat']}: reservations " + ', '.join(
+            str(reservation_id) for reservation_id in SeatGrade.objects.filter(
+                schedule_id=duplicate['schedule'], seat_id=duplicate['seat'],
+            ).order_by('reservation_id').values_list('reservation_id', flat=True)
+        )
+        for duplicate in duplicates
+    ]
+    if lines:
+        raise RuntimeError('중복 예약된 좌석을 정리한 뒤 다시 실행하세요.\n' + '\n'.join(lines))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('theaters', '0006_seatgrade_schedule'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_seat_grades, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.14 on 2026-10-17 12:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('theaters', '0007_seatgrade_schedule_duplicates'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='seatgrade',
+            name='schedule',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seat_grades', to='theaters.Schedule'),
+        ),
+        migrations.AddConstraint(
+            model_name='seatgrade',
+            constraint=models.UniqueConstraint(fields=('schedule', 'seat'), name='unique_schedule_seat'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 2.2.14 on 2026-10-17 11:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('theaters', '0008_seatgrade_schedule_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['start_time'], name='theaters_sc_start_t_c3c4d4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['screen', 'start_time'], name='theaters_sc_screen__5ee260_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['movie', 'start_time'], name='theaters_sc_movie_i_b79c46_idx'),
+        ),
+    ]
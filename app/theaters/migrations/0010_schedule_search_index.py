@@ -0,0 +1,21 @@
+# Generated by Django 2.2.14 on 2026-10-17 11:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('theaters', '0009_schedule_start_time_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='schedule',
+            name='theaters_sc_movie_i_b79c46_idx',
+        ),
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['movie', 'start_time', 'id'], name='theaters_sc_movie_i_856414_idx'),
+        ),
+    ]
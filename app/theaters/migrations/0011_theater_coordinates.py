@@ -0,0 +1,23 @@
+# Generated by Django 2.2.14 on 2026-10-17 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('theaters', '0010_schedule_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='theater',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='theater',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
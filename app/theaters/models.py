@@ -1,8 +1,15 @@
-from django.db import models
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
 
-from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART_SET
+from utils.etags import track_changes
+from .geo import refresh_theater_index
+from .layouts import screen_seats_type_key
+from .seat_catalog import get_seat_catalog, invalidate_seat_catalog
+from .seat_maps import SeatMap, GENERAL, build_states, is_seat_map_mode
+from .showtimes import invalidate_showtimes
 
 
 class Theater(models.Model):
@@ -12,6 +19,9 @@ class Theater(models.Model):
         related_name='theaters',
         on_delete=models.CASCADE,
     )
+    # 가까운 상영관 검색 (theaters.geo) - 좌표가 없으면 검색 대상에서 제외
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
 
     def __str__(self):
         return f'{self.name} ({self.region})'
@@ -71,29 +81,148 @@ class Schedule(models.Model):
 
     class Meta:
         ordering = ['start_time']
+        # 날짜 조회는 start_time 범위 조건 (utils.custom_functions.get_date_range)
+        indexes = [
+            models.Index(fields=['start_time']),
+            models.Index(fields=['screen', 'start_time']),
+            # 영화별 스케쥴 검색 keyset pagination (start_time, id)
+            models.Index(fields=['movie', 'start_time', 'id']),
+        ]
 
     def __str__(self):
         return f'{self.start_time:%m/%d %H:%M} {self.screen} {self.movie}'
 
 
+def create_seat_types(schedules):
+    # 좌석 이름 -> ID는 프로세스 캐시 (theaters.seat_catalog), SeatType bulk insert 1회로 여러 스케쥴의 좌석을 생성
+    layouts = {
+        schedule.screen.seats_type: SEATING_CHART_GENERAL.get(schedule.screen.seats_type)
+        for schedule in schedules
+    }
+    seat_names = set()
+    for general_seats_list in layouts.values():
+        if general_seats_list is not None:
+            seat_names.update(general_seats_list)
+    if not seat_names:
+        return []
+
+    seat_ids = get_seat_catalog().ids(seat_names)
+    missing_seats = seat_names - seat_ids.keys()
+    if missing_seats:
+        raise Seat.DoesNotExist(f'등록되지 않은 좌석입니다: {", ".join(sorted(missing_seats))}')
+
+    seat_types = []
+    for schedule in schedules:
+        type_number = schedule.screen.seats_type
+        general_seats_list = layouts[type_number]
+        if general_seats_list is None:
+            continue
+        apart_seats_set = SEATING_CHART_APART_SET.get(type_number, frozenset())
+
+        for seat in general_seats_list:
+            seat_types.append(SeatType(
+                seat_id=seat_ids[seat],
+                schedule=schedule,
+                type='sit_apart' if seat in apart_seats_set else 'general',
+            ))
+    return SeatType.objects.bulk_create(seat_types)
+
+
+def create_seat_maps(schedules):
+    # SEAT_STORAGE_MODE = 'seat_map' 일 때 SeatType 대신 스케쥴당 1개의 좌석 배치 row 생성
+    return ScheduleSeatMap.objects.bulk_create([
+        ScheduleSeatMap(
+            schedule=schedule,
+            seats_type=schedule.screen.seats_type,
+            states=build_states(schedule.screen.seats_type),
+        )
+        for schedule in schedules
+    ])
+
+
+def create_occupancies(schedules):
+    return ScheduleOccupancy.objects.bulk_create([
+        ScheduleOccupancy(
+            schedule=schedule,
+            total_seats=build_states(schedule.screen.seats_type).count(GENERAL),
+        )
+        for schedule in schedules
+    ])
+
+
 @receiver(post_save, sender=Schedule)
 def create_seats(sender, instance, created, **kwargs):
     if created:
-        type_number = instance.screen.seats_type
-        general_seats_list = SEATING_CHART_GENERAL.get(type_number)
-        apart_seats_list = SEATING_CHART_APART.get(type_number)
+        if is_seat_map_mode():
+            create_seat_maps([instance])
+        else:
+            create_seat_types([instance])
+        create_occupancies([instance])
 
-        if general_seats_list is not None:
-            for seat in general_seats_list:
-                seat_instance = Seat.objects.get(name=seat)
 
-                seat_type = 'sit_apart' if seat in apart_seats_list else 'general'
+@receiver(pre_save, sender=Schedule)
+def remember_schedule_date(sender, instance, **kwargs):
+    # 상영 시간이 다른 날짜로 바뀌면 이전 날짜의 캐시도 무효화해야 함
+    instance._previous_start_time = None
+    if instance.pk is not None:
+        instance._previous_start_time = Schedule.objects.filter(pk=instance.pk).values_list(
+            'start_time', flat=True
+        ).first()
+
+
+@receiver(post_save, sender=Schedule)
+@receiver(post_delete, sender=Schedule)
+def invalidate_schedule_showtimes(sender, instance, **kwargs):
+    # 커밋 후 무효화 - 커밋 전에 버전을 올리면 다른 요청이 이전 데이터를 새 버전으로 캐시할 수 있음
+    start_time_field = sender._meta.get_field('start_time')
+    start_times = [instance.start_time, getattr(instance, '_previous_start_time', None)]
+    dates = [start_time_field.to_python(start_time).date() for start_time in start_times if start_time is not None]
+    transaction.on_commit(lambda: invalidate_showtimes(dates=dates))
 
-                SeatType.objects.create(
-                    seat=seat_instance,
-                    schedule=instance,
-                    type=seat_type,
-                )
+
+@receiver(post_save, sender='movies.Movie')
+@receiver(post_delete, sender='movies.Movie')
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=Theater)
+@receiver(post_delete, sender=Theater)
+@receiver(post_save, sender=Screen)
+@receiver(post_delete, sender=Screen)
+def invalidate_all_showtimes(sender, **kwargs):
+    transaction.on_commit(invalidate_showtimes)
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=Theater)
+@receiver(post_delete, sender=Theater)
+def invalidate_theater_index(sender, **kwargs):
+    transaction.on_commit(refresh_theater_index)
+
+
+# 스크린 상세 ETag
+track_changes(Region, Theater, Screen)
+
+
+@receiver(post_save, sender=Screen)
+@receiver(post_delete, sender=Screen)
+def invalidate_screen_seats_type(sender, instance, **kwargs):
+    # 커밋 전에 지우면 다른 요청이 이전 seats_type을 다시 캐시할 수 있음
+    key = screen_seats_type_key(instance.pk)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class SeatQuerySet(models.QuerySet):
+    # bulk_create/update는 signal을 보내지 않으므로 좌석 목록 캐시를 직접 무효화
+    def bulk_create(self, *args, **kwargs):
+        seats = super().bulk_create(*args, **kwargs)
+        transaction.on_commit(invalidate_seat_catalog)
+        return seats
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        transaction.on_commit(invalidate_seat_catalog)
+        return rows
 
 
 class Seat(models.Model):
@@ -109,10 +238,18 @@ class Seat(models.Model):
         related_name='seats',
     )
 
+    objects = SeatQuerySet.as_manager()
+
     def __str__(self):
         return f'{self.name}'
 
 
+@receiver(post_save, sender=Seat)
+@receiver(post_delete, sender=Seat)
+def invalidate_seat_ids(sender, **kwargs):
+    transaction.on_commit(invalidate_seat_catalog)
+
+
 class SeatType(models.Model):
     # 예매완료좌석은 예매 모델 필드에서 접근
     # 선택불가좌석은 로직제외
@@ -143,6 +280,48 @@ class SeatType(models.Model):
         return f'{self.seat}'
 
 
+class ScheduleSeatMap(models.Model):
+    # 배치도(SEATING_CHART_GENERAL[seats_type]) 순서대로 좌석당 1 byte (seat_maps 참고)
+    schedule = models.OneToOneField(
+        'Schedule',
+        on_delete=models.CASCADE,
+        related_name='seat_map',
+    )
+    seats_type = models.CharField(
+        max_length=20,
+        choices=Screen.SEATS_TYPE_CHOICES,
+    )
+    states = models.BinaryField()
+
+    def __str__(self):
+        return f'{self.schedule} (type_{self.seats_type})'
+
+    def get_seat_map(self):
+        return SeatMap(self.seats_type, self.states)
+
+    def set_seat_map(self, seat_map):
+        self.states = seat_map.to_bytes()
+
+
+class ScheduleOccupancy(models.Model):
+    # 좌석 수 조회용 카운터 - 예매 생성/삭제, 결제, 결제 취소 시 같은 트랜잭션에서 갱신 (theaters.occupancy)
+    # 어긋난 경우 repair_occupancy 커맨드로 재계산
+    schedule = models.OneToOneField(
+        'Schedule',
+        on_delete=models.CASCADE,
+        related_name='occupancy',
+    )
+    # 일반석 수 (띄어앉기석 제외)
+    total_seats = models.PositiveIntegerField(default=0)
+    # 예매된 좌석 수 (결제 대기 포함)
+    reserved_seats = models.PositiveIntegerField(default=0)
+    # 결제 대기 중인 좌석 수
+    held_seats = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.schedule} {self.reserved_seats}/{self.total_seats}'
+
+
 class SeatGrade(models.Model):
     SEAT_GRADE_CHOICES = [
         ('adult', '성인'),
@@ -164,6 +343,17 @@ class SeatGrade(models.Model):
         on_delete=models.CASCADE,
         related_name='seat_grades',
     )
+    # reservation.schedule과 동일 - 스케쥴별 좌석 중복 예약을 DB에서 막기 위해 저장
+    schedule = models.ForeignKey(
+        'Schedule',
+        on_delete=models.CASCADE,
+        related_name='seat_grades',
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['schedule', 'seat'], name='unique_schedule_seat'),
+        ]
 
     def __str__(self):
         return f'{self.reservation} {self.seat} {self.grade}'
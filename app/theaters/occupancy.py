@@ -0,0 +1,139 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Schedule, ScheduleOccupancy, SeatType, SeatGrade, ScheduleSeatMap
+from .seat_maps import SeatMap, GENERAL, is_seat_map_mode
+
+
+def hold_seats(schedule_id, count):
+    # 예매 생성 (결제 대기)
+    ScheduleOccupancy.objects.filter(schedule_id=schedule_id).update(
+        reserved_seats=F('reserved_seats') + count,
+        held_seats=F('held_seats') + count,
+    )
+
+
+def confirm_seats(schedule_id, count):
+    # 결제 완료
+    ScheduleOccupancy.objects.filter(schedule_id=schedule_id).update(
+        held_seats=F('held_seats') - count,
+    )
+
+
+def release_seats(schedule_id, count, held):
+    # 예매 삭제 (held: 결제 전 예매였는지)
+    changes = {'reserved_seats': F('reserved_seats') - count}
+    if held:
+        changes['held_seats'] = F('held_seats') - count
+    ScheduleOccupancy.objects.filter(schedule_id=schedule_id).update(**changes)
+
+
+def count_subquery(queryset, group_by):
+    return Coalesce(Subquery(
+        queryset.order_by().values(group_by).annotate(count=Count('pk')).values('count'),
+        output_field=IntegerField(),
+    ), 0)
+
+
+def annotate_seat_counts(queryset):
+    # 카운터 재계산용 - 스케쥴별 좌석 수를 쿼리 1번으로 집계
+    seat_grades = SeatGrade.objects.filter(schedule=OuterRef('pk'))
+    queryset = queryset.annotate(
+        reserved_seats=count_subquery(seat_grades, 'schedule'),
+        held_seats=count_subquery(seat_grades.filter(reservation__payment__isnull=True), 'schedule'),
+    )
+    if is_seat_map_mode():
+        return queryset
+
+    general_seats = SeatType.objects.filter(schedule=OuterRef('pk'), type='general')
+    return queryset.annotate(
+        total_seats=count_subquery(general_seats, 'schedule'),
+    )
+
+
+def rebuild_occupancies(schedule_ids):
+    schedules = list(annotate_seat_counts(Schedule.objects.filter(pk__in=schedule_ids)))
+
+    if is_seat_map_mode():
+        seat_maps = ScheduleSeatMap.objects.filter(schedule_id__in=schedule_ids).values_list(
+            'schedule_id', 'seats_type', 'states'
+        )
+        total_seats_dict = {
+            schedule_id: SeatMap(seats_type, states).count(GENERAL)
+            for schedule_id, seats_type, states in seat_maps
+        }
+        for schedule in schedules:
+            schedule.total_seats = total_seats_dict.get(schedule.id, 0)
+
+    occupancies = {
+        occupancy.schedule_id: occupancy
+        for occupancy in ScheduleOccupancy.objects.filter(schedule_id__in=schedule_ids)
+    }
+    created, updated = [], []
+    for schedule in schedules:
+        occupancy = occupancies.get(schedule.id)
+        if occupancy is None:
+            occupancy = ScheduleOccupancy(schedule_id=schedule.id)
+            created.append(occupancy)
+        else:
+            updated.append(occupancy)
+        occupancy.total_seats = schedule.total_seats
+        occupancy.reserved_seats = schedule.reserved_seats
+        occupancy.held_seats = schedule.held_seats
+
+    if created:
+        # 동시 조회에서 다른 요청이 먼저 만든 row는 건너뛰고(OneToOne unique 충돌 방지) 저장된 row를 다시 조회
+        ScheduleOccupancy.objects.bulk_create(created, ignore_conflicts=True)
+        created = list(ScheduleOccupancy.objects.filter(
+            schedule_id__in=[occupancy.schedule_id for occupancy in created]
+        ))
+    ScheduleOccupancy.objects.bulk_update(updated, ['total_seats', 'reserved_seats', 'held_seats'])
+    return created + updated
+
+
+def get_occupancy(schedule):
+    # 카운터 row가 없는 기존 스케쥴은 조회 시점에 생성
+    try:
+        return schedule.occupancy
+    except ScheduleOccupancy.DoesNotExist:
+        occupancy, = rebuild_occupancies([schedule.id])
+        return occupancy
+
+
+def seat_count_key(schedule_id):
+    return f'seat-count:{schedule_id}'
+
+
+def get_seat_counts(schedule_ids):
+    # 좌석 수는 예매마다 바뀌므로 상영 정보 캐시와 분리해 짧은 TTL로 캐싱
+    # {schedule_id: (total_seats, reserved_seats)}
+    cached = cache.get_many([seat_count_key(schedule_id) for schedule_id in schedule_ids])
+    seat_counts = {
+        schedule_id: cached[seat_count_key(schedule_id)]
+        for schedule_id in schedule_ids
+        if seat_count_key(schedule_id) in cached
+    }
+    missing = [schedule_id for schedule_id in schedule_ids if schedule_id not in seat_counts]
+    if not missing:
+        return seat_counts
+
+    fetched = {
+        schedule_id: (total_seats, reserved_seats)
+        for schedule_id, total_seats, reserved_seats in ScheduleOccupancy.objects.filter(
+            schedule_id__in=missing
+        ).values_list('schedule_id', 'total_seats', 'reserved_seats')
+    }
+    # 카운터 row가 없는 기존 스케쥴
+    without_occupancy = [schedule_id for schedule_id in missing if schedule_id not in fetched]
+    if without_occupancy:
+        for occupancy in rebuild_occupancies(without_occupancy):
+            fetched[occupancy.schedule_id] = (occupancy.total_seats, occupancy.reserved_seats)
+
+    cache.set_many(
+        {seat_count_key(schedule_id): counts for schedule_id, counts in fetched.items()},
+        settings.SEAT_COUNT_CACHE_TTL,
+    )
+    seat_counts.update(fetched)
+    return seat_counts
@@ -30,3 +30,78 @@ seat_names_query_param = openapi.Parameter(
     description='좌석 이름 - 예시: A1+B2+C3',
     type=openapi.TYPE_STRING
 )
+party_size_query_param = openapi.Parameter(
+    'count',
+    openapi.IN_QUERY,
+    description='연속으로 앉을 인원 수 (1 ~ 8)',
+    type=openapi.TYPE_INTEGER
+)
+from_date_query_param = openapi.Parameter(
+    'from',
+    openapi.IN_QUERY,
+    description='시작 날짜 (YYMMDD, 기본: 오늘) - 예시: 200720',
+    type=openapi.TYPE_STRING
+)
+days_query_param = openapi.Parameter(
+    'days',
+    openapi.IN_QUERY,
+    description='조회할 일 수 (1 ~ 14, 기본: 7)',
+    type=openapi.TYPE_INTEGER
+)
+movie_query_param = openapi.Parameter(
+    'movie',
+    openapi.IN_QUERY,
+    description='검색 할 영화의 ID (필수)',
+    type=openapi.TYPE_INTEGER,
+    required=True
+)
+region_query_param = openapi.Parameter(
+    'region',
+    openapi.IN_QUERY,
+    description='지역 ID',
+    type=openapi.TYPE_INTEGER
+)
+time_band_query_param = openapi.Parameter(
+    'time',
+    openapi.IN_QUERY,
+    description='상영 시작 시간대 - 00-10, 10-13, 13-16, 16-18, 18-21, 21-00',
+    type=openapi.TYPE_STRING
+)
+cursor_query_param = openapi.Parameter(
+    'cursor',
+    openapi.IN_QUERY,
+    description='다음 페이지 cursor (응답의 next URL에 포함)',
+    type=openapi.TYPE_STRING
+)
+latitude_query_param = openapi.Parameter(
+    'lat',
+    openapi.IN_QUERY,
+    description='위도 (필수) - 예시: 37.5665',
+    type=openapi.TYPE_NUMBER,
+    required=True
+)
+longitude_query_param = openapi.Parameter(
+    'lng',
+    openapi.IN_QUERY,
+    description='경도 (필수) - 예시: 126.978',
+    type=openapi.TYPE_NUMBER,
+    required=True
+)
+nearest_count_query_param = openapi.Parameter(
+    'k',
+    openapi.IN_QUERY,
+    description='조회할 상영관 수 (1 ~ 20, 기본: 5)',
+    type=openapi.TYPE_INTEGER
+)
+showing_movie_query_param = openapi.Parameter(
+    'movie',
+    openapi.IN_QUERY,
+    description='상영 중인 영화의 ID',
+    type=openapi.TYPE_INTEGER
+)
+showing_date_query_param = openapi.Parameter(
+    'date',
+    openapi.IN_QUERY,
+    description='상영 날짜 (YYMMDD, movie만 주면 오늘) - 예시: 200720',
+    type=openapi.TYPE_STRING
+)
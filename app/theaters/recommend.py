@@ -0,0 +1,81 @@
+from .layouts import SEAT_LAYOUTS
+
+# 연속 좌석 추천 - 행마다 좌석 열 번호를 bit 위치로 하는 정수 bitmask 사용
+# 예약 가능 좌석 mask에서 m & (m >> 1) & ... & (m >> (n - 1)) 의 set bit = n개 연속 가능 좌석의 시작 열
+# 통로/빈 열은 bit가 없으므로 자동으로 연속이 끊김
+# 점수: 블록 중앙과 기준점(좌우 중앙, 앞에서 IDEAL_ROW_RATIO 지점 행) 사이 거리 - 작을수록 좋음
+
+IDEAL_ROW_RATIO = 0.6
+# 앞뒤 거리보다 좌우 치우침을 더 크게 봄
+ROW_WEIGHT = 1.0
+COLUMN_WEIGHT = 1.5
+MAX_PARTY_SIZE = 8
+
+
+class RowGrid:
+    __slots__ = ('y', 'mask', 'names')
+
+    def __init__(self, y, mask, names):
+        self.y = y
+        self.mask = mask
+        self.names = names
+
+
+class SeatGrid:
+    def __init__(self, layout):
+        self.seats_type = layout.seats_type
+        self.positions = {seat.name: (seat.y, seat.column) for seat in layout.seats}
+        self.apart_names = frozenset(seat.name for seat in layout.seats if seat.apart)
+
+        rows = {}
+        for seat in layout.seats:
+            rows.setdefault(seat.y, {})[seat.column] = seat.name
+        # 띄어앉기석은 처음부터 mask에서 제외
+        self.rows = tuple(
+            RowGrid(y, sum(1 << column for column, name in names.items() if name not in self.apart_names), names)
+            for y, names in sorted(rows.items())
+        )
+
+        self.center_x = (1 + layout.columns) / 2
+        self.ideal_y = (len(self.rows) - 1) * IDEAL_ROW_RATIO
+
+    def score(self, y, start_column, count):
+        dx = start_column + (count - 1) / 2 - self.center_x
+        dy = y - self.ideal_y
+        return (COLUMN_WEIGHT * dx) ** 2 + (ROW_WEIGHT * dy) ** 2
+
+    def available_masks(self, unavailable_names):
+        # 행 y -> 예약 가능 좌석 mask
+        masks = {row.y: row.mask for row in self.rows}
+        for name in unavailable_names:
+            position = self.positions.get(name)
+            if position is not None:
+                masks[position[0]] &= ~(1 << position[1])
+        return masks
+
+    def recommend(self, unavailable_names, count):
+        # 가장 좋은 n개 연속 좌석 이름 (없으면 [])
+        masks = self.available_masks(unavailable_names)
+        best = None
+        for row in self.rows:
+            runs = masks[row.y]
+            for shift in range(1, count):
+                runs &= masks[row.y] >> shift
+            while runs:
+                low_bit = runs & -runs
+                start_column = low_bit.bit_length() - 1
+                score = self.score(row.y, start_column, count)
+                if best is None or score < best[0]:
+                    best = (score, row, start_column)
+                runs ^= low_bit
+        if best is None:
+            return []
+        _, row, start_column = best
+        return [row.names[column] for column in range(start_column, start_column + count)]
+
+
+SEAT_GRIDS = {seats_type: SeatGrid(layout) for seats_type, layout in SEAT_LAYOUTS.items()}
+
+
+def recommend_seats(seats_type, unavailable_names, count):
+    return SEAT_GRIDS[seats_type].recommend(unavailable_names, count)
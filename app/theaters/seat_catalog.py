@@ -0,0 +1,38 @@
+from utils.cache_versions import LocalVersionedValue
+
+# 좌석 이름 <-> ID - Seat 테이블은 거의 바뀌지 않는 작은 목록이므로 프로세스별로 1번만 조회해 보관
+# Seat 변경(signal, bulk_create/update) 시 버전을 올려 모든 프로세스가 다시 조회
+
+
+class SeatCatalog:
+    def __init__(self, seats):
+        # seats: [(id, name), ...] - 같은 이름이 여러 개면 id가 작은 좌석
+        self.ids_by_name = {}
+        for seat_id, name in seats:
+            self.ids_by_name.setdefault(name, seat_id)
+        self.names_by_id = {seat_id: name for name, seat_id in self.ids_by_name.items()}
+
+    def ids(self, names):
+        # {이름: ID} - 없는 이름은 제외
+        return {name: self.ids_by_name[name] for name in names if name in self.ids_by_name}
+
+    def names(self, seat_ids):
+        # {ID: 이름} - 없는 ID는 제외
+        return {seat_id: self.names_by_id[seat_id] for seat_id in seat_ids if seat_id in self.names_by_id}
+
+
+def build_seat_catalog():
+    from .models import Seat
+
+    return SeatCatalog(Seat.objects.order_by('id').values_list('id', 'name'))
+
+
+_seat_catalog = LocalVersionedValue('seat-catalog', build_seat_catalog)
+
+
+def get_seat_catalog():
+    return _seat_catalog.get()
+
+
+def invalidate_seat_catalog():
+    _seat_catalog.invalidate()
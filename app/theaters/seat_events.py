@@ -0,0 +1,176 @@
+import json
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+# 스케쥴별 좌석 변경 pub/sub - 예매 생성/삭제(취소, 미결제 자동 삭제) 시 좌석 이름 단위로 발행
+# 메시지: {'event': 'reserved' | 'released', 'seats': [좌석 이름, ...]}
+
+logger = logging.getLogger(__name__)
+
+RESERVED = 'reserved'
+RELEASED = 'released'
+
+
+def channel_name(schedule_id):
+    return f'seat-events:{schedule_id}'
+
+
+class BaseSeatEventBroker:
+    def publish(self, schedule_id, message):
+        raise NotImplementedError
+
+    def subscribe(self, schedule_id):
+        # get(timeout) -> message 또는 None, close()를 가진 구독 객체 반환
+        raise NotImplementedError
+
+
+class RedisSubscription:
+    def __init__(self, pubsub):
+        self.pubsub = pubsub
+
+    def get(self, timeout):
+        message = self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is None:
+            return None
+        return json.loads(message['data'])
+
+    def close(self):
+        self.pubsub.close()
+
+
+class RedisSeatEventBroker(BaseSeatEventBroker):
+    def __init__(self, url=None):
+        import redis
+
+        self.client = redis.Redis.from_url(url or settings.SEAT_EVENT_REDIS_URL)
+
+    def publish(self, schedule_id, message):
+        self.client.publish(channel_name(schedule_id), json.dumps(message))
+
+    def subscribe(self, schedule_id):
+        pubsub = self.client.pubsub()
+        pubsub.subscribe(channel_name(schedule_id))
+        return RedisSubscription(pubsub)
+
+
+class InMemorySubscription:
+    def __init__(self, broker, schedule_id):
+        self.broker = broker
+        self.schedule_id = schedule_id
+        self.queue = queue.Queue()
+
+    def get(self, timeout):
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InMemorySeatEventBroker(BaseSeatEventBroker):
+    # 테스트/로컬 개발용 - 같은 프로세스의 구독자에게만 전달
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscriptions = {}
+
+    def publish(self, schedule_id, message):
+        with self.lock:
+            subscriptions = list(self.subscriptions.get(schedule_id, ()))
+        for subscription in subscriptions:
+            subscription.queue.put(message)
+
+    def subscribe(self, schedule_id):
+        subscription = InMemorySubscription(self, schedule_id)
+        with self.lock:
+            self.subscriptions.setdefault(schedule_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.subscriptions.get(subscription.schedule_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self.subscriptions.pop(subscription.schedule_id, None)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_seat_event_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.SEAT_EVENT_BACKEND)()
+    return _broker
+
+
+@receiver(setting_changed)
+def reset_seat_event_broker(setting, **kwargs):
+    global _broker
+    if setting.startswith('SEAT_EVENT_'):
+        _broker = None
+
+
+class StreamSlots:
+    # 프로세스별 동시 스트림 수 제한 - 스트림이 worker 스레드를 모두 점유해 예매 요청이 막히지 않도록
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def acquire(self):
+        with self.lock:
+            if self.count >= settings.SEAT_EVENT_MAX_STREAMS:
+                return False
+            self.count += 1
+            return True
+
+    def release(self):
+        with self.lock:
+            self.count -= 1
+
+
+stream_slots = StreamSlots()
+
+
+class ClosingStream:
+    # StreamingHttpResponse는 close()가 있는 iterable을 응답 종료 시 닫음
+    # 한 번도 읽지 않은 generator는 close()해도 finally가 실행되지 않으므로 on_close를 따로 호출
+    def __init__(self, iterator, on_close):
+        self.iterator = iterator
+        self.on_close = on_close
+        self.closed = False
+
+    def __iter__(self):
+        return self.iterator
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.iterator.close()
+            self.on_close()
+
+
+def publish_seat_event(schedule_id, event, seat_names):
+    # 커밋된 변경만 발행 - 발행 실패가 예매 처리에 영향을 주지 않도록 예외는 기록만 함
+    seat_names = list(seat_names)
+    if not seat_names:
+        return
+
+    def publish():
+        try:
+            get_seat_event_broker().publish(schedule_id, {'event': event, 'seats': seat_names})
+        except Exception:
+            logger.exception('seat event publish failed (schedule_id=%s)', schedule_id)
+
+    transaction.on_commit(publish)
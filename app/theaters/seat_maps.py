@@ -0,0 +1,81 @@
+from django.conf import settings
+
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART_SET
+
+# 좌석 1개 = 1 byte
+# 하위 2bit: 좌석 종류 / RESERVED bit: 예약 여부
+GENERAL = 0
+SIT_APART = 1
+DISABLED = 2
+IMPOSSIBLE = 3
+KIND_MASK = 0b011
+RESERVED = 0b100
+
+KIND_BY_SEAT_TYPE = {
+    'general': GENERAL,
+    'sit_apart': SIT_APART,
+    'disabled': DISABLED,
+    'impossible': IMPOSSIBLE,
+}
+
+# seats_type별 좌석 이름 -> byte 위치
+SEAT_INDEX_CHART = {
+    seats_type: {name: index for index, name in enumerate(seats)}
+    for seats_type, seats in SEATING_CHART_GENERAL.items()
+}
+
+
+def is_seat_map_mode():
+    return getattr(settings, 'SEAT_STORAGE_MODE', 'seat_type') == 'seat_map'
+
+
+def build_states(seats_type):
+    apart_seats_set = SEATING_CHART_APART_SET.get(seats_type, frozenset())
+    return bytes(
+        SIT_APART if seat in apart_seats_set else GENERAL
+        for seat in SEATING_CHART_GENERAL.get(seats_type, [])
+    )
+
+
+class SeatMap:
+    def __init__(self, seats_type, states):
+        self.seats_type = seats_type
+        self.names = SEATING_CHART_GENERAL.get(seats_type, [])
+        self.index = SEAT_INDEX_CHART.get(seats_type, {})
+        self.states = bytearray(states)
+
+    def kind(self, name):
+        return self.states[self.index[name]] & KIND_MASK
+
+    def is_reserved(self, name):
+        return bool(self.states[self.index[name]] & RESERVED)
+
+    def count(self, kind):
+        return sum(1 for state in self.states if state & KIND_MASK == kind)
+
+    def count_reserved(self):
+        return sum(1 for state in self.states if state & RESERVED)
+
+    def reserved_names(self):
+        return [name for name, state in zip(self.names, self.states) if state & RESERVED]
+
+    def filter_names(self, names):
+        # 배치도에 있는 좌석 이름만 (배치도 순서 유지)
+        names = set(names)
+        return [name for name in self.names if name in names]
+
+    def set_kind(self, name, kind):
+        index = self.index[name]
+        self.states[index] = self.states[index] & RESERVED | kind
+
+    def reserve(self, names):
+        for name in names:
+            self.states[self.index[name]] |= RESERVED
+
+    def release(self, names):
+        for name in names:
+            if name in self.index:
+                self.states[self.index[name]] &= ~RESERVED & 0xFF
+
+    def to_bytes(self):
+        return bytes(self.states)
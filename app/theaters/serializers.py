@@ -1,7 +1,5 @@
-from django.db.models import Count
 from rest_framework import serializers
 
-from reservations.models import Reservation
 from utils.custom_functions import reformat_duration
 from .models import Screen
 
@@ -12,6 +10,17 @@ class ScheduleTheaterListSerializer(serializers.Serializer):
     name = serializers.CharField()
 
 
+# for Documentation
+class NearbyTheaterSerializer(serializers.Serializer):
+    theater_id = serializers.IntegerField()
+    name = serializers.CharField()
+    region_id = serializers.IntegerField()
+    region = serializers.CharField()
+    latitude = serializers.FloatField()
+    longitude = serializers.FloatField()
+    distance = serializers.FloatField(help_text='km')
+
+
 class ScheduleRegionCountSerializer(serializers.Serializer):
     region_id = serializers.IntegerField(source='region')
     region_name = serializers.CharField(source='region__name')
@@ -28,10 +37,35 @@ class SeatListSerializer(serializers.Serializer):
 
 
 class SeatIDListSerializer(serializers.Serializer):
-    seat_name = serializers.CharField(source='seat.name')
+    seat_name = serializers.CharField()
     seat_id = serializers.IntegerField()
 
 
+class QuoteSerializer(serializers.Serializer):
+    schedule_id = serializers.IntegerField()
+    adults = serializers.IntegerField(min_value=0, max_value=8, default=0)
+    teens = serializers.IntegerField(min_value=0, max_value=8, default=0)
+    preferentials = serializers.IntegerField(min_value=0, max_value=8, default=0)
+
+
+class ScheduleQuoteSerializer(serializers.Serializer):
+    quotes = serializers.ListField(child=QuoteSerializer(), min_length=1, max_length=50)
+
+
+# for Documentation
+class QuotePricesSerializer(serializers.Serializer):
+    adult = serializers.IntegerField()
+    teen = serializers.IntegerField()
+    preferential = serializers.IntegerField()
+
+
+# for Documentation
+class ScheduleQuoteResultSerializer(serializers.Serializer):
+    schedule_id = serializers.IntegerField()
+    prices = QuotePricesSerializer(help_text='등급별 좌석 1개 가격')
+    total_price = serializers.IntegerField()
+
+
 # for Documentation
 class TotalAndReservedSeatsCountSerializer(serializers.Serializer):
     total_seats = serializers.IntegerField()
@@ -62,8 +96,6 @@ class ScheduleMovieSerializer(serializers.Serializer):
     screen_type = serializers.CharField(source='screen.screen_type')
     seats_type = serializers.CharField(source='screen.seats_type')
     poster = serializers.ImageField(source='movie.poster')
-    total_seats = serializers.SerializerMethodField()
-    reserved_seats = serializers.SerializerMethodField()
 
     def get_running_time(self, obj):
         return reformat_duration(obj.movie.running_time)
@@ -71,13 +103,52 @@ class ScheduleMovieSerializer(serializers.Serializer):
     def get_end_time(self, obj):
         return f'{obj.start_time + obj.movie.running_time:%H:%M}'
 
-    def get_total_seats(self, obj):
-        return obj.seat_types.filter(type='general').count()
 
-    def get_reserved_seats(self, obj):
-        schedule = obj
-        return Reservation.objects.filter(
-            schedule=schedule,
-        ).aggregate(
-            reserved_seats=Count('seat_grades')
-        )['reserved_seats']
+# for Documentation
+# 좌석 수는 상영 정보와 캐싱 주기가 달라 view에서 따로 채움
+class ScheduleMovieSeatCountSerializer(ScheduleMovieSerializer):
+    total_seats = serializers.IntegerField()
+    reserved_seats = serializers.IntegerField()
+
+
+# for Documentation
+class ScheduleSearchSerializer(serializers.Serializer):
+    next = serializers.URLField(allow_null=True)
+    results = ScheduleMovieSeatCountSerializer(many=True)
+
+
+# for Documentation
+class CalendarScheduleSerializer(serializers.Serializer):
+    schedule_id = serializers.IntegerField()
+    start_time = serializers.CharField()
+    end_time = serializers.CharField()
+    screen = serializers.CharField()
+    screen_type = serializers.CharField()
+    seats_type = serializers.CharField()
+    total_seats = serializers.IntegerField()
+    reserved_seats = serializers.IntegerField()
+
+
+# for Documentation
+class CalendarMovieSerializer(serializers.Serializer):
+    movie_id = serializers.IntegerField()
+    movie = serializers.CharField()
+    grade = serializers.CharField()
+    running_time = serializers.CharField()
+    poster = serializers.CharField()
+    schedules = CalendarScheduleSerializer(many=True)
+
+
+# for Documentation
+class CalendarDateSerializer(serializers.Serializer):
+    date = serializers.CharField()
+    movies = CalendarMovieSerializer(many=True)
+
+
+# for Documentation
+class TheaterScheduleCalendarSerializer(serializers.Serializer):
+    theater_id = serializers.IntegerField()
+    start_date = serializers.CharField()
+    days = serializers.IntegerField()
+    dates_bitmap = serializers.CharField(help_text='start_date부터 하루에 1글자 - 상영이 있으면 1, 없으면 0')
+    dates = CalendarDateSerializer(many=True)
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from utils.cache_versions import bump_version, versioned_key
+
+# 날짜별 상영 정보(상영관 목록, 지역별 상영관 수, 스케쥴 목록) 캐시
+# 스케쥴 변경 -> 해당 날짜 버전만 올림 / 영화, 상영관, 스크린, 지역 변경 -> 전체 버전을 올림
+SHOWTIMES = 'showtimes'
+
+
+def date_version_name(date):
+    return f'{SHOWTIMES}:{date:%y%m%d}'
+
+
+def showtime_cache_key(view_name, date, *parts):
+    return versioned_key(SHOWTIMES, [SHOWTIMES, date_version_name(date)], view_name, f'{date:%y%m%d}', *parts)
+
+
+def get_or_set_showtimes(key, build):
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, settings.SHOWTIME_CACHE_TTL)
+    return data
+
+
+def invalidate_showtimes(dates=None):
+    # dates=None: 전체 무효화
+    if dates is None:
+        bump_version(SHOWTIMES)
+    else:
+        bump_version(*{date_version_name(date) for date in dates})
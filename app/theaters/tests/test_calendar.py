@@ -0,0 +1,68 @@
+import datetime
+
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from test_utils.fixtures import create_seats
+from theaters.models import ScheduleOccupancy
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+from utils.excepts import InvalidCalendarRangeException
+
+
+class TheaterScheduleCalendarTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.theater = baker.make('theaters.Theater')
+        cls.screen = baker.make('theaters.Screen', theater=cls.theater, seats_type='2')
+        cls.movies = [
+            baker.make('movies.Movie', rank=2, running_time=datetime.timedelta(minutes=100)),
+            baker.make('movies.Movie', rank=1, running_time=datetime.timedelta(minutes=120)),
+        ]
+        cls.url = f'/theaters/{cls.theater.id}/schedules/'
+
+        cls.schedules = [
+            baker.make('theaters.Schedule', screen=cls.screen, movie=movie, start_time=start_time)
+            for movie, start_time in [
+                (cls.movies[0], datetime.datetime(2020, 7, 20, 10)),
+                (cls.movies[1], datetime.datetime(2020, 7, 20, 13)),
+                (cls.movies[0], datetime.datetime(2020, 7, 22, 0)),
+                (cls.movies[0], datetime.datetime(2020, 7, 24, 0)),
+            ]
+        ]
+        # 다른 상영관
+        baker.make('theaters.Schedule', movie=cls.movies[0], screen__seats_type='2',
+                   start_time=datetime.datetime(2020, 7, 21, 10))
+
+    def test_calendar(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'from': '200720', 'days': 4})
+
+        total_seats = len(SEATING_CHART_GENERAL['2']) - len(SEATING_CHART_APART['2'])
+        self.assertEqual(response.data['dates_bitmap'], '1010')
+        self.assertEqual([date['date'] for date in response.data['dates']], ['2020-07-20', '2020-07-22'])
+
+        first_day = response.data['dates'][0]
+        self.assertEqual([movie['movie_id'] for movie in first_day['movies']], [self.movies[1].id, self.movies[0].id])
+        self.assertEqual(first_day['movies'][0]['schedules'], [{
+            'schedule_id': self.schedules[1].id,
+            'start_time': '13:00',
+            'end_time': '15:00',
+            'screen': self.screen.name,
+            'screen_type': self.screen.screen_type,
+            'seats_type': '2',
+            'total_seats': total_seats,
+            'reserved_seats': 0,
+        }])
+
+    def test_missing_occupancy(self):
+        ScheduleOccupancy.objects.filter(schedule=self.schedules[0]).delete()
+        response = self.client.get(self.url, {'from': '200720', 'days': 1})
+        schedule = response.data['dates'][0]['movies'][1]['schedules'][0]
+        self.assertEqual(schedule['schedule_id'], self.schedules[0].id)
+        self.assertEqual(schedule['total_seats'], len(SEATING_CHART_GENERAL['2']) - len(SEATING_CHART_APART['2']))
+
+    def test_invalid_range(self):
+        for params in ({'from': '2020-07-20'}, {'from': '200720', 'days': 15}, {'days': 'a'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.data['detail'].code, InvalidCalendarRangeException.default_code)
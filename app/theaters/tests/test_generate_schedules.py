@@ -0,0 +1,76 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from model_bakery import baker
+
+from test_utils.fixtures import create_seats
+from theaters.models import Schedule, SeatType, ScheduleOccupancy
+from utils.business_data import SEATING_CHART_GENERAL
+
+
+class GenerateSchedulesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.theater = baker.make('theaters.Theater')
+        cls.screens = baker.make('theaters.Screen', theater=cls.theater, seats_type='2', _quantity=2)
+        cls.movies = [
+            baker.make('movies.Movie', rank=1, running_time=datetime.timedelta(minutes=100)),
+            baker.make('movies.Movie', rank=2, running_time=datetime.timedelta(minutes=132)),
+        ]
+
+    def generate(self, *args):
+        call_command(
+            'generate_schedules', '2020-07-20', '2020-07-21',
+            '--open', '10:00', '--close', '22:00', '--cleanup', '15', '--chunk-size', '3',
+            *args, stdout=StringIO(),
+        )
+
+    def test_generate(self):
+        self.generate('--movies', str(self.movies[1].id), str(self.movies[0].id))
+
+        schedules = list(Schedule.objects.select_related('movie').order_by('screen_id', 'start_time'))
+        self.assertTrue(schedules)
+        self.assertEqual({schedule.start_time.date() for schedule in schedules},
+                         {datetime.date(2020, 7, 20), datetime.date(2020, 7, 21)})
+        for previous, schedule in zip(schedules, schedules[1:]):
+            if previous.screen_id != schedule.screen_id or previous.start_time.date() != schedule.start_time.date():
+                continue
+            # 겹치지 않음 + 정리 시간 + 5분 단위 시작
+            self.assertGreaterEqual(
+                schedule.start_time, previous.start_time + previous.movie.running_time + datetime.timedelta(minutes=15)
+            )
+            self.assertNotEqual(previous.movie_id, schedule.movie_id)
+            self.assertEqual(schedule.start_time.minute % 5, 0)
+        self.assertTrue(all(
+            datetime.time(10) <= schedule.start_time.time() < datetime.time(22) for schedule in schedules
+        ))
+
+        self.assertEqual(SeatType.objects.count(), len(schedules) * len(SEATING_CHART_GENERAL['2']))
+        self.assertEqual(ScheduleOccupancy.objects.count(), len(schedules))
+
+    def test_skip_scheduled_days(self):
+        baker.make('theaters.Schedule', screen=self.screens[0], movie=self.movies[0],
+                   start_time=datetime.datetime(2020, 7, 20, 12))
+        self.generate()
+
+        self.assertEqual(
+            Schedule.objects.filter(screen=self.screens[0], start_time__date=datetime.date(2020, 7, 20)).count(), 1
+        )
+        self.assertEqual(
+            Schedule.objects.filter(screen=self.screens[1], start_time__date=datetime.date(2020, 7, 20)).count(),
+            Schedule.objects.filter(screen=self.screens[0], start_time__date=datetime.date(2020, 7, 21)).count(),
+        )
+
+    def test_invalidate_late_night_dates(self):
+        with mock.patch('theaters.management.commands.generate_schedules.invalidate_showtimes') as invalidate:
+            self.generate('--close', '26:00')
+
+        # 마지막 날의 심야 회차가 있는 다음 날짜도 무효화
+        self.assertTrue(Schedule.objects.filter(start_time__date=datetime.date(2020, 7, 22)).exists())
+        self.assertEqual(invalidate.call_args[1]['dates'], [
+            datetime.date(2020, 7, 20), datetime.date(2020, 7, 21), datetime.date(2020, 7, 22),
+        ])
@@ -0,0 +1,106 @@
+import datetime
+import random
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from test_utils.fixtures import create_seats
+from test_utils.transactions import capture_on_commit_callbacks
+from theaters.geo import KDTree, to_xyz, chord_to_km
+from utils.excepts import InvalidNearbyTheaterQueryException
+
+
+class KDTreeTest(SimpleTestCase):
+    def test_nearest_matches_brute_force(self):
+        random.seed(0)
+        points = [(random.uniform(33, 38.5), random.uniform(126, 129.5)) for _ in range(300)]
+        tree = KDTree([(to_xyz(*point), index) for index, point in enumerate(points)])
+
+        for _ in range(20):
+            query = to_xyz(random.uniform(33, 38.5), random.uniform(126, 129.5))
+            distances = sorted(
+                (sum((a - b) ** 2 for a, b in zip(query, to_xyz(*point))), index)
+                for index, point in enumerate(points)
+            )
+            self.assertEqual([index for _, index in tree.nearest(query, 5)], [index for _, index in distances[:5]])
+
+            even = [index for _, index in distances if index % 2 == 0][:3]
+            self.assertEqual([index for _, index in tree.nearest(query, 3, lambda index: index % 2 == 0)], even)
+
+    def test_distance(self):
+        # 서울시청 - 부산시청 약 325km
+        chord = sum((a - b) ** 2 for a, b in zip(to_xyz(37.5663, 126.9779), to_xyz(35.1798, 129.0750))) ** 0.5
+        self.assertAlmostEqual(chord_to_km(chord), 325, delta=5)
+
+
+class NearbyTheaterListTest(APITestCase):
+    url = '/theaters/nearby/'
+    # 서울역
+    origin = {'lat': 37.5547, 'lng': 126.9707}
+
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        region = baker.make('theaters.Region')
+        cls.theaters = [
+            baker.make('theaters.Theater', region=region, latitude=latitude, longitude=longitude)
+            for latitude, longitude in [
+                (37.5600, 126.9800),  # 시청 부근
+                (37.5172, 127.0473),  # 강남
+                (35.1798, 129.0750),  # 부산
+            ]
+        ]
+        # 좌표 없음
+        baker.make('theaters.Theater', region=region)
+
+        cls.movie = baker.make('movies.Movie', running_time=datetime.timedelta(minutes=100))
+        screen = baker.make('theaters.Screen', theater=cls.theaters[2], seats_type='2')
+        baker.make('theaters.Schedule', movie=cls.movie, screen=screen, start_time=datetime.datetime(2020, 7, 20, 10))
+
+    def setUp(self):
+        cache.clear()
+
+    def theater_ids(self, response):
+        return [theater['theater_id'] for theater in response.data]
+
+    def test_nearby(self):
+        response = self.client.get(self.url, {**self.origin, 'k': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.theater_ids(response), [self.theaters[0].id, self.theaters[1].id])
+        self.assertLess(response.data[0]['distance'], response.data[1]['distance'])
+
+    def test_showing_movie(self):
+        response = self.client.get(self.url, {**self.origin, 'movie': self.movie.id, 'date': '200720'})
+        self.assertEqual(self.theater_ids(response), [self.theaters[2].id])
+
+        response = self.client.get(self.url, {**self.origin, 'movie': self.movie.id, 'date': '200721'})
+        self.assertEqual(response.data, [])
+
+    def test_refresh_on_theater_change(self):
+        self.client.get(self.url, self.origin)
+
+        theater = self.theaters[2]
+        theater.latitude, theater.longitude = 37.5550, 126.9710
+        with capture_on_commit_callbacks() as callbacks:
+            theater.save()
+        # 커밋 전에는 이전 인덱스 유지
+        with self.assertNumQueries(0):
+            self.client.get(self.url, self.origin)
+
+        for callback in callbacks:
+            callback()
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {**self.origin, 'k': 1})
+        self.assertEqual(self.theater_ids(response), [theater.id])
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {**self.origin, 'k': 1})
+
+    def test_invalid_query(self):
+        for params in [{}, {'lat': 'a', 'lng': 127}, {'lat': 91, 'lng': 127}, {**self.origin, 'k': 0}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data['detail'].code, InvalidNearbyTheaterQueryException.default_code)
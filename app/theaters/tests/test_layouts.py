@@ -0,0 +1,70 @@
+import json
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from test_utils.fixtures import create_seats
+from test_utils.transactions import capture_on_commit_callbacks
+from theaters.layouts import SEAT_LAYOUTS, reset_rendered_layouts
+from theaters.models import Seat
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+
+
+class SeatLayoutTest(SimpleTestCase):
+    def test_compile(self):
+        layout = SEAT_LAYOUTS['1']
+        self.assertEqual(len(layout.seats), len(SEATING_CHART_GENERAL['1']))
+        self.assertEqual(layout.columns, 22)
+        self.assertEqual(layout.aisles, (7, 8))
+
+        seats = {seat.name: seat for seat in layout.seats}
+        self.assertEqual((seats['A2'].x, seats['A2'].y), (1, 0))
+        self.assertEqual((seats['N20'].x, seats['N20'].y), (19, 13))
+        self.assertEqual({name for name, seat in seats.items() if seat.apart}, set(SEATING_CHART_APART['1']))
+
+
+class ScreenLayoutTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.screen = baker.make('theaters.Screen', seats_type='2')
+        cls.url = f'/theaters/screens/{cls.screen.id}/layout/'
+
+    def setUp(self):
+        cache.clear()
+        reset_rendered_layouts()
+
+    def test_layout(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('max-age', response['Cache-Control'])
+        data = json.loads(response.content)
+        self.assertEqual(data['seats_type'], '2')
+        seat = data['seats'][0]
+        self.assertEqual(seat['seat_id'], Seat.objects.get(name=seat['name']).id)
+
+        # 첫 요청 이후에는 DB 조회 없음
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+
+    def test_screen_changed(self):
+        etag = self.client.get(self.url)['ETag']
+        self.screen.seats_type = '0'
+        with capture_on_commit_callbacks() as callbacks:
+            self.screen.save()
+        # 커밋 전에는 이전 배치도 유지
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        for callback in callbacks:
+            callback()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_invalid_screen(self):
+        self.assertEqual(self.client.get(f'/theaters/screens/{self.screen.id + 100}/layout/').status_code, 404)
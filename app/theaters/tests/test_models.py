@@ -0,0 +1,62 @@
+from django.test import TestCase
+from model_bakery import baker
+
+from test_utils.transactions import capture_on_commit_callbacks
+from theaters.models import Schedule, Seat, SeatType
+from theaters.seat_catalog import get_seat_catalog, invalidate_seat_catalog
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+
+
+class CreateSeatsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seat_names = set()
+        for general_seats_list in SEATING_CHART_GENERAL.values():
+            seat_names.update(general_seats_list)
+        Seat.objects.bulk_create([Seat(name=name) for name in sorted(seat_names)])
+        invalidate_seat_catalog()
+        cls.movie = baker.make('movies.Movie')
+
+    def test_create_seat_types_per_seats_type(self):
+        for seats_type, general_seats_list in SEATING_CHART_GENERAL.items():
+            screen = baker.make('theaters.Screen', seats_type=seats_type)
+            schedule = baker.make('theaters.Schedule', screen=screen, movie=self.movie)
+
+            seat_types = SeatType.objects.filter(schedule=schedule)
+            self.assertEqual(seat_types.count(), len(general_seats_list))
+            self.assertEqual(
+                set(seat_types.filter(type='sit_apart').values_list('seat__name', flat=True)),
+                set(SEATING_CHART_APART[seats_type]),
+            )
+
+    def test_create_seats_query_count(self):
+        screen = baker.make('theaters.Screen', seats_type='1')
+
+        # schedule insert 1 + SeatType bulk insert 1 + ScheduleOccupancy insert 1 (좌석 ID는 프로세스 캐시)
+        get_seat_catalog()
+        with self.assertNumQueries(3):
+            Schedule.objects.create(screen=screen, movie=self.movie, start_time='2020-07-20 10:00')
+
+    def test_seat_catalog_invalidation(self):
+        catalog = get_seat_catalog()
+        self.assertIs(get_seat_catalog(), catalog)
+
+        with capture_on_commit_callbacks() as callbacks:
+            seat = Seat.objects.create(name='Z1')
+        # 커밋 전에는 이전 목록 유지 (롤백된 좌석을 다른 프로세스가 보관하지 않도록)
+        self.assertIs(get_seat_catalog(), catalog)
+        for callback in callbacks:
+            callback()
+        self.assertEqual(get_seat_catalog().ids(['Z1']), {'Z1': seat.id})
+
+        with capture_on_commit_callbacks(execute=True):
+            Seat.objects.filter(pk=seat.pk).update(name='Z2')
+        self.assertEqual(get_seat_catalog().names([seat.id]), {seat.id: 'Z2'})
+
+    def test_missing_seat(self):
+        with capture_on_commit_callbacks(execute=True):
+            Seat.objects.filter(name='A1').delete()
+        screen = baker.make('theaters.Screen', seats_type='0')
+
+        with self.assertRaises(Seat.DoesNotExist):
+            Schedule.objects.create(screen=screen, movie=self.movie, start_time='2020-07-20 10:00')
@@ -0,0 +1,91 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from reservations.holds import get_seat_hold
+from reservations.models import Reservation
+from reservations.tasks import delete_unpaid_reservations
+from test_utils.fixtures import create_seats
+from theaters.models import Schedule, ScheduleOccupancy
+from theaters.occupancy import get_occupancy
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+
+
+@override_settings(SEAT_HOLD_BACKEND='reservations.holds.InMemorySeatHold')
+class ScheduleOccupancyTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seat_ids = create_seats()
+        cls.member = baker.make('members.Member')
+        cls.schedule = baker.make('theaters.Schedule', screen__seats_type='2')
+        cls.total_seats = len(SEATING_CHART_GENERAL['2']) - len(SEATING_CHART_APART['2'])
+
+    def setUp(self):
+        get_seat_hold().clear()
+        self.client.force_authenticate(self.member)
+
+    def reserve(self, seat_names):
+        return self.client.post('/reservations/', {
+            'schedule_id': self.schedule.id,
+            'grades': ['adult'] * len(seat_names),
+            'seat_ids': [self.seat_ids[name] for name in seat_names],
+        })
+
+    def get_counts(self):
+        occupancy = ScheduleOccupancy.objects.get(schedule=self.schedule)
+        return occupancy.total_seats, occupancy.reserved_seats, occupancy.held_seats
+
+    def test_created_with_schedule(self):
+        self.assertEqual(self.get_counts(), (self.total_seats, 0, 0))
+
+    def test_reserve_and_delete(self):
+        reservation_id = self.reserve(['A2', 'A3']).data['reservation_id']
+        self.reserve(['B1'])
+        self.assertEqual(self.get_counts(), (self.total_seats, 3, 3))
+
+        response = self.client.get(f'/theaters/schedules/{self.schedule.id}/seats/count/')
+        self.assertEqual(response.data, {'total_seats': self.total_seats, 'reserved_seats': 3})
+
+        self.client.delete(f'/reservations/{reservation_id}/')
+        self.assertEqual(self.get_counts(), (self.total_seats, 1, 1))
+
+    def test_delete_unpaid_reservations(self):
+        self.reserve(['A2', 'A3'])
+        paid_reservation_id = self.reserve(['B1']).data['reservation_id']
+        Reservation.objects.filter(pk=paid_reservation_id).update(payment=baker.make('reservations.Payment'))
+        call_command('repair_occupancy', self.schedule.id, stdout=StringIO())
+        self.assertEqual(self.get_counts(), (self.total_seats, 3, 2))
+
+        Reservation.objects.update(reserved_at=datetime.datetime.now() - datetime.timedelta(minutes=11))
+        delete_unpaid_reservations()
+        self.assertEqual(self.get_counts(), (self.total_seats, 1, 0))
+
+    def test_repair_occupancy(self):
+        self.reserve(['A2', 'A3'])
+        ScheduleOccupancy.objects.all().delete()
+
+        response = self.client.get(f'/theaters/schedules/{self.schedule.id}/seats/count/')
+        self.assertEqual(response.data, {'total_seats': self.total_seats, 'reserved_seats': 2})
+
+        ScheduleOccupancy.objects.update(total_seats=0, reserved_seats=0, held_seats=0)
+        call_command('repair_occupancy', stdout=StringIO())
+        self.assertEqual(self.get_counts(), (self.total_seats, 2, 2))
+
+    def test_concurrent_lazy_create(self):
+        ScheduleOccupancy.objects.all().delete()
+        bulk_create = ScheduleOccupancy.objects.bulk_create
+
+        def create_first(occupancies, **kwargs):
+            # 조회와 insert 사이에 다른 요청이 먼저 row를 만든 경우
+            ScheduleOccupancy.objects.create(schedule=self.schedule, total_seats=self.total_seats)
+            return bulk_create(occupancies, **kwargs)
+
+        with mock.patch.object(ScheduleOccupancy.objects, 'bulk_create', create_first):
+            occupancy = get_occupancy(Schedule.objects.get(pk=self.schedule.pk))
+        self.assertEqual(occupancy.pk, ScheduleOccupancy.objects.get().pk)
+        self.assertEqual(occupancy.total_seats, self.total_seats)
@@ -0,0 +1,69 @@
+import datetime
+
+from django.test import SimpleTestCase
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from test_utils.fixtures import create_seats
+from utils.excepts import InvalidScheduleIdException
+from utils.pricing import PricingEngine, DiscountRule, PRICING
+
+
+class PricingEngineTest(SimpleTestCase):
+    screen_prices = {'2D': 11000, '3D': 13000, 'default': 11000}
+    grade_rates = {'adult': 1, 'teen': 0.75, 'preferential': 0.75, 'default': 1}
+
+    def test_price_table(self):
+        engine = PricingEngine(self.screen_prices, self.grade_rates)
+        self.assertEqual(engine.price('3D', 'teen'), 9750)
+        self.assertEqual(engine.price('4DX', 'adult'), 11000)
+        self.assertEqual(engine.total('2D', {'adult': 2, 'teen': 1}), 30250)
+
+    def test_discount_rules(self):
+        engine = PricingEngine(self.screen_prices, self.grade_rates, [
+            DiscountRule('morning', hours=(0, 10), amount=2000),
+            DiscountRule('weekend-3d', weekdays=(5, 6), screen_types=('3D',), rate=0.1),
+        ])
+        # 2020-07-20 월요일, 2020-07-25 토요일
+        self.assertEqual(engine.price('2D', 'adult', datetime.datetime(2020, 7, 20, 9, 50)), 9000)
+        self.assertEqual(engine.price('2D', 'adult', datetime.datetime(2020, 7, 20, 10)), 11000)
+        self.assertEqual(engine.price('3D', 'adult', datetime.datetime(2020, 7, 25, 20)), 11700)
+        # 순서대로 적용 - (13000 - 2000) * 0.9
+        self.assertEqual(engine.price('3D', 'adult', datetime.datetime(2020, 7, 25, 9)), 9900)
+
+
+class ScheduleQuoteTest(APITestCase):
+    url = '/theaters/schedules/quote/'
+
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.schedules = [
+            baker.make('theaters.Schedule', screen__seats_type='2', screen__screen_type=screen_type)
+            for screen_type in ('2D', '3D')
+        ]
+
+    def test_quote(self):
+        with self.assertNumQueries(1):
+            response = self.client.post(self.url, {'quotes': [
+                {'schedule_id': self.schedules[0].id, 'adults': 2, 'teens': 1},
+                {'schedule_id': self.schedules[1].id, 'preferentials': 3},
+            ]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['total_price'], PRICING.price('2D', 'adult') * 2 + PRICING.price('2D', 'teen'))
+        self.assertEqual(response.data[1]['total_price'], PRICING.price('3D', 'preferential') * 3)
+        self.assertEqual(response.data[1]['prices']['adult'], PRICING.price('3D', 'adult'))
+
+    def test_invalid_quote(self):
+        response = self.client.post(self.url, {'quotes': [{'schedule_id': self.schedules[1].id + 1, 'adults': 1}]})
+        self.assertEqual(response.data['detail'].code, InvalidScheduleIdException.default_code)
+
+        response = self.client.post(self.url, {'quotes': [{'schedule_id': self.schedules[0].id, 'adults': -1}]})
+        self.assertEqual(response.status_code, 400)
+
+    def test_seats_total_price(self):
+        response = self.client.get(
+            f'/theaters/schedules/{self.schedules[1].id}/price/', {'adults': 1, 'teens': 2}
+        )
+        self.assertEqual(response.data['total_price'], 13000 + 9750 * 2)
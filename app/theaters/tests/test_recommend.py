@@ -0,0 +1,82 @@
+import random
+
+from django.test import SimpleTestCase, override_settings
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from reservations.holds import get_seat_hold
+from test_utils.fixtures import create_seats
+from theaters.recommend import SEAT_GRIDS, recommend_seats
+from utils.business_data import SEATING_CHART_APART
+from utils.excepts import InvalidPartySizeException
+
+
+def brute_force_score(grid, unavailable_names, count):
+    # 모든 연속 블록을 직접 확인
+    unavailable_names = set(unavailable_names) | grid.apart_names
+    best = None
+    for row in grid.rows:
+        for start_column in row.names:
+            names = [row.names.get(column) for column in range(start_column, start_column + count)]
+            if None in names or unavailable_names & set(names):
+                continue
+            score = grid.score(row.y, start_column, count)
+            if best is None or score < best:
+                best = score
+    return best
+
+
+class RecommendSeatsTest(SimpleTestCase):
+    def test_best_block(self):
+        rng = random.Random(0)
+        for seats_type, grid in SEAT_GRIDS.items():
+            names = list(grid.positions)
+            for _ in range(50):
+                unavailable_names = set(rng.sample(names, rng.randint(0, len(names) // 2)))
+                for count in (1, 2, 3):
+                    seat_names = recommend_seats(seats_type, unavailable_names, count)
+                    expected = brute_force_score(grid, unavailable_names, count)
+                    if expected is None:
+                        self.assertEqual(seat_names, [])
+                        continue
+
+                    self.assertEqual(len(seat_names), count)
+                    self.assertFalse(unavailable_names & set(seat_names))
+                    self.assertFalse(grid.apart_names & set(seat_names))
+                    positions = [grid.positions[name] for name in seat_names]
+                    self.assertEqual({y for y, _ in positions}, {positions[0][0]})
+                    self.assertEqual([column for _, column in positions],
+                                     list(range(positions[0][1], positions[0][1] + count)))
+                    self.assertEqual(grid.score(positions[0][0], positions[0][1], count), expected)
+
+
+@override_settings(SEAT_HOLD_BACKEND='reservations.holds.InMemorySeatHold')
+class RecommendedSeatListTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.schedule = baker.make('theaters.Schedule', screen__seats_type='2')
+        cls.url = f'/theaters/schedules/{cls.schedule.id}/seats/recommend/'
+
+    def setUp(self):
+        get_seat_hold().clear()
+
+    def test_recommend(self):
+        response = self.client.get(self.url, {'count': 2})
+        seat_names = [seat['seat_name'] for seat in response.data]
+        self.assertEqual(seat_names, recommend_seats('2', [], 2))
+        self.assertFalse(set(seat_names) & set(SEATING_CHART_APART['2']))
+
+        self.client.force_authenticate(baker.make('members.Member'))
+        self.client.post('/reservations/', {
+            'schedule_id': self.schedule.id,
+            'grades': ['adult', 'adult'],
+            'seat_ids': [seat['seat_id'] for seat in response.data],
+        })
+        response = self.client.get(self.url, {'count': 2})
+        self.assertFalse(set(seat['seat_name'] for seat in response.data) & set(seat_names))
+
+    def test_invalid_count(self):
+        for count in ('0', '9', 'two'):
+            response = self.client.get(self.url, {'count': count})
+            self.assertEqual(response.data['detail'].code, InvalidPartySizeException.default_code)
@@ -0,0 +1,81 @@
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from test_utils.fixtures import create_seats
+from theaters.views import ScheduleSearchPagination
+from utils.excepts import InvalidScheduleSearchException
+
+
+class ScheduleSearchListTest(APITestCase):
+    url = '/theaters/schedules/search/'
+
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.movie = baker.make('movies.Movie', running_time=datetime.timedelta(minutes=100))
+        regions = baker.make('theaters.Region', _quantity=2)
+        screens = [baker.make('theaters.Screen', theater__region=region, seats_type='2') for region in regions]
+
+        cls.schedules = [
+            baker.make('theaters.Schedule', movie=cls.movie, screen=screen, start_time=start_time)
+            for screen, start_time in [
+                (screens[0], datetime.datetime(2020, 7, 20, 9)),
+                # 같은 시각 - id 순
+                (screens[0], datetime.datetime(2020, 7, 20, 14)),
+                (screens[1], datetime.datetime(2020, 7, 20, 14)),
+                (screens[1], datetime.datetime(2020, 7, 21, 22)),
+                (screens[0], datetime.datetime(2020, 7, 22, 14)),
+            ]
+        ]
+        cls.region = regions[0]
+        # 다른 영화, 기간 밖
+        baker.make('theaters.Schedule', screen=screens[0], start_time=datetime.datetime(2020, 7, 20, 15))
+        baker.make('theaters.Schedule', movie=cls.movie, screen=screens[0], start_time=datetime.datetime(2020, 7, 19, 15))
+
+    def setUp(self):
+        cache.clear()
+
+    def schedule_ids(self, response):
+        return [schedule['schedule_id'] for schedule in response.data['results']]
+
+    def test_search(self):
+        response = self.client.get(self.url, {'movie': self.movie.id, 'from': '200720', 'days': 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['next'])
+        self.assertEqual(self.schedule_ids(response), [schedule.id for schedule in self.schedules])
+        self.assertEqual(response.data['results'][0]['total_seats'], self.schedules[0].occupancy.total_seats)
+
+    def test_filters(self):
+        response = self.client.get(self.url, {
+            'movie': self.movie.id, 'region': self.region.id, 'from': '200720', 'days': 3, 'time': '13-16',
+        })
+        self.assertEqual(self.schedule_ids(response), [self.schedules[1].id, self.schedules[4].id])
+
+        response = self.client.get(self.url, {'movie': self.movie.id, 'from': '200720', 'days': 3, 'time': '21-00'})
+        self.assertEqual(self.schedule_ids(response), [self.schedules[3].id])
+
+    def test_keyset_pagination(self):
+        schedule_ids = []
+        next_url = f'{self.url}?movie={self.movie.id}&from=200720&days=3'
+        with mock.patch.object(ScheduleSearchPagination, 'page_size', 2):
+            while next_url:
+                response = self.client.get(next_url)
+                self.assertLessEqual(len(response.data['results']), 2)
+                schedule_ids += self.schedule_ids(response)
+                next_url = response.data['next']
+
+        self.assertEqual(schedule_ids, [schedule.id for schedule in self.schedules])
+
+    def test_invalid_params(self):
+        for params in [{}, {'movie': 'a'}, {'movie': self.movie.id, 'time': '10-12'}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data['detail'].code, InvalidScheduleSearchException.default_code)
+
+        response = self.client.get(self.url, {'movie': self.movie.id, 'cursor': 'invalid'})
+        self.assertEqual(response.status_code, 404)
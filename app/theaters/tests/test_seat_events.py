@@ -0,0 +1,91 @@
+import json
+
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from reservations.holds import get_seat_hold
+from test_utils.fixtures import create_seats
+from theaters.seat_events import InMemorySeatEventBroker, RESERVED, stream_slots
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+from utils.excepts import SeatEventStreamLimitException
+
+
+class InMemorySeatEventBrokerTest(SimpleTestCase):
+    def test_publish_subscribe(self):
+        broker = InMemorySeatEventBroker()
+        subscription = broker.subscribe(1)
+        other_subscription = broker.subscribe(2)
+
+        broker.publish(1, {'event': RESERVED, 'seats': ['A2']})
+        self.assertEqual(subscription.get(timeout=0), {'event': RESERVED, 'seats': ['A2']})
+        self.assertIsNone(subscription.get(timeout=0))
+        self.assertIsNone(other_subscription.get(timeout=0))
+
+        subscription.close()
+        other_subscription.close()
+        self.assertEqual(broker.subscriptions, {})
+
+
+@override_settings(
+    SEAT_HOLD_BACKEND='reservations.holds.InMemorySeatHold',
+    SEAT_EVENT_BACKEND='theaters.seat_events.InMemorySeatEventBroker',
+    SEAT_EVENT_HEARTBEAT=0.01,
+)
+class SeatAvailabilityStreamTest(TransactionTestCase):
+    # 예매 커밋 후(on_commit) 발행되므로 TransactionTestCase 사용
+    def setUp(self):
+        get_seat_hold().clear()
+        self.seat_ids = create_seats()
+        self.schedule = baker.make('theaters.Schedule', screen__seats_type='2')
+        self.client = APIClient()
+        self.client.force_authenticate(baker.make('members.Member'))
+
+    def reserve(self, seat_names):
+        return self.client.post('/reservations/', {
+            'schedule_id': self.schedule.id,
+            'grades': ['adult'] * len(seat_names),
+            'seat_ids': [self.seat_ids[name] for name in seat_names],
+        })
+
+    def next_event(self, stream):
+        for chunk in stream:
+            chunk = chunk.decode()
+            if chunk.startswith('event: '):
+                event, data = chunk.strip().split('\n')
+                return event[len('event: '):], json.loads(data[len('data: '):])
+
+    def test_stream(self):
+        self.reserve(['A2'])
+
+        response = self.client.get(f'/theaters/schedules/{self.schedule.id}/seats/stream/')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = iter(response.streaming_content)
+        total_seats = len(SEATING_CHART_GENERAL['2']) - len(SEATING_CHART_APART['2'])
+        self.assertEqual(self.next_event(stream), ('snapshot', {'total_seats': total_seats, 'reserved_seats': ['A2']}))
+
+        reservation_id = self.reserve(['B1', 'B3']).data['reservation_id']
+        self.assertEqual(self.next_event(stream), ('reserved', {'seats': ['B1', 'B3']}))
+
+        self.client.delete(f'/reservations/{reservation_id}/')
+        self.assertEqual(self.next_event(stream), ('released', {'seats': ['B1', 'B3']}))
+        response.close()
+
+    def test_invalid_schedule(self):
+        response = self.client.get(f'/theaters/schedules/{self.schedule.id + 100}/seats/stream/')
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(SEAT_EVENT_MAX_STREAMS=1)
+    def test_stream_limit(self):
+        url = f'/theaters/schedules/{self.schedule.id}/seats/stream/'
+        response = self.client.get(url)
+        limited_response = self.client.get(url)
+        self.assertEqual(limited_response.status_code, 503)
+        self.assertEqual(limited_response.data['detail'].code, SeatEventStreamLimitException.default_code)
+
+        # 한 번도 읽지 않은 스트림도 응답을 닫으면 자리가 반환됨
+        response.close()
+        self.assertEqual(stream_slots.count, 0)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        response.close()
@@ -0,0 +1,70 @@
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from reservations.holds import get_seat_hold
+from reservations.models import Reservation
+from test_utils.fixtures import create_seats
+from theaters.models import SeatType, ScheduleSeatMap
+from theaters.seat_maps import SIT_APART
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+from utils.excepts import TakenSeatException, InvalidSeatException
+
+
+@override_settings(SEAT_STORAGE_MODE='seat_map', SEAT_HOLD_BACKEND='reservations.holds.InMemorySeatHold')
+class SeatMapModeTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seat_ids = create_seats()
+        cls.member = baker.make('members.Member')
+        screen = baker.make('theaters.Screen', seats_type='2')
+        with override_settings(SEAT_STORAGE_MODE='seat_map'):
+            cls.schedule = baker.make('theaters.Schedule', screen=screen)
+
+    def setUp(self):
+        get_seat_hold().clear()
+        self.client.force_authenticate(self.member)
+
+    def reserve(self, seat_names):
+        return self.client.post('/reservations/', {
+            'schedule_id': self.schedule.id,
+            'grades': ['adult'] * len(seat_names),
+            'seat_ids': [self.seat_ids[name] for name in seat_names],
+        })
+
+    def test_seat_map_created_instead_of_seat_types(self):
+        self.assertFalse(SeatType.objects.filter(schedule=self.schedule).exists())
+        seat_map = ScheduleSeatMap.objects.get(schedule=self.schedule).get_seat_map()
+        self.assertEqual(len(seat_map.to_bytes()), len(SEATING_CHART_GENERAL['2']))
+        self.assertEqual(seat_map.kind(SEATING_CHART_APART['2'][0]), SIT_APART)
+
+    def test_reserve_and_release(self):
+        response = self.reserve(['A2', 'A3'])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(f'/theaters/schedules/{self.schedule.id}/seats/count/')
+        self.assertEqual(response.data, {
+            'total_seats': len(SEATING_CHART_GENERAL['2']) - len(SEATING_CHART_APART['2']),
+            'reserved_seats': 2,
+        })
+        response = self.client.get(f'/theaters/schedules/{self.schedule.id}/reserved-seats/')
+        self.assertEqual([seat['reserved_seat'] for seat in response.data], ['A2', 'A3'])
+
+        response = self.reserve(['A3'])
+        self.assertEqual(response.data['detail'].code, TakenSeatException.default_code)
+
+        Reservation.objects.filter(schedule=self.schedule).delete()
+        seat_map = ScheduleSeatMap.objects.get(schedule=self.schedule).get_seat_map()
+        self.assertEqual(seat_map.count_reserved(), 0)
+
+    def test_sit_apart_seat(self):
+        response = self.reserve([SEATING_CHART_APART['2'][0]])
+        self.assertEqual(response.data['detail'].code, InvalidSeatException.default_code)
+
+    def test_seat_id_list(self):
+        response = self.client.get(f'/theaters/schedules/{self.schedule.id}/seats/', {'names': 'A2 B3 Z99'})
+        self.assertEqual(response.data, [
+            {'seat_name': 'A2', 'seat_id': self.seat_ids['A2']},
+            {'seat_name': 'B3', 'seat_id': self.seat_ids['B3']},
+        ])
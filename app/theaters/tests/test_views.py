@@ -0,0 +1,212 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+from test_utils.fixtures import create_seats
+from test_utils.transactions import capture_on_commit_callbacks
+from theaters.models import Seat, Schedule
+from theaters.serializers import SeatIDListSerializer
+from utils.business_data import SEATING_CHART_GENERAL, SEATING_CHART_APART
+
+
+class ScheduleListGivenDateTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.theater = baker.make('theaters.Theater')
+        cls.screen = baker.make('theaters.Screen', theater=cls.theater, seats_type='2')
+        cls.movie = baker.make('movies.Movie', running_time=datetime.timedelta(minutes=120))
+        cls.url = f'/theaters/{cls.theater.id}/schedules/200720/'
+
+    def setUp(self):
+        cache.clear()
+
+    def make_schedules(self, quantity):
+        schedules = []
+        with capture_on_commit_callbacks(execute=True):
+            for hour in range(quantity):
+                schedules.append(baker.make(
+                    'theaters.Schedule',
+                    movie=self.movie,
+                    screen=self.screen,
+                    start_time=datetime.datetime(2020, 7, 20, 9 + hour),
+                ))
+        return schedules
+
+    def get_query_count(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        return response, len(context.captured_queries)
+
+    def test_seat_counts(self):
+        schedule, _ = self.make_schedules(2)
+        self.client.force_authenticate(baker.make('members.Member'))
+        self.client.post('/reservations/', {
+            'schedule_id': schedule.id,
+            'grades': ['adult', 'adult', 'teen'],
+            'seat_ids': list(Seat.objects.filter(name__in=['A2', 'A3', 'A5']).values_list('id', flat=True)),
+        })
+
+        response = self.client.get(self.url)
+        total_seats = len(SEATING_CHART_GENERAL['2']) - len(SEATING_CHART_APART['2'])
+        self.assertEqual(
+            [(result['total_seats'], result['reserved_seats']) for result in response.data['results']],
+            [(total_seats, 3), (total_seats, 0)],
+        )
+
+    def test_constant_query_count(self):
+        self.make_schedules(1)
+        response, query_count = self.get_query_count()
+        self.assertEqual(response.data['count'], 1)
+
+        self.make_schedules(8)
+        response, query_count_many = self.get_query_count()
+        self.assertEqual(response.data['count'], 9)
+        # 페이지네이션 count 1 + 목록 조회 1 + 좌석 수 1
+        self.assertEqual(query_count, 3)
+        self.assertEqual(query_count_many, 3)
+
+    def test_cache(self):
+        schedule, = self.make_schedules(1)
+        self.get_query_count()
+
+        # 상영 정보와 좌석 수 모두 캐시에서 조회
+        response, query_count = self.get_query_count()
+        self.assertEqual(query_count, 0)
+        self.assertEqual(response.data['count'], 1)
+
+        # 좌석 수만 만료
+        cache.delete(f'seat-count:{schedule.id}')
+        response, query_count = self.get_query_count()
+        self.assertEqual(query_count, 1)
+
+        # 다른 날짜의 스케쥴 변경은 무효화하지 않음
+        with capture_on_commit_callbacks(execute=True):
+            baker.make('theaters.Schedule', movie=self.movie, screen=self.screen,
+                       start_time=datetime.datetime(2020, 7, 21, 9))
+        response, query_count = self.get_query_count()
+        self.assertEqual(query_count, 0)
+
+        # 같은 날짜로 이동한 스케쥴 / 상영관 변경은 무효화
+        with capture_on_commit_callbacks(execute=True):
+            Schedule.objects.filter(start_time__date=datetime.date(2020, 7, 21)).get().delete()
+            schedule.start_time = datetime.datetime(2020, 7, 22, 9)
+            schedule.save()
+        response, query_count = self.get_query_count()
+        self.assertEqual(response.data['count'], 0)
+
+        self.make_schedules(2)
+        self.get_query_count()
+        self.theater.name = 'changed'
+        with capture_on_commit_callbacks() as callbacks:
+            self.theater.save()
+        # 커밋 전에는 이전 캐시 유지
+        response, query_count = self.get_query_count()
+        self.assertEqual(query_count, 0)
+        self.assertNotEqual(response.data['results'][0]['theater'], 'changed')
+
+        for callback in callbacks:
+            callback()
+        response, query_count = self.get_query_count()
+        # 좌석 수는 캐시 유지
+        self.assertEqual(query_count, 2)
+        self.assertEqual(response.data['results'][0]['theater'], 'changed')
+
+    def test_movie_filter_cache_key(self):
+        schedule, = self.make_schedules(1)
+        movie_ids = [baker.make('movies.Movie').id for _ in range(3)]
+
+        # 4번째 영화는 무시 - 같은 3편이면 순서와 관계없이 같은 결과
+        params = ' '.join(map(str, movie_ids + [self.movie.id]))
+        self.assertEqual(self.client.get(self.url, {'movies': params}).data['count'], 0)
+        params = ' '.join(map(str, [self.movie.id] + movie_ids))
+        self.assertEqual(self.client.get(self.url, {'movies': params}).data['count'], 1)
+        params = ' '.join(map(str, [movie_ids[0], self.movie.id, movie_ids[1]]))
+        self.assertEqual(self.client.get(self.url, {'movies': params}).data['count'], 1)
+
+    def test_date_range(self):
+        for start_time in [
+            datetime.datetime(2020, 7, 19, 23, 59),
+            datetime.datetime(2020, 7, 20, 0, 0),
+            datetime.datetime(2020, 7, 20, 23, 59, 59),
+            datetime.datetime(2020, 7, 21, 0, 0),
+        ]:
+            baker.make('theaters.Schedule', movie=self.movie, screen=self.screen, start_time=start_time)
+
+        response = self.client.get(self.url)
+        self.assertEqual([result['start_time'] for result in response.data['results']], ['00:00', '23:59'])
+
+        response = self.client.get('/theaters/schedules/regions/200720/')
+        self.assertEqual([result['region_count'] for result in response.data['results']], [1])
+
+
+class SeatIDListTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seat_ids = create_seats()
+        cls.schedule = baker.make('theaters.Schedule', screen__seats_type='2')
+        cls.url = f'/theaters/schedules/{cls.schedule.id}/seats/'
+
+    def test_seat_id_list(self):
+        self.client.get(self.url, {'names': 'A2'})
+
+        # 스케쥴 존재 확인 1회
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'names': 'B3 A2 Z99 A2'})
+        self.assertEqual(response.data, [
+            {'seat_name': 'B3', 'seat_id': self.seat_ids['B3']},
+            {'seat_name': 'A2', 'seat_id': self.seat_ids['A2']},
+        ])
+        # 문서용 serializer와 응답 형식이 같음
+        self.assertEqual(SeatIDListSerializer(response.data, many=True).data, response.data)
+
+    def test_invalid_schedule(self):
+        response = self.client.get(f'/theaters/schedules/{self.schedule.id + 1}/seats/', {'names': 'A2'})
+        self.assertEqual(response.status_code, 404)
+
+
+class TheaterETagTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_seats()
+        cls.screen = baker.make('theaters.Screen', seats_type='2')
+        cls.movie = baker.make('movies.Movie', running_time=datetime.timedelta(minutes=120))
+
+    def setUp(self):
+        cache.clear()
+
+    def test_screen_detail(self):
+        url = f'/theaters/screens/{self.screen.id}/'
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.screen.theater.name = '변경'
+        with capture_on_commit_callbacks(execute=True):
+            self.screen.theater.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['theater']['name'], '변경')
+
+    def test_region_count(self):
+        url = '/theaters/schedules/regions/200720/'
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # 다른 날짜 스케쥴은 영향 없음
+        with capture_on_commit_callbacks(execute=True):
+            baker.make('theaters.Schedule', movie=self.movie, screen=self.screen,
+                       start_time=datetime.datetime(2020, 7, 21, 10))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with capture_on_commit_callbacks(execute=True):
+            baker.make('theaters.Schedule', movie=self.movie, screen=self.screen,
+                       start_time=datetime.datetime(2020, 7, 20, 10))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 1)
@@ -2,16 +2,25 @@ from django.urls import path
 
 from .views import (
     ScheduleListGivenDate, TheatersGivenDateList, TheatersRegionCountGivenDate, ReservedSeatList, ScreenDetail,
-    TotalAndReservedSeatsCount, SeatsTotalPrice, SeatIDList
+    TotalAndReservedSeatsCount, SeatsTotalPrice, SeatIDList, SeatAvailabilityStream,
+    ScreenLayout, RecommendedSeatList, TheaterScheduleCalendar, ScheduleSearchList,
+    NearbyTheaterList, ScheduleQuote
 )
 
 urlpatterns = [
+    path('nearby/', NearbyTheaterList.as_view()),
+    path('schedules/search/', ScheduleSearchList.as_view()),
+    path('schedules/quote/', ScheduleQuote.as_view()),
     path('schedules/regions/<int:date>/', TheatersRegionCountGivenDate.as_view()),
     path('schedules/<int:date>/', TheatersGivenDateList.as_view()),
     path('schedules/<int:schedule_id>/price/', SeatsTotalPrice.as_view()),
     path('schedules/<int:schedule_id>/reserved-seats/', ReservedSeatList.as_view()),
     path('schedules/<int:schedule_id>/seats/', SeatIDList.as_view()),
     path('schedules/<int:schedule_id>/seats/count/', TotalAndReservedSeatsCount.as_view()),
+    path('schedules/<int:schedule_id>/seats/stream/', SeatAvailabilityStream.as_view()),
+    path('schedules/<int:schedule_id>/seats/recommend/', RecommendedSeatList.as_view()),
     path('screens/<int:screen_id>/', ScreenDetail.as_view()),
+    path('screens/<int:screen_id>/layout/', ScreenLayout.as_view()),
+    path('<int:theater_id>/schedules/', TheaterScheduleCalendar.as_view()),
     path('<int:theater_id>/schedules/<int:date>/', ScheduleListGivenDate.as_view()),
 ]
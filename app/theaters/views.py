@@ -1,49 +1,124 @@
-from datetime import datetime
+import json
+import time
+from datetime import datetime, timedelta
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
 from django.db.models import Count
+from django.http import StreamingHttpResponse, HttpResponse, Http404
+from django.utils.http import parse_etags
 from django.utils.decorators import method_decorator
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework.generics import ListAPIView, RetrieveAPIView, get_object_or_404
+from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from members.models import Profile
 from reservations.models import Reservation
-from utils.custom_functions import calculate_seat_price
-from utils.excepts import InvalidScheduleIdException, SeatNamesMissingException
-from .models import Schedule, Theater, Screen, SeatType
+from utils.business_data import SEATING_CHART_GENERAL_SET
+from utils.custom_functions import get_date_range, reformat_duration
+from utils.etags import ConditionalGetMixin
+from utils.pagination import KeysetPagination
+from utils.pricing import PRICING
+from utils.excepts import (
+    InvalidScheduleIdException, SeatNamesMissingException, InvalidPartySizeException, InvalidCalendarRangeException,
+    InvalidScheduleSearchException, InvalidNearbyTheaterQueryException, SeatEventStreamLimitException
+)
+from .geo import nearest_theaters
+from .layouts import get_rendered_layout, get_screen_seats_type
+from .models import Region, Schedule, Theater, Screen, SeatType, SeatGrade, ScheduleSeatMap
+from .occupancy import get_occupancy, get_seat_counts
+from .recommend import recommend_seats, MAX_PARTY_SIZE
 from .params import (
-    movies_query_param, adults_query_param, teens_query_param, preferentials_query_param, seat_names_query_param
+    movies_query_param, adults_query_param, teens_query_param, preferentials_query_param, seat_names_query_param,
+    party_size_query_param, from_date_query_param, days_query_param, movie_query_param, region_query_param,
+    time_band_query_param, cursor_query_param, latitude_query_param, longitude_query_param, nearest_count_query_param,
+    showing_movie_query_param, showing_date_query_param
 )
+from .seat_catalog import get_seat_catalog
+from .seat_events import get_seat_event_broker, stream_slots, ClosingStream
+from .seat_maps import is_seat_map_mode, GENERAL
+from .showtimes import SHOWTIMES, date_version_name, showtime_cache_key, get_or_set_showtimes
 from .serializers import (
-    ScheduleMovieSerializer, ScheduleTheaterListSerializer, ScheduleRegionCountSerializer,
+    ScheduleMovieSerializer, ScheduleMovieSeatCountSerializer, ScheduleTheaterListSerializer, ScheduleRegionCountSerializer,
     SeatListSerializer,
-    ScreenDetailSerializer, SeatsTotalPriceSerializer, TotalAndReservedSeatsCountSerializer, SeatIDListSerializer
+    ScreenDetailSerializer, SeatsTotalPriceSerializer, TotalAndReservedSeatsCountSerializer, SeatIDListSerializer,
+    TheaterScheduleCalendarSerializer, ScheduleSearchSerializer, NearbyTheaterSerializer, ScheduleQuoteSerializer,
+    ScheduleQuoteResultSerializer
 )
 
 
+def seat_id_list(seat_names):
+    # SeatIDListSerializer 형식 - 이름 순서 유지, 중복/없는 이름 제외
+    seat_names = list(dict.fromkeys(seat_names))
+    seat_ids = get_seat_catalog().ids(seat_names)
+    return [{'seat_name': name, 'seat_id': seat_ids[name]} for name in seat_names if name in seat_ids]
+
+
+def get_seat_map_or_exception(schedule_id):
+    try:
+        return ScheduleSeatMap.objects.get(schedule_id=schedule_id).get_seat_map()
+    except ObjectDoesNotExist:
+        raise InvalidScheduleIdException
+
+
+class ShowtimeCacheMixin:
+    # 날짜별 상영 정보 캐싱 - 키: view, 날짜, 상영관, 영화 필터, 페이지
+    def get_movie_ids(self):
+        # 영화 필터 (최대 3편) - 필터가 없으면 None / 캐시 키와 queryset이 같은 영화를 사용하도록 여기서만 파싱
+        movies = self.request.query_params.get('movies', None)
+        if movies is None:
+            return None
+        return list(map(int, movies.split()))[:3]
+
+    def list(self, request, *args, **kwargs):
+        date = datetime.strptime(str(self.kwargs['date']), '%y%m%d')
+        movie_ids = self.get_movie_ids()
+        movies_key = '' if movie_ids is None else '-'.join(map(str, sorted(movie_ids)))
+        key = showtime_cache_key(
+            self.__class__.__name__,
+            date,
+            self.kwargs.get('theater_id', ''),
+            movies_key,
+            self.request.query_params.get('page', 1),
+        )
+        return Response(get_or_set_showtimes(key, lambda: super(ShowtimeCacheMixin, self).list(
+            request, *args, **kwargs
+        ).data))
+
+
+class ShowtimeETagMixin(ConditionalGetMixin):
+    # 날짜별 상영 정보 캐시와 같은 버전(전체 + 해당 날짜)으로 ETag 생성
+    def get_etag_version_names(self):
+        return [SHOWTIMES, date_version_name(datetime.strptime(str(self.kwargs['date']), '%y%m%d'))]
+
+
 @method_decorator(name='get', decorator=swagger_auto_schema(
     operation_summary='Theaters List on Given Date',
     operation_description='해당 날짜에 상영 중인 상영관 리스트',
     manual_parameters=[movies_query_param],
 ))
-class TheatersGivenDateList(ListAPIView):
+class TheatersGivenDateList(ShowtimeETagMixin, ShowtimeCacheMixin, ListAPIView):
     serializer_class = ScheduleTheaterListSerializer
 
     def get_queryset(self):
         date_int = self.kwargs['date']
-        date = datetime.strptime(str(date_int), '%y%m%d')
+        start, end = get_date_range(datetime.strptime(str(date_int), '%y%m%d'))
 
-        movies = self.request.query_params.get('movies', None)
+        movies_list = self.get_movie_ids()
 
-        if movies is not None:
-            movies_list = list(map(int, movies.split()))[:3]
+        if movies_list is not None:
             queryset = Theater.objects.filter(
                 screens__schedules__movie__in=movies_list,
-                screens__schedules__start_time__date=date,
+                screens__schedules__start_time__gte=start,
+                screens__schedules__start_time__lt=end,
             ).distinct('id')
         else:
-            queryset = Theater.objects.filter(screens__schedules__start_time__date=date).distinct('id')
+            queryset = Theater.objects.filter(
+                screens__schedules__start_time__gte=start,
+                screens__schedules__start_time__lt=end,
+            ).distinct('id')
 
         return queryset.select_related('region')
 
@@ -53,27 +128,28 @@ class TheatersGivenDateList(ListAPIView):
     operation_description='해당 날짜에 상영 중인 상영관들 지역 기준 합산',
     manual_parameters=[movies_query_param],
 ))
-class TheatersRegionCountGivenDate(ListAPIView):
+class TheatersRegionCountGivenDate(ShowtimeETagMixin, ShowtimeCacheMixin, ListAPIView):
     serializer_class = ScheduleRegionCountSerializer
 
     def get_queryset(self):
         date_int = self.kwargs['date']
-        date = datetime.strptime(str(date_int), '%y%m%d')
+        start, end = get_date_range(datetime.strptime(str(date_int), '%y%m%d'))
 
-        movies = self.request.query_params.get('movies', None)
+        movies_list = self.get_movie_ids()
 
-        if movies is not None:
-            movies_list = list(map(int, movies.split()))[:3]
+        if movies_list is not None:
             queryset = Theater.objects.filter(
                 screens__schedules__movie__in=movies_list,
-                screens__schedules__start_time__date=date,
+                screens__schedules__start_time__gte=start,
+                screens__schedules__start_time__lt=end,
             ).values(
                 'region', 'region__name'
             ).annotate(Count('name', distinct=True))
 
         else:
             queryset = Theater.objects.filter(
-                screens__schedules__start_time__date=date,
+                screens__schedules__start_time__gte=start,
+                screens__schedules__start_time__lt=end,
             ).values(
                 'region', 'region__name'
             ).annotate(
@@ -91,27 +167,55 @@ class TheatersRegionCountGivenDate(ListAPIView):
 ))
 class SeatsTotalPrice(APIView):
     def get(self, request, schedule_id):
-        schedule = get_object_or_404(Schedule, pk=schedule_id)
-        screen_type = schedule.screen.screen_type
-
-        adults = request.query_params.get('adults', None)
-        teens = request.query_params.get('teens', None)
-        preferentials = request.query_params.get('preferentials', None)
-
-        total_price = 0
-
-        if adults is not None:
-            total_price += calculate_seat_price(screen_type, 'adult') * int(adults)
+        schedule = Schedule.objects.filter(pk=schedule_id).values('screen__screen_type', 'start_time').first()
+        if schedule is None:
+            raise Http404
+
+        grade_counts = {
+            grade: int(request.query_params[param])
+            for grade, param in (('adult', 'adults'), ('teen', 'teens'), ('preferential', 'preferentials'))
+            if param in request.query_params
+        }
+        return Response({
+            "total_price": PRICING.total(schedule['screen__screen_type'], grade_counts, schedule['start_time']),
+        })
 
-        if teens is not None:
-            total_price += calculate_seat_price(screen_type, 'teen') * int(teens)
 
-        if preferentials is not None:
-            total_price += calculate_seat_price(screen_type, 'preferential') * int(preferentials)
+@method_decorator(name='post', decorator=swagger_auto_schema(
+    operation_summary='Price Quotes of Schedules',
+    operation_description='여러 스케쥴의 등급별 좌석 수에 대한 가격을 한 번에 계산 (스케쥴 조회 1회)',
+    request_body=ScheduleQuoteSerializer,
+    responses={200: ScheduleQuoteResultSerializer(many=True)},
+))
+class ScheduleQuote(APIView):
+    def post(self, request):
+        serializer = ScheduleQuoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        quotes = serializer.validated_data['quotes']
+
+        schedules = {
+            schedule_id: (screen_type, start_time)
+            for schedule_id, screen_type, start_time in Schedule.objects.filter(
+                pk__in={quote['schedule_id'] for quote in quotes}
+            ).values_list('id', 'screen__screen_type', 'start_time')
+        }
+        if any(quote['schedule_id'] not in schedules for quote in quotes):
+            raise InvalidScheduleIdException
 
-        return Response({
-            "total_price": total_price,
-        })
+        results = []
+        for quote in quotes:
+            screen_type, start_time = schedules[quote['schedule_id']]
+            grade_counts = {
+                'adult': quote['adults'],
+                'teen': quote['teens'],
+                'preferential': quote['preferentials'],
+            }
+            results.append({
+                'schedule_id': quote['schedule_id'],
+                'prices': PRICING.prices(screen_type, start_time),
+                'total_price': PRICING.total(screen_type, grade_counts, start_time),
+            })
+        return Response(results)
 
 
 @method_decorator(name='get', decorator=swagger_auto_schema(
@@ -124,6 +228,9 @@ class ReservedSeatList(ListAPIView):
 
     def get_queryset(self):
         schedule_id = int(self.kwargs['schedule_id'])
+        if is_seat_map_mode():
+            seat_map = get_seat_map_or_exception(schedule_id)
+            return [{'seat_grades__seat__name': name} for name in seat_map.reserved_names()]
         try:
             schedule = Schedule.objects.get(pk=schedule_id)
             return Reservation.objects.filter(schedule=schedule).values('seat_grades__seat__name')
@@ -139,24 +246,123 @@ class ReservedSeatList(ListAPIView):
 class TotalAndReservedSeatsCount(APIView):
     def get(self, request, schedule_id):
         try:
-            schedule = Schedule.objects.get(pk=schedule_id)
-            return Response({
-                'total_seats': schedule.seat_types.filter(type='general').count(),
-                'reserved_seats': schedule.seat_types.aggregate(
-                    reserved_seats=Count('seat__reservations'))['reserved_seats']
-            })
+            schedule = Schedule.objects.select_related('occupancy').get(pk=schedule_id)
+        except ObjectDoesNotExist:
+            raise InvalidScheduleIdException
+        occupancy = get_occupancy(schedule)
+        return Response({
+            'total_seats': occupancy.total_seats,
+            'reserved_seats': occupancy.reserved_seats,
+        })
+
+
+def sse_message(event, data):
+    return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
+
+
+@method_decorator(name='get', decorator=swagger_auto_schema(
+    operation_summary='Seat Availability Stream of a Schedule',
+    operation_description='해당 스케쥴의 좌석 변경 스트림 (text/event-stream)\n\n'
+                          'snapshot 이벤트로 예약 좌석 전체를 보낸 뒤 reserved / released 이벤트로 변경된 좌석만 전송\n\n'
+                          '서버별 동시 연결 수(SEAT_EVENT_MAX_STREAMS)를 넘으면 503 - 잠시 후 재연결',
+))
+class SeatAvailabilityStream(APIView):
+    def get(self, request, schedule_id):
+        try:
+            schedule = Schedule.objects.select_related('occupancy').get(pk=schedule_id)
         except ObjectDoesNotExist:
             raise InvalidScheduleIdException
 
+        if not stream_slots.acquire():
+            raise SeatEventStreamLimitException
+        try:
+            # snapshot 조회 전에 구독해야 그 사이의 변경을 놓치지 않음 (중복 전달은 클라이언트에서 멱등)
+            subscription = get_seat_event_broker().subscribe(schedule.id)
+            try:
+                snapshot = self.get_snapshot(schedule)
+            except Exception:
+                subscription.close()
+                raise
+        except Exception:
+            stream_slots.release()
+            raise
+        # 스트림이 열려 있는 동안 DB 연결을 잡고 있지 않도록 반환
+        if not connection.in_atomic_block:
+            connection.close()
+
+        response = StreamingHttpResponse(
+            ClosingStream(self.stream(subscription, snapshot), lambda: self.close_stream(subscription)),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def close_stream(self, subscription):
+        # 구독 해제는 여러 번 호출해도 안전
+        subscription.close()
+        stream_slots.release()
+
+    def get_snapshot(self, schedule):
+        if is_seat_map_mode():
+            reserved_seats = get_seat_map_or_exception(schedule.id).reserved_names()
+        else:
+            reserved_seats = list(SeatGrade.objects.filter(schedule=schedule).values_list('seat__name', flat=True))
+        occupancy = get_occupancy(schedule)
+        return {
+            'total_seats': occupancy.total_seats,
+            'reserved_seats': reserved_seats,
+        }
+
+    def stream(self, subscription, snapshot):
+        # 연결 시간이 지나면 종료 - 클라이언트(EventSource)가 retry 후 재연결하며 snapshot을 다시 받음
+        deadline = time.monotonic() + settings.SEAT_EVENT_STREAM_TIMEOUT
+        try:
+            yield f'retry: {settings.SEAT_EVENT_RETRY_MS}\n'
+            yield sse_message('snapshot', snapshot)
+            while time.monotonic() < deadline:
+                message = subscription.get(timeout=settings.SEAT_EVENT_HEARTBEAT)
+                if message is None:
+                    yield ': keep-alive\n\n'
+                else:
+                    yield sse_message(message['event'], {'seats': message['seats']})
+        finally:
+            subscription.close()
+
 
 @method_decorator(name='get', decorator=swagger_auto_schema(
     operation_summary='Screen Detail',
     operation_description='해당 스크린의 상세 정보',
 ))
-class ScreenDetail(RetrieveAPIView):
+class ScreenDetail(ConditionalGetMixin, RetrieveAPIView):
     queryset = Screen.objects.all()
     serializer_class = ScreenDetailSerializer
     lookup_url_kwarg = 'screen_id'
+    etag_models = (Region, Theater, Screen)
+
+
+@method_decorator(name='get', decorator=swagger_auto_schema(
+    operation_summary='Seat Layout of a Screen',
+    operation_description='해당 스크린의 좌석 배치도 (행, 열, 통로, 좌석 ID, 띄어앉기석 여부, 좌표)\n\n'
+                          'ETag / If-None-Match 지원 - 배치도가 바뀌지 않았으면 304',
+))
+class ScreenLayout(APIView):
+    def get(self, request, screen_id):
+        seats_type = get_screen_seats_type(screen_id)
+        if seats_type is None:
+            raise Http404
+        try:
+            body, etag = get_rendered_layout(seats_type)
+        except KeyError:
+            raise Http404
+
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = HttpResponse(status=304)
+        else:
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        response['Cache-Control'] = f'public, max-age={settings.SEAT_LAYOUT_MAX_AGE}'
+        return response
 
 
 @method_decorator(name='get', decorator=swagger_auto_schema(
@@ -167,47 +373,300 @@ class ScreenDetail(RetrieveAPIView):
 ))
 class SeatIDList(APIView):
     def get(self, request, schedule_id):
-        schedule = get_object_or_404(Schedule, pk=schedule_id)
         seat_names = self.request.query_params.get('names', None)
 
-        if seat_names is not None:
-            seats_list = list(seat_names.split())
+        if is_seat_map_mode():
+            seat_map = get_seat_map_or_exception(schedule_id)
+            if seat_names is None:
+                raise SeatNamesMissingException
+            return Response(seat_id_list(seat_map.filter_names(seat_names.split())))
 
-            seat_type_qs = SeatType.objects.filter(
-                schedule=schedule,
-                seat__name__in=seats_list
-            ).prefetch_related('seat')
-            return Response(SeatIDListSerializer(seat_type_qs, many=True).data)
+        # 스케쥴 존재 확인 1회 - 스케쥴의 좌석(SeatType)은 seats_type의 배치도대로 생성되므로 이름/ID는 메모리에서 조회
+        seats_type = Schedule.objects.filter(pk=schedule_id).values_list('screen__seats_type', flat=True).first()
+        if seats_type is None:
+            raise Http404
+
+        if seat_names is not None:
+            layout_names = SEATING_CHART_GENERAL_SET.get(seats_type, frozenset())
+            return Response(seat_id_list(name for name in seat_names.split() if name in layout_names))
         else:
             raise SeatNamesMissingException
 
 
+@method_decorator(name='get', decorator=swagger_auto_schema(
+    operation_summary='Recommended Contiguous Seats of a Schedule',
+    operation_description='해당 스케쥴에서 인원 수만큼 연속으로 앉을 수 있는 가장 좋은 좌석 (스크린 중앙에 가까운 순)\n\n'
+                          '띄어앉기석/예약된 좌석 제외, 가능한 좌석이 없으면 빈 리스트',
+    responses={200: SeatIDListSerializer(many=True)},
+    manual_parameters=[party_size_query_param]
+))
+class RecommendedSeatList(APIView):
+    def get(self, request, schedule_id):
+        try:
+            count = int(request.query_params.get('count', 1))
+        except ValueError:
+            raise InvalidPartySizeException
+        if not 1 <= count <= MAX_PARTY_SIZE:
+            raise InvalidPartySizeException
+
+        if is_seat_map_mode():
+            seat_map = get_seat_map_or_exception(schedule_id)
+            seats_type = seat_map.seats_type
+            unavailable_names = [
+                name for name in seat_map.names
+                if seat_map.is_reserved(name) or seat_map.kind(name) != GENERAL
+            ]
+        else:
+            try:
+                schedule = Schedule.objects.select_related('screen').get(pk=schedule_id)
+            except ObjectDoesNotExist:
+                raise InvalidScheduleIdException
+            seats_type = schedule.screen.seats_type
+            unavailable_names = list(
+                SeatGrade.objects.filter(schedule=schedule).values_list('seat__name', flat=True)
+            ) + list(
+                SeatType.objects.filter(schedule=schedule).exclude(type='general').values_list('seat__name', flat=True)
+            )
+
+        return Response(seat_id_list(recommend_seats(seats_type, unavailable_names, count)))
+
+
+def fill_seat_counts(schedules):
+    seat_counts = get_seat_counts([schedule['schedule_id'] for schedule in schedules])
+    for schedule in schedules:
+        schedule['total_seats'], schedule['reserved_seats'] = seat_counts[schedule['schedule_id']]
+
+
 @method_decorator(name='get', decorator=swagger_auto_schema(
     operation_summary='Schedules List on Given Date',
     operation_description='해당 상영관 특정 날짜의 스케쥴 정보',
     manual_parameters=[movies_query_param],
+    responses={200: ScheduleMovieSeatCountSerializer(many=True)},
 ))
-class ScheduleListGivenDate(ListAPIView):
+class ScheduleListGivenDate(ShowtimeCacheMixin, ListAPIView):
     serializer_class = ScheduleMovieSerializer
 
+    def list(self, request, *args, **kwargs):
+        # 캐싱된 스케쥴 정보에 좌석 수(짧은 TTL)를 채움
+        response = super().list(request, *args, **kwargs)
+        fill_seat_counts(response.data['results'])
+        return response
+
     def get_queryset(self):
         date_int = self.kwargs.get('date', None)
-        date = datetime.strptime(str(date_int), '%y%m%d')
+        start, end = get_date_range(datetime.strptime(str(date_int), '%y%m%d'))
 
         theater_id = self.kwargs.get('theater_id', None)
 
-        movies = self.request.query_params.get('movies', None)
+        movies_list = self.get_movie_ids()
 
-        if movies is not None:
-            movies_list = list(map(int, movies.split()))[:3]
+        if movies_list is not None:
             queryset = Schedule.objects.filter(
                 movie__in=movies_list,
-                start_time__date=date,
+                start_time__gte=start,
+                start_time__lt=end,
                 screen__theater_id=theater_id,
             )
         else:
             queryset = Schedule.objects.filter(
-                start_time__date=date,
+                start_time__gte=start,
+                start_time__lt=end,
                 screen__theater_id=theater_id,
             )
-        return queryset.select_related('movie', 'screen__theater__region').prefetch_related('seat_types')
+        return queryset.select_related('movie', 'screen__theater__region')
+
+
+CALENDAR_DEFAULT_DAYS = 7
+CALENDAR_MAX_DAYS = 14
+
+
+def get_date_window(request):
+    # ?from=YYMMDD&days=n -> (시작 날짜 00:00, 일 수)
+    try:
+        from_date = request.query_params.get('from', None)
+        start_date = datetime.strptime(from_date, '%y%m%d') if from_date else datetime.now()
+        days = int(request.query_params.get('days', CALENDAR_DEFAULT_DAYS))
+    except ValueError:
+        raise InvalidCalendarRangeException
+    if not 1 <= days <= CALENDAR_MAX_DAYS:
+        raise InvalidCalendarRangeException
+    start, _ = get_date_range(start_date)
+    return start, days
+
+
+@method_decorator(name='get', decorator=swagger_auto_schema(
+    operation_summary='Schedule Calendar of a Theater',
+    operation_description='해당 상영관의 여러 날짜 스케쥴 (날짜 > 영화 > 스케쥴) 및 상영이 있는 날짜 bitmap',
+    responses={200: TheaterScheduleCalendarSerializer()},
+    manual_parameters=[from_date_query_param, days_query_param],
+))
+class TheaterScheduleCalendar(APIView):
+    def get(self, request, theater_id):
+        start, days = get_date_window(request)
+        # 기간 전체를 쿼리 1번으로 조회 (좌석 수는 occupancy 카운터 row)
+        schedules = list(Schedule.objects.filter(
+            screen__theater_id=theater_id,
+            start_time__gte=start,
+            start_time__lt=start + timedelta(days=days),
+        ).order_by('start_time', 'screen__name').values(
+            'id', 'start_time', 'movie_id', 'movie__name_kor', 'movie__grade', 'movie__rank', 'movie__running_time',
+            'movie__poster', 'screen__name', 'screen__screen_type', 'screen__seats_type',
+            'occupancy__total_seats', 'occupancy__reserved_seats',
+        ))
+
+        # 카운터 row가 없는 기존 스케쥴
+        missing = [schedule['id'] for schedule in schedules if schedule['occupancy__total_seats'] is None]
+        seat_counts = get_seat_counts(missing) if missing else {}
+
+        poster_storage = Schedule._meta.get_field('movie').related_model._meta.get_field('poster').storage
+        dates = {}
+        for schedule in schedules:
+            movies = dates.setdefault(schedule['start_time'].date(), {})
+            movie = movies.get(schedule['movie_id'])
+            if movie is None:
+                movie = movies[schedule['movie_id']] = {
+                    'movie_id': schedule['movie_id'],
+                    'movie': schedule['movie__name_kor'],
+                    'grade': schedule['movie__grade'],
+                    'rank': schedule['movie__rank'],
+                    'running_time': reformat_duration(schedule['movie__running_time']),
+                    'poster': poster_storage.url(schedule['movie__poster']) if schedule['movie__poster'] else None,
+                    'schedules': [],
+                }
+            total_seats, reserved_seats = seat_counts.get(
+                schedule['id'], (schedule['occupancy__total_seats'], schedule['occupancy__reserved_seats'])
+            )
+            movie['schedules'].append({
+                'schedule_id': schedule['id'],
+                'start_time': f'{schedule["start_time"]:%H:%M}',
+                'end_time': f'{schedule["start_time"] + schedule["movie__running_time"]:%H:%M}',
+                'screen': schedule['screen__name'],
+                'screen_type': schedule['screen__screen_type'],
+                'seats_type': schedule['screen__seats_type'],
+                'total_seats': total_seats,
+                'reserved_seats': reserved_seats,
+            })
+
+        day_list = [start.date() + timedelta(days=i) for i in range(days)]
+        return Response({
+            'theater_id': theater_id,
+            'start_date': f'{start:%Y-%m-%d}',
+            'days': days,
+            'dates_bitmap': ''.join('1' if date in dates else '0' for date in day_list),
+            'dates': [
+                {
+                    'date': f'{date:%Y-%m-%d}',
+                    # 영화는 예매 순위 순
+                    'movies': [
+                        {key: value for key, value in movie.items() if key != 'rank'}
+                        for movie in sorted(dates[date].values(), key=lambda movie: movie['rank'])
+                    ],
+                }
+                for date in day_list if date in dates
+            ],
+        })
+
+
+# Profile.TIME_CHOICES 시간대 -> 상영 시작 시각(시) 범위 [from, to) - '21-00'은 자정 전까지
+TIME_BANDS = {
+    value: (int(value[:2]), int(value[3:]) or 24) for value, _ in Profile.TIME_CHOICES
+}
+
+
+class ScheduleSearchPagination(KeysetPagination):
+    # (movie, start_time, id) 인덱스 순서 그대로 탐색
+    keys = ('start_time', 'id')
+
+
+@method_decorator(name='get', decorator=swagger_auto_schema(
+    operation_summary='Schedule Search of a Movie',
+    operation_description='영화 1편의 전체 상영관 스케쥴 검색 (지역, 기간, 시간대 필터) - '
+                          'start_time 순 keyset pagination, 다음 페이지는 응답의 next URL 사용',
+    responses={200: ScheduleSearchSerializer()},
+    manual_parameters=[
+        movie_query_param, region_query_param, from_date_query_param, days_query_param, time_band_query_param,
+        cursor_query_param,
+    ],
+))
+class ScheduleSearchList(ListAPIView):
+    serializer_class = ScheduleMovieSerializer
+    pagination_class = ScheduleSearchPagination
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        fill_seat_counts(response.data['results'])
+        return response
+
+    def get_queryset(self):
+        params = self.request.query_params
+        try:
+            movie_id = int(params['movie'])
+            region_id = int(params['region']) if params.get('region') else None
+        except (KeyError, ValueError):
+            raise InvalidScheduleSearchException
+        time_band = params.get('time', None)
+        if time_band and time_band not in TIME_BANDS:
+            raise InvalidScheduleSearchException
+
+        start, days = get_date_window(self.request)
+        queryset = Schedule.objects.filter(
+            movie_id=movie_id,
+            start_time__gte=start,
+            start_time__lt=start + timedelta(days=days),
+        )
+        if region_id is not None:
+            queryset = queryset.filter(screen__theater__region_id=region_id)
+        if time_band:
+            from_hour, to_hour = TIME_BANDS[time_band]
+            queryset = queryset.filter(start_time__hour__gte=from_hour, start_time__hour__lt=to_hour)
+        return queryset.select_related('movie', 'screen__theater__region')
+
+
+NEARBY_DEFAULT_COUNT = 5
+NEARBY_MAX_COUNT = 20
+
+
+@method_decorator(name='get', decorator=swagger_auto_schema(
+    operation_summary='Nearby Theaters',
+    operation_description='좌표에서 가까운 상영관 k개 (거리 km) - movie/date를 주면 해당 날짜에 상영하는 상영관 중에서 검색',
+    responses={200: NearbyTheaterSerializer(many=True)},
+    manual_parameters=[
+        latitude_query_param, longitude_query_param, nearest_count_query_param, showing_movie_query_param,
+        showing_date_query_param,
+    ],
+))
+class NearbyTheaterList(APIView):
+    def get(self, request):
+        params = request.query_params
+        try:
+            latitude = float(params['lat'])
+            longitude = float(params['lng'])
+            k = int(params.get('k', NEARBY_DEFAULT_COUNT))
+            movie_id = int(params['movie']) if params.get('movie') else None
+            date = datetime.strptime(params['date'], '%y%m%d') if params.get('date') else None
+        except (KeyError, ValueError):
+            raise InvalidNearbyTheaterQueryException
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180 and 1 <= k <= NEARBY_MAX_COUNT):
+            raise InvalidNearbyTheaterQueryException
+
+        theater_ids = None
+        if movie_id is not None or date is not None:
+            # 영화만 주면 오늘, 날짜만 주면 전체 영화
+            start, end = get_date_range(date or datetime.now())
+            schedules = Schedule.objects.filter(start_time__gte=start, start_time__lt=end)
+            if movie_id is not None:
+                schedules = schedules.filter(movie_id=movie_id)
+            theater_ids = set(schedules.values_list('screen__theater_id', flat=True).distinct())
+
+        return Response([
+            {
+                'theater_id': theater.theater_id,
+                'name': theater.name,
+                'region_id': theater.region_id,
+                'region': theater.region,
+                'latitude': theater.latitude,
+                'longitude': theater.longitude,
+                'distance': round(distance, 2),
+            }
+            for distance, theater in nearest_theaters(latitude, longitude, k, theater_ids)
+        ])
@@ -87,6 +87,15 @@ SEATING_CHART_APART = {
           "E8", "E11", "F3", "F6", "F9", "G4", "G7", "G10"]
 }
 
+# 좌석 포함 여부 확인용 (list 탐색 대신 set 조회)
+SEATING_CHART_GENERAL_SET = {
+    seats_type: frozenset(seats) for seats_type, seats in SEATING_CHART_GENERAL.items()
+}
+
+SEATING_CHART_APART_SET = {
+    seats_type: frozenset(seats) for seats_type, seats in SEATING_CHART_APART.items()
+}
+
 PRICE_BY_SCREEN_TYPE_CHART = {
     "2D": 11000,
     "2Ds": 11000,
@@ -102,6 +111,11 @@ PRICE_DISCOUNT_RATE_CHART = {
 
 }
 
+# 좌석 가격 할인 규칙 (utils.pricing.DiscountRule) - 위에서부터 차례로 적용
+# 예시) 조조 할인: {"name": "morning", "hours": (0, 10), "amount": 2000}
+#      주말 3D 10% 할인: {"name": "weekend-3d", "weekdays": (5, 6), "screen_types": ("3D",), "rate": 0.1}
+PRICE_DISCOUNT_RULES = []
+
 POINT_RATE_PER_TIER_CHART = {
     "basic": 0.01,
     "vip": 0.02,
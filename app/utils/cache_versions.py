@@ -0,0 +1,61 @@
+import threading
+import time
+
+from django.core.cache import cache
+
+# 이름별 버전 번호 - 캐시 키에 버전을 포함시키고, 무효화는 버전만 올림 (이전 키는 TTL로 자연 만료)
+# 버전 키가 없어지면(eviction 등) 현재 시각(ms)으로 다시 시작하므로 이전 버전으로 돌아가지 않음
+
+
+def version_key(name):
+    return f'cache-version:{name}'
+
+
+def get_versions(*names):
+    keys = [version_key(name) for name in names]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, int(time.time() * 1000), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_version(*names):
+    # 올린 뒤의 버전 목록 (버전 키가 없어서 새로 시작한 경우 None)
+    versions = []
+    for name in names:
+        try:
+            versions.append(cache.incr(version_key(name)))
+        except ValueError:
+            cache.add(version_key(name), int(time.time() * 1000), None)
+            versions.append(None)
+    return versions
+
+
+def versioned_key(prefix, names, *parts):
+    # ex) versioned_key('showtimes', ['showtimes', 'showtimes:200720'], 'theaters', 200720)
+    versions = '.'.join(str(version) for version in get_versions(*names))
+    return ':'.join(str(part) for part in (prefix, versions) + parts)
+
+
+class LocalVersionedValue:
+    # 프로세스별로 1번 만든 값을 보관 - 공유 캐시의 버전이 바뀌면(다른 프로세스에서 invalidate 포함) 다시 만듦
+    def __init__(self, name, build):
+        self.name = name
+        self.build = build
+        self._current = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        version, = get_versions(self.name)
+        current = self._current
+        if current is None or current[0] != version:
+            with self._lock:
+                current = self._current
+                if current is None or current[0] != version:
+                    current = self._current = (version, self.build())
+        return current[1]
+
+    def invalidate(self):
+        bump_version(self.name)
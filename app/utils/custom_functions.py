@@ -1,3 +1,5 @@
+from datetime import datetime, time, timedelta
+
 from django.utils.duration import _get_duration_components
 from google.auth.transport import requests
 from google.oauth2 import id_token
@@ -6,7 +8,6 @@ from config.settings._base import BOOT_PAY_REST_APP_ID, BOOT_PAY_PRIVATE_KEY, GO
 from utils.excepts import FailToGetBootPayAccessTokenException, UnverifiedReceiptException, VerifyRequestFailException, \
     PaymentCancelFailException, InvalidGoogleAccessTokenException
 from .bootpay import BootpayApi
-from .business_data import PRICE_BY_SCREEN_TYPE_CHART, PRICE_DISCOUNT_RATE_CHART
 
 
 def reformat_duration(duration):
@@ -14,10 +15,10 @@ def reformat_duration(duration):
     return str(hours * 60 + minutes)
 
 
-def calculate_seat_price(screen_type, grade):
-    original_price = PRICE_BY_SCREEN_TYPE_CHART.get(screen_type, 'default')
-    discount_rate = PRICE_DISCOUNT_RATE_CHART.get(grade, 'default')
-    return int("%.0f" % (original_price * discount_rate))
+def get_date_range(date):
+    # start_time__date=date 대신 [start, end) 범위로 필터 - 컬럼을 변환하지 않으므로 start_time 인덱스 사용 가능
+    start = datetime.combine(date, time.min)
+    return start, start + timedelta(days=1)
 
 
 def verify_receipt_from_bootpay_server(receipt_id, price):
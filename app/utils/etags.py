@@ -0,0 +1,68 @@
+import hashlib
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from .cache_versions import get_versions, bump_version
+
+# 조건부 GET - 모델별 변경 카운터(공유 캐시 버전)와 요청 URL로 ETag를 만들어 serializer 실행 전에 If-None-Match와 비교
+# 카운터는 track_changes로 등록한 모델의 save/delete(m2m through 모델은 add/remove/clear)마다 올라감
+# QuerySet.update()/bulk 작업은 signal이 없으므로 직접 bump_model_versions 호출
+
+
+def model_version_name(model):
+    return f'model:{model._meta.label_lower}'
+
+
+def bump_model_versions(*models):
+    # 커밋 후 올림 - 커밋 전에 올리면 그 사이 요청이 커밋 전 데이터로 만든 응답에 새 ETag를 붙임
+    names = [model_version_name(model) for model in models]
+    transaction.on_commit(lambda: bump_version(*names))
+
+
+def model_changed(sender, **kwargs):
+    bump_model_versions(sender)
+
+
+def m2m_changed_for_etag(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_model_versions(sender)
+
+
+def track_changes(*models):
+    for model in models:
+        dispatch_uid = f'etag:{model._meta.label_lower}'
+        if model._meta.auto_created:
+            m2m_changed.connect(m2m_changed_for_etag, sender=model, dispatch_uid=dispatch_uid)
+        else:
+            post_save.connect(model_changed, sender=model, dispatch_uid=dispatch_uid)
+            post_delete.connect(model_changed, sender=model, dispatch_uid=dispatch_uid)
+
+
+class ConditionalGetMixin:
+    # 읽기 전용 generic view (get -> list/retrieve) - etag_models(또는 get_etag_version_names) 중 하나라도 바뀌면 ETag가 바뀜
+    # 사용자별로 달라지는 응답에는 사용하지 않음
+    etag_models = ()
+    etag_cache_control = 'no-cache'
+
+    def get_etag_version_names(self):
+        return [model_version_name(model) for model in self.etag_models]
+
+    def get_etag(self, request):
+        versions = get_versions(*self.get_etag_version_names())
+        parts = [request.get_full_path(), request.accepted_renderer.format] + [str(version) for version in versions]
+        return quote_etag(hashlib.md5('|'.join(parts).encode()).hexdigest())
+
+    def get(self, request, *args, **kwargs):
+        etag = self.get_etag(request)
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().get(request, *args, **kwargs)
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response['ETag'] = etag
+            response['Cache-Control'] = self.etag_cache_control
+        return response
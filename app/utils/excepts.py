@@ -62,6 +62,12 @@ class InvalidSeatIdException(APIException):
     default_code = 'InvalidSeatId'
 
 
+class GradeSeatCountMismatchException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = '좌석 등급 수와 좌석 수가 일치하지 않습니다.'
+    default_code = 'GradeSeatCountMismatch'
+
+
 class SeatNamesMissingException(APIException):
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = '좌석의 이름을 반드시 query parameter로 전달해야합니다.'
@@ -126,3 +132,39 @@ class InvalidReservationIdException(APIException):
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = '유효하지 않은 reservation id입니다. - 삭제 불가능'
     default_code = 'InvalidReservationId'
+
+
+class InvalidPartySizeException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = '인원 수는 1 ~ 8 사이의 정수여야 합니다.'
+    default_code = 'InvalidPartySize'
+
+
+class InvalidCalendarRangeException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = 'from은 YYMMDD 형식의 날짜, days는 1 ~ 14 사이의 정수여야 합니다.'
+    default_code = 'InvalidCalendarRange'
+
+
+class InvalidScheduleSearchException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = 'movie(필수), region은 정수, time은 00-10, 10-13, 13-16, 16-18, 18-21, 21-00 중 하나여야 합니다.'
+    default_code = 'InvalidScheduleSearch'
+
+
+class InvalidNearbyTheaterQueryException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = 'lat, lng는 좌표(필수), k는 1 ~ 20 사이의 정수, movie는 정수, date는 YYMMDD 형식이어야 합니다.'
+    default_code = 'InvalidNearbyTheaterQuery'
+
+
+class InvalidAutocompleteQueryException(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = 'k는 1 ~ 20 사이의 정수여야 합니다.'
+    default_code = 'InvalidAutocompleteQuery'
+
+
+class SeatEventStreamLimitException(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '좌석 변경 스트림 연결이 너무 많습니다. 잠시 후 다시 시도해주세요.'
+    default_code = 'SeatEventStreamLimit'
@@ -0,0 +1,74 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    # keyset(seek) pagination - 마지막 row의 key 값보다 큰 row부터 조회 (OFFSET 없음)
+    # (key1, key2, ...) > (%s, %s, ...) row 비교 조건이라 keys 순서의 복합 인덱스를 그대로 탐색하므로 깊은 페이지도 첫 페이지와 비용이 같음
+    # keys의 마지막 필드는 unique 해야 함 (ex. id), descending이면 모든 key 내림차순 (row 비교도 <)
+    keys = ('id',)
+    descending = False
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = '유효하지 않은 cursor입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        model = queryset.model
+        fields = [model._meta.get_field(key) for key in self.keys]
+
+        cursor = self.decode_cursor(request, fields)
+        if cursor is not None:
+            quote_name = connection.ops.quote_name
+            columns = ', '.join(f'{quote_name(model._meta.db_table)}.{quote_name(field.column)}' for field in fields)
+            placeholders = ', '.join(['%s'] * len(fields))
+            operator = '<' if self.descending else '>'
+            queryset = queryset.extra(where=[f'({columns}) {operator} ({placeholders})'], params=cursor)
+
+        # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+        ordering = [f'-{key}' for key in self.keys] if self.descending else self.keys
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_cursor = self.encode_cursor(rows[-1]) if self.has_next else None
+        return rows
+
+    def decode_cursor(self, request, fields):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(urlsafe_b64decode(encoded.encode()).decode())
+            if len(values) != len(fields):
+                raise ValueError
+            return [field.to_python(value) for field, value in zip(fields, values)]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, row):
+        values = [str(getattr(row, key)) for key in self.keys]
+        return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def get_next_link(self, url=None):
+        # url: 다음 페이지를 다른 endpoint에서 조회하는 경우 (ex. 상세 정보에 포함된 첫 페이지)
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            url or self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor
+        )
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
@@ -0,0 +1,83 @@
+from functools import lru_cache
+
+from .business_data import PRICE_BY_SCREEN_TYPE_CHART, PRICE_DISCOUNT_RATE_CHART, PRICE_DISCOUNT_RULES
+
+# 좌석 가격 계산 - (screen_type, grade) 가격표를 import 시 1번 계산
+# 할인 규칙은 상영 요일/시간대에 따라 달라지므로 (screen_type, grade, 요일, 시각)별로 계산 결과를 보관
+
+GRADES = ('adult', 'teen', 'preferential')
+
+
+def round_price(price):
+    return int(round(price))
+
+
+class DiscountRule:
+    # 조건(요일, 시작 시각 [from, to), screen_type, grade)에 맞는 좌석에 비율(rate) 또는 금액(amount) 할인
+    def __init__(self, name, rate=0, amount=0, weekdays=None, hours=None, screen_types=None, grades=None):
+        self.name = name
+        self.rate = rate
+        self.amount = amount
+        self.weekdays = None if weekdays is None else frozenset(weekdays)
+        self.hours = hours
+        self.screen_types = None if screen_types is None else frozenset(screen_types)
+        self.grades = None if grades is None else frozenset(grades)
+
+    def applies(self, screen_type, grade, weekday, hour):
+        return (
+            (self.weekdays is None or weekday in self.weekdays)
+            and (self.hours is None or self.hours[0] <= hour < self.hours[1])
+            and (self.screen_types is None or screen_type in self.screen_types)
+            and (self.grades is None or grade in self.grades)
+        )
+
+    def apply(self, price):
+        return max(0, round_price(price * (1 - self.rate)) - self.amount)
+
+
+class PricingEngine:
+    def __init__(self, screen_prices, grade_rates, rules=()):
+        self.screen_prices = screen_prices
+        self.grade_rates = grade_rates
+        self.rules = tuple(rules)
+        self.table = {
+            (screen_type, grade): round_price(screen_price * grade_rates[grade])
+            for screen_type, screen_price in screen_prices.items()
+            for grade in grade_rates
+        }
+        self.scheduled_price = lru_cache(maxsize=4096)(self.scheduled_price)
+
+    def base_price(self, screen_type, grade):
+        price = self.table.get((screen_type, grade))
+        if price is None:
+            screen_type = screen_type if screen_type in self.screen_prices else 'default'
+            grade = grade if grade in self.grade_rates else 'default'
+            price = self.table[(screen_type, grade)]
+        return price
+
+    def scheduled_price(self, screen_type, grade, weekday, hour):
+        price = self.base_price(screen_type, grade)
+        for rule in self.rules:
+            if rule.applies(screen_type, grade, weekday, hour):
+                price = rule.apply(price)
+        return price
+
+    def price(self, screen_type, grade, start_time=None):
+        # start_time이 없으면 할인 규칙 없이 가격표 그대로
+        if start_time is None or not self.rules:
+            return self.base_price(screen_type, grade)
+        return self.scheduled_price(screen_type, grade, start_time.weekday(), start_time.hour)
+
+    def prices(self, screen_type, start_time=None):
+        return {grade: self.price(screen_type, grade, start_time) for grade in GRADES}
+
+    def total(self, screen_type, grade_counts, start_time=None):
+        # grade_counts: {grade: 좌석 수}
+        return sum(self.price(screen_type, grade, start_time) * count for grade, count in grade_counts.items())
+
+
+PRICING = PricingEngine(
+    PRICE_BY_SCREEN_TYPE_CHART,
+    PRICE_DISCOUNT_RATE_CHART,
+    [DiscountRule(**rule) for rule in PRICE_DISCOUNT_RULES],
+)
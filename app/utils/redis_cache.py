@@ -0,0 +1,109 @@
+import pickle
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+
+class RedisCache(BaseCache):
+    # 별도 패키지(django-redis) 없이 redis-py로 구현한 Django cache backend
+    # 여러 gunicorn worker / celery worker가 같은 캐시와 버전 키를 공유해야 하므로 사용
+    # 정수 값은 INCR가 가능하도록 pickle 하지 않고 그대로 저장
+    # 존재 확인과 INCR를 Lua script 1회로 실행 - 사이에 key가 만료되면 INCR가 1부터 다시 만들어 버전이 되돌아감
+    INCR_SCRIPT = '''
+        if redis.call('EXISTS', KEYS[1]) == 0 then
+            return false
+        end
+        return redis.call('INCRBY', KEYS[1], ARGV[1])
+    '''
+
+    def __init__(self, server, params):
+        import redis
+
+        super().__init__(params)
+        self.client = redis.Redis.from_url(server)
+        self.incr_script = self.client.register_script(self.INCR_SCRIPT)
+
+    def encode(self, value):
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, value):
+        try:
+            return int(value)
+        except ValueError:
+            return pickle.loads(value)
+
+    def get_ttl(self, timeout):
+        # redis는 ms 단위 만료 / None = 만료 없음
+        if timeout == DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            return None
+        return max(int(timeout * 1000), 1)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        return bool(self.client.set(key, self.encode(value), px=self.get_ttl(timeout), nx=True))
+
+    def get(self, key, default=None, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        value = self.client.get(key)
+        return default if value is None else self.decode(value)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        self.client.set(key, self.encode(value), px=self.get_ttl(timeout))
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_key(key, version=version)
+        timeout = self.get_ttl(timeout)
+        if timeout is None:
+            return bool(self.client.persist(key))
+        return bool(self.client.pexpire(key, timeout))
+
+    def delete(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        self.client.delete(key)
+
+    def get_many(self, keys, version=None):
+        if not keys:
+            return {}
+        made_keys = {self.make_key(key, version=version): key for key in keys}
+        values = self.client.mget(list(made_keys))
+        return {
+            made_keys[made_key]: self.decode(value)
+            for made_key, value in zip(made_keys, values)
+            if value is not None
+        }
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self.get_ttl(timeout)
+        pipeline = self.client.pipeline()
+        for key, value in data.items():
+            pipeline.set(self.make_key(key, version=version), self.encode(value), px=timeout)
+        pipeline.execute()
+        return []
+
+    def delete_many(self, keys, version=None):
+        if keys:
+            self.client.delete(*[self.make_key(key, version=version) for key in keys])
+
+    def has_key(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        return bool(self.client.exists(key))
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        value = self.incr_script(keys=[key], args=[delta])
+        if value is None:
+            raise ValueError(f"Key '{key}' not found")
+        return value
+
+    def clear(self):
+        self.client.flushdb()